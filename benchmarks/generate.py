@@ -0,0 +1,197 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Generators for synthetic, but realistically shaped, ubuntu-lint inputs.
+"""
+
+import io
+import os
+import random
+import tarfile
+
+from email.utils import formatdate
+
+MAINTAINER = "John Doe <john.doe@example.com>"
+UBUNTU_MAINTAINER = "Ubuntu Developers <ubuntu-devel-discuss@lists.ubuntu.com>"
+
+
+def _entry(package: str, version: str, dist: str, n: int, bugs: list[int]) -> str:
+    changes = "".join(f"  * Change number {n}.{i}\n" for i in range(3))
+    if bugs:
+        refs = ", ".join(f"#{b}" for b in bugs)
+        changes += f"  * Fix reported issues (LP: {refs})\n"
+
+    date = formatdate(1700000000 - n * 86400)
+    return (
+        f"{package} ({version}) {dist}; urgency=medium\n\n"
+        f"{changes}\n"
+        f" -- {MAINTAINER}  {date}\n\n"
+    )
+
+
+def long_changelog_versions(entries: int) -> list[tuple[str, str]]:
+    """
+    Return (version, distribution) pairs, newest first, alternating between
+    Debian uploads and Ubuntu deltas like a long lived package. The newest
+    entry is always an Ubuntu upload.
+    """
+    versions: list[tuple[str, str]] = []
+    for i in range(entries, 0, -1):
+        upstream = f"{i // 100 + 1}.{i % 100}"
+        if i % 3 == 0 or i == entries:
+            versions.append((f"{upstream}-1ubuntu1", "resolute"))
+        else:
+            versions.append((f"{upstream}-1", "unstable"))
+
+    return versions
+
+
+def merge_changelog_versions(debian_entries: int) -> list[tuple[str, str]]:
+    """
+    Return (version, distribution) pairs, newest first, for a merge of
+    debian_entries new Debian uploads on top of a previous Ubuntu delta.
+    """
+    versions = [(f"{debian_entries + 1}.0-1ubuntu1", "resolute")]
+    versions.extend((f"{i}.0-1", "unstable") for i in range(debian_entries, 0, -1))
+    versions.append(("0.9-1ubuntu1", "resolute"))
+
+    return versions
+
+
+def changelog(
+    package: str,
+    versions: list[tuple[str, str]],
+    bugs: list[int] | None = None,
+) -> str:
+    """
+    Generate a debian/changelog with an entry for each (version, distribution)
+    pair. The bugs are referenced by the first entry.
+    """
+    out = io.StringIO()
+    for n, (version, dist) in enumerate(versions):
+        out.write(_entry(package, version, dist, n, (bugs or []) if n == 0 else []))
+
+    return out.getvalue()
+
+
+def changes(
+    package: str,
+    version: str,
+    dist: str,
+    changelog_text: str,
+    entries: int = 1,
+    bugs: list[int] | None = None,
+    vcs_git: str | None = None,
+    vcs_git_commit: str | None = None,
+) -> str:
+    """
+    Generate a source changes file whose Changes field contains the first
+    entries of changelog_text, like a package built with -v<version>.
+    """
+    blocks = changelog_text.split("\n\n -- ")[:entries]
+    lines: list[str] = []
+    for i, block in enumerate(blocks):
+        if i > 0:
+            # Drop the trailer of the previous entry.
+            block = block.partition("\n\n")[2]
+            lines.append(" .")
+        for line in block.strip("\n").splitlines():
+            lines.append(f" {line}" if line else " .")
+
+    fields = [
+        "Format: 1.8",
+        f"Date: {formatdate(1700000000)}",
+        f"Source: {package}",
+        "Architecture: source",
+        f"Version: {version}",
+        f"Distribution: {dist}",
+        "Urgency: medium",
+        f"Maintainer: {UBUNTU_MAINTAINER}",
+        f"Changed-By: {MAINTAINER}",
+    ]
+    if bugs:
+        fields.append("Launchpad-Bugs-Fixed: " + " ".join(str(b) for b in bugs))
+    fields.append("Changes:")
+    fields.extend(lines)
+    fields.append("Files:")
+    fields.append(f" 00000000000000000000000000000000 1 devel optional {package}.dsc")
+    if vcs_git:
+        fields.append(f"Vcs-Git: {vcs_git}")
+        fields.append(f"Vcs-Git-Commit: {vcs_git_commit}")
+        fields.append("Vcs-Git-Ref: refs/heads/ubuntu/devel")
+
+    return "\n".join(fields) + "\n"
+
+
+def native_tarball(
+    path: str,
+    package: str,
+    version: str,
+    changelog_text: str,
+    size: int,
+    files: int = 2000,
+    compression: str = "xz",
+    seed: int = 0,
+):
+    """
+    Write a native source package tarball of roughly size bytes (before
+    compression), spread over the given number of files. The debian directory
+    is added last, as is common for tarballs built from a source tree.
+    """
+    rng = random.Random(seed)
+    top = f"{package}-{version}"
+
+    def add(tar: tarfile.TarFile, name: str, data: bytes):
+        info = tarfile.TarInfo(f"{top}/{name}")
+        info.size = len(data)
+        info.mtime = 1700000000
+        tar.addfile(info, io.BytesIO(data))
+
+    def adddir(tar: tarfile.TarFile, name: str):
+        info = tarfile.TarInfo(f"{top}/{name}".rstrip("/"))
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        info.mtime = 1700000000
+        tar.addfile(info)
+
+    # Source-like content: compressible text with some randomness.
+    words = [f"symbol_{i}" for i in range(512)]
+    per_file = max(size // files, 1)
+
+    with tarfile.open(path, f"w:{compression}") as tar:  # type: ignore[call-overload]
+        adddir(tar, "")
+        adddir(tar, "src")
+        for i in range(files):
+            text = " ".join(rng.choice(words) for _ in range(per_file // 9))
+            add(tar, f"src/file{i}.c", text.encode()[:per_file])
+
+        adddir(tar, "debian")
+        add(tar, "debian/changelog", changelog_text.encode())
+        add(tar, "debian/control", f"Source: {package}\n".encode())
+
+
+def madison(package: str, versions_by_series: dict[str, str]) -> str:
+    """Generate madison.cgi text output for the given versions."""
+    return "".join(
+        f"{package} | {version} | {series} | source\n"
+        for series, version in versions_by_series.items()
+    )
+
+
+def sru_bug_description(n: int, complete: bool = True) -> str:
+    description = f"Bug {n} crashes on startup.\n\n[ Impact ]\n\nIt crashes.\n\n"
+    if complete:
+        description += (
+            "[ Test Plan ]\n\nRun it.\n\n"
+            "[ Where problems could occur ]\n\nStartup.\n\n"
+        )
+
+    # Real SRU bugs often have long descriptions with logs attached inline.
+    return description + "Log:\n" + "line of log output\n" * 200
+
+
+def write(path: str, text: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
@@ -0,0 +1,440 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmarks for ubuntu-lint.
+
+Each scenario builds a Context from synthetic input, and runs a set of linters
+against it. Network linters are pointed at local stand-ins for Launchpad,
+madison and git web, which add a configurable latency to every request. The
+time and peak memory of loading the context and of each linter are reported,
+and can be saved as JSON to compare between commits:
+
+    python3 -m benchmarks.run --output before.json
+    git checkout my-branch
+    python3 -m benchmarks.run --output after.json --compare before.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import ubuntu_lint
+import ubuntu_lint.linters
+
+from benchmarks import generate
+from benchmarks.standins import (
+    FakeBug,
+    FakeLaunchpad,
+    FakePublication,
+    RemoteStandIn,
+)
+from typing import Any
+from ubuntu_lint.cli import all_linters_by_name
+
+PACKAGE = "hello"
+
+OFFLINE_CHANGELOG_LINTERS = [
+    "distribution-invalid",
+    "missing-bug-references",
+    "missing-version-suffix",
+    "release-mismatch",
+]
+
+MERGE_LINTERS = [
+    "merge-missing-new-debian-changelog",
+    "missing-pending-changelog-entry",
+    "missing-ubuntu-maintainer",
+    "missing-version-suffix",
+]
+
+SRU_LINTERS = [
+    "git-ubuntu-references-mismatch",
+    "missing-launchpad-bugs-fixed",
+    "missing-pending-changelog-entry",
+    "sru-bug-missing-release-tasks",
+    "sru-bug-missing-template",
+    "sru-version-string-breaks-upgrades",
+    "sru-version-string-convention",
+]
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        linters: list[str],
+        **context: Any,
+    ):
+        self.name = name
+        self.linters = linters
+
+        # Keyword arguments for the Context of each run.
+        self.context = context
+
+
+def scenarios(
+    workdir: str,
+    remote: RemoteStandIn,
+    latency: float,
+    quick: bool,
+) -> list[Scenario]:
+    ret: list[Scenario] = []
+
+    # Long changelogs, parsed from a file.
+    for entries in (100, 1000) if quick else (1000, 10000, 50000):
+        path = os.path.join(workdir, f"changelog-{entries}/changelog")
+        generate.write(
+            path,
+            generate.changelog(
+                PACKAGE, generate.long_changelog_versions(entries), bugs=[1]
+            ),
+        )
+
+        ret.append(
+            Scenario(
+                f"changelog-{entries}",
+                OFFLINE_CHANGELOG_LINTERS,
+                debian_changelog=path,
+            )
+        )
+
+    # Merges built with -v, i.e. a Changes field with many entries.
+    for entries in (10, 100) if quick else (100, 1000, 5000):
+        text = generate.changelog(
+            PACKAGE, generate.merge_changelog_versions(entries), bugs=[1]
+        )
+        changelog_path = os.path.join(workdir, f"merge-{entries}/changelog")
+        generate.write(changelog_path, text)
+
+        version = f"{entries + 1}.0-1ubuntu1"
+        changes_path = os.path.join(workdir, f"merge-{entries}/changes")
+        generate.write(
+            changes_path,
+            generate.changes(
+                PACKAGE, version, "resolute", text, entries=entries + 1, bugs=[1]
+            ),
+        )
+
+        lp = FakeLaunchpad(
+            latency,
+            published=[
+                FakePublication(f"{entries}.0-1", "Proposed"),
+                FakePublication("0.9-1ubuntu1", "Release"),
+            ],
+        )
+
+        ret.append(
+            Scenario(
+                f"merge-{entries}",
+                MERGE_LINTERS,
+                changes=changes_path,
+                debian_changelog=changelog_path,
+                launchpad_handle=lp,
+            )
+        )
+
+    # Native packages, where the changelog is extracted from the tarball.
+    size = 4 * 1024 * 1024 if quick else 64 * 1024 * 1024
+    text = generate.changelog(PACKAGE, generate.long_changelog_versions(100), bugs=[1])
+    for compression in ("xz", "gz", "bz2"):
+        path = os.path.join(workdir, f"{PACKAGE}_2.0.tar.{compression}")
+        generate.native_tarball(
+            path,
+            PACKAGE,
+            "2.0",
+            text,
+            size=size,
+            files=500 if quick else 5000,
+            compression=compression,
+        )
+
+        ret.append(
+            Scenario(
+                f"tarball-{compression}",
+                OFFLINE_CHANGELOG_LINTERS,
+                debian_tar=path,
+            )
+        )
+
+    # SRUs fixing many bugs, against the remote stand-ins.
+    version = "2.10-3ubuntu0.1"
+    remote.madison[PACKAGE] = generate.madison(
+        PACKAGE,
+        {
+            "jammy": "2.10-2ubuntu4",
+            "noble": "2.10-3",
+            "questing": "2.10-5",
+            "resolute": "2.10-5build1",
+        },
+    )
+    commit = "6e591bb3a2bbc44dcb6f49499dc7dbee400ce5b9"
+    remote.git_commits[PACKAGE] = commit
+
+    for num_bugs in (1, 10) if quick else (1, 10, 50):
+        bugs = list(range(1000000, 1000000 + num_bugs))
+        text = generate.changelog(
+            PACKAGE, [(version, "noble"), ("2.10-3", "unstable")], bugs=bugs
+        )
+        changes_path = os.path.join(workdir, f"sru-{num_bugs}/changes")
+        generate.write(
+            changes_path,
+            generate.changes(
+                PACKAGE,
+                version,
+                "noble",
+                text,
+                bugs=bugs,
+                vcs_git=f"{remote.url}/git/{PACKAGE}",
+                vcs_git_commit=commit,
+            ),
+        )
+        changelog_path = os.path.join(workdir, f"sru-{num_bugs}/changelog")
+        generate.write(changelog_path, text)
+
+        lp = FakeLaunchpad(
+            latency,
+            bugs={
+                str(n): FakeBug(
+                    generate.sru_bug_description(n),
+                    [
+                        f"https://api.launchpad.net/devel/ubuntu/+source/{PACKAGE}/+bug/{n}",
+                        f"https://api.launchpad.net/devel/ubuntu/noble/+source/{PACKAGE}/+bug/{n}",
+                    ],
+                )
+                for n in bugs
+            },
+            published=[FakePublication("2.10-3", "Release")],
+        )
+
+        ret.append(
+            Scenario(
+                f"sru-{num_bugs}-bugs",
+                SRU_LINTERS,
+                changes=changes_path,
+                debian_changelog=changelog_path,
+                launchpad_handle=lp,
+            )
+        )
+
+    return ret
+
+
+def run_once(scenario: Scenario, trace_memory: bool) -> dict[str, Any]:
+    """
+    Run a scenario once. If trace_memory is True, the peak memory allocated
+    while loading the context and while running each linter is measured
+    with tracemalloc, which slows everything down, so times from such a run
+    should not be used.
+    """
+    result: dict[str, Any] = {"phases": {}, "linters": {}}
+
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    context = ubuntu_lint.Context(**scenario.context)
+    result["phases"]["total"] = {"time": time.perf_counter() - start}
+
+    for phase, elapsed in context.stats.phases.items():
+        result["phases"][phase] = {"time": elapsed}
+
+    if trace_memory:
+        result["phases"]["total"]["peak_memory"] = tracemalloc.get_traced_memory()[1]
+
+    for name in scenario.linters:
+        linter = all_linters_by_name[name]
+
+        if trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+
+        lint_result = ubuntu_lint.LintResult.OK
+        reason = ""
+        with context.stats.linter(name) as stats:
+            try:
+                linter.fn(context)
+            except ubuntu_lint.LintException as e:
+                lint_result = e.result
+                reason = str(e)
+            except ubuntu_lint.MissingContextException as e:
+                lint_result = ubuntu_lint.LintResult.SKIP
+                reason = str(e)
+
+        result["linters"][name] = {
+            "result": lint_result.name,
+            "reason": reason,
+            "time": stats.wall_time,
+            "network_time": stats.network_time,
+            "requests": stats.num_requests,
+        }
+
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            result["linters"][name]["peak_memory"] = peak
+
+    if trace_memory:
+        tracemalloc.stop()
+
+    return result
+
+
+def run_scenario(scenario: Scenario, repeat: int) -> dict[str, Any]:
+    """
+    Run a scenario repeat times, and report the median time of each phase and
+    linter, along with its peak memory from a separate traced run.
+    """
+    runs = [run_once(scenario, trace_memory=False) for _ in range(repeat)]
+    traced = run_once(scenario, trace_memory=True)
+
+    result = runs[0]
+    for section in ("phases", "linters"):
+        for name, values in result[section].items():
+            values["time"] = statistics.median(r[section][name]["time"] for r in runs)
+            if "network_time" in values:
+                values["network_time"] = statistics.median(
+                    r[section][name]["network_time"] for r in runs
+                )
+            if "peak_memory" in traced[section][name]:
+                values["peak_memory"] = traced[section][name]["peak_memory"]
+
+    return result
+
+
+def git_revision() -> str:
+    try:
+        r = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return r.stdout.decode().strip()
+    except OSError:
+        return ""
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}"
+        size //= 1024
+
+    return f"{size:.0f}GiB"
+
+
+def print_results(results: dict[str, Any], baseline: dict[str, Any] | None):
+    width = max(
+        len(name)
+        for scenario in results["scenarios"].values()
+        for section in ("phases", "linters")
+        for name in scenario[section]
+    )
+
+    for scenario_name, scenario in results["scenarios"].items():
+        print(f"\n{scenario_name}:")
+        for section in ("phases", "linters"):
+            for name, values in scenario[section].items():
+                memory = values.get("peak_memory")
+                line = (
+                    f"    {name:<{width}}  {values['time']:>9.4f}s  "
+                    f"{format_size(memory) if memory is not None else '':>8}"
+                )
+
+                if "requests" in values:
+                    line += f"  {values['requests']:>4} requests"
+
+                try:
+                    old = baseline["scenarios"][scenario_name][section][name]  # type: ignore[index]
+                    if old["time"] > 0:
+                        line += f"  ({values['time'] / old['time']:.2f}x time"
+                    if memory and old.get("peak_memory"):
+                        line += f", {memory / old['peak_memory']:.2f}x memory"
+                    line += f" vs {baseline['revision'] or 'baseline'})"  # type: ignore[index]
+                except (KeyError, TypeError):
+                    pass
+
+                print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.run",
+        description="Benchmark ubuntu-lint against synthetic inputs",
+    )
+    parser.add_argument(
+        "--quick",
+        help="Use smaller inputs, e.g. to check that the benchmarks work",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--latency",
+        help="Latency in seconds added to every remote request (default: 0.05)",
+        type=float,
+        default=0.05,
+    )
+    parser.add_argument(
+        "--repeat",
+        help="Number of timed runs of each scenario (default: 3)",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--scenario",
+        help="Only run scenarios matching this glob pattern",
+        type=str,
+        default="*",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the results as JSON to this file",
+        type=str,
+    )
+    parser.add_argument(
+        "--compare",
+        help="Compare the results to a JSON file written by a previous run",
+        type=str,
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    results: dict[str, Any] = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "latency": args.latency,
+        "quick": args.quick,
+        "scenarios": {},
+    }
+
+    with (
+        tempfile.TemporaryDirectory() as workdir,
+        RemoteStandIn(latency=args.latency) as remote,
+    ):
+        ubuntu_lint.linters.MADISON_URL = f"{remote.url}/madison.cgi"
+
+        for scenario in scenarios(workdir, remote, args.latency, args.quick):
+            if not fnmatch.fnmatch(scenario.name, args.scenario):
+                continue
+
+            print(f"Running {scenario.name}...", file=sys.stderr, flush=True)
+            results["scenarios"][scenario.name] = run_scenario(scenario, args.repeat)
+
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
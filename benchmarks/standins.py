@@ -0,0 +1,181 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Local stand-ins for the remote services used by the network linters, with
+configurable latency.
+"""
+
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from lazr.restfulclient.errors import NotFound
+from urllib.parse import parse_qs, urlparse
+
+
+class RemoteStandIn:
+    """
+    An HTTP server on localhost serving madison.cgi output and git web patches.
+    Every response is delayed by latency seconds.
+
+    madison is served at /madison.cgi?package=<package>, and the git web patch
+    for <repo> at /git/<repo>/patch/?h=<ref>.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.madison: dict[str, str] = {}
+        self.git_commits: dict[str, str] = {}
+        self.requests: int = 0
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                standin.requests += 1
+                time.sleep(standin.latency)
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+
+                body: str | None = None
+                if url.path == "/madison.cgi":
+                    body = standin.madison.get(query.get("package", [""])[0])
+                elif url.path.startswith("/git/") and url.path.endswith("/patch/"):
+                    repo = url.path.removeprefix("/git/").removesuffix("/patch/")
+                    if commit := standin.git_commits.get(repo):
+                        body = f"From {commit} Mon Sep 17 00:00:00 2001\n"
+
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                data = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "RemoteStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _Delayed:
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    def _wait(self):
+        time.sleep(self._latency)
+
+
+class FakeBug:
+    def __init__(self, description: str, bug_tasks: list[str]):
+        self.description = description
+        self.bug_tasks = bug_tasks
+
+
+class FakeBugs(_Delayed):
+    def __init__(self, latency: float, bugs: dict[str, FakeBug]):
+        super().__init__(latency)
+        self._bugs = bugs
+
+    def __getitem__(self, n: str) -> FakeBug:
+        self._wait()
+        return self._bugs[str(n)]
+
+
+class FakePublication:
+    def __init__(self, version: str, pocket: str, status: str = "Published"):
+        self.source_package_version = version
+        self.pocket = pocket
+        self.status = status
+
+
+class FakeSeries:
+    def __init__(self, url: str):
+        self._url = url
+
+    def __str__(self) -> str:
+        return self._url
+
+
+class FakeArchive(_Delayed):
+    def __init__(self, latency: float, published: list[FakePublication]):
+        super().__init__(latency)
+        self._published = published
+
+    def getPublishedSources(self, **kwargs) -> list[FakePublication]:
+        self._wait()
+        return self._published
+
+
+class FakeDistribution(_Delayed):
+    def __init__(self, latency: float, published: list[FakePublication]):
+        super().__init__(latency)
+        self.main_archive = FakeArchive(latency, published)
+
+    def getSeries(self, name_or_version: str) -> FakeSeries:
+        self._wait()
+        return FakeSeries(f"https://api.launchpad.net/devel/ubuntu/{name_or_version}")
+
+
+class FakeDistributions(_Delayed):
+    def __init__(self, latency: float, published: list[FakePublication]):
+        super().__init__(latency)
+        self._ubuntu = FakeDistribution(latency, published)
+
+    def __getitem__(self, name: str) -> FakeDistribution:
+        self._wait()
+        return self._ubuntu
+
+
+class FakeResponse(dict):
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "Not Found"
+
+
+class FakeLaunchpad:
+    """
+    An in-process stand-in for a launchpadlib handle, implementing the subset
+    of the API used by the linters. Every lookup is delayed by latency seconds.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bugs: dict[str, FakeBug] | None = None,
+        published: list[FakePublication] | None = None,
+    ):
+        self.bugs = FakeBugs(latency, bugs or {})
+        self.distributions = FakeDistributions(latency, published or [])
+        self._latency = latency
+        self._bug_tasks = {
+            url for bug in (bugs or {}).values() for url in bug.bug_tasks
+        }
+
+    def load(self, url: str) -> str:
+        time.sleep(self._latency)
+        if url not in self._bug_tasks:
+            raise NotFound(FakeResponse(404), b"")
+
+        return url
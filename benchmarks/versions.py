@@ -0,0 +1,117 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Compare version ordering with precomputed sort keys (ubuntu_lint.versions)
+against pairwise debian_support.version_compare, on madison sized inputs:
+
+    python3 -m benchmarks.versions
+"""
+
+import argparse
+import functools
+import random
+import time
+
+from debian import debian_support
+from ubuntu_lint import versions
+
+SERIES = ["bionic", "focal", "jammy", "noble", "plucky", "questing", "resolute"]
+POCKETS = ["", "-security", "-updates", "-proposed"]
+
+
+def madison_versions(packages: int, seed: int = 0) -> list[list[tuple[str, str]]]:
+    """
+    Return the (series, version) pairs of madison output for each package,
+    with a version in each pocket of each series like a long lived package.
+    """
+    rng = random.Random(seed)
+    ret = []
+
+    for _ in range(packages):
+        upstream = f"{rng.randint(0, 3)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+        debian = rng.randint(1, 9)
+        entries = []
+        for i, series in enumerate(SERIES):
+            base = f"{upstream}-{debian + i}"
+            for _ in POCKETS:
+                version = rng.choice(
+                    [
+                        base,
+                        f"{base}build1",
+                        f"{base}ubuntu{rng.randint(1, 3)}",
+                        f"{base}ubuntu0.{SERIES.index(series) + 18}.04.{rng.randint(1, 4)}",
+                    ]
+                )
+                entries.append((series, version))
+        ret.append(entries)
+
+    return ret
+
+
+def pairwise_max_by_series(entries: list[tuple[str, str]]) -> dict[str, str]:
+    ret: dict[str, str] = {}
+    for series, version in entries:
+        try:
+            if debian_support.version_compare(version, ret[series]) > 0:
+                ret[series] = version
+        except KeyError:
+            ret[series] = version
+
+    return ret
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.versions",
+        description="Benchmark Debian version ordering",
+    )
+    parser.add_argument(
+        "--packages",
+        help="Number of packages (default: 2000)",
+        type=int,
+        default=2000,
+    )
+    args = parser.parse_args()
+
+    data = madison_versions(args.packages)
+    flat = [version for entries in data for _, version in entries]
+
+    def pairwise_max_all():
+        for entries in data:
+            pairwise_max_by_series(entries)
+
+    def keyed_max_all():
+        for entries in data:
+            versions.max_version_by_series(entries)
+
+    def pairwise_sort():
+        sorted(flat, key=functools.cmp_to_key(debian_support.version_compare))
+
+    def keyed_sort():
+        versions.sort_versions(flat)
+
+    print(f"{args.packages} packages, {len(flat)} versions")
+    for name, pairwise, keyed in [
+        ("max per series", pairwise_max_all, keyed_max_all),
+        ("sort", pairwise_sort, keyed_sort),
+    ]:
+        versions.version_key.cache_clear()
+        old = timed(pairwise)
+        cold = timed(keyed)
+        warm = timed(keyed)
+        print(
+            f"    {name:<16}  version_compare {old:>8.4f}s  "
+            f"keys (cold) {cold:>8.4f}s ({old / cold:.1f}x)  "
+            f"keys (warm) {warm:>8.4f}s ({old / warm:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -138,6 +138,197 @@ def test_exec_cli_expect_fail(name: str, changes: str, changelog: str):
     out = json.loads(r.stdout.decode())
 
     assert out[name]["result"] == "FAIL"
+    assert "FAIL" in [f["result"] for f in out[name]["findings"]]
+
+
+def test_exec_cli_jobs():
+    outputs = []
+    for jobs in (1, 4):
+        cmd = [
+            get_ubuntu_lint_bin(),
+            f"--jobs={jobs}",
+            "--all=off",
+            "--distribution-invalid=fail",
+            "--missing-bug-references=fail",
+            "--missing-version-suffix=fail",
+            "--release-mismatch=fail",
+            f"--changes-file={get_cli_testdata_dir()}/baseline/changes",
+            f"--changelog={get_cli_testdata_dir()}/baseline/changelog",
+        ]
+
+        r = subprocess.run(cmd, capture_output=True)
+        assert r.returncode == 0
+        outputs.append(r.stdout)
+
+    # The results are reported in the same order, whether run concurrently or not.
+    assert outputs[0] == outputs[1]
+
+
+def test_exec_cli_json_lines():
+    cmd = [
+        get_ubuntu_lint_bin(),
+        "--json-lines",
+        "--jobs=2",
+        "--all=off",
+        "--missing-bug-references=fail",
+        "--missing-version-suffix=fail",
+        "--release-mismatch=fail",
+        f"--changes-file={get_cli_testdata_dir()}/missing-version-suffix/changes",
+        f"--changelog={get_cli_testdata_dir()}/missing-version-suffix/changelog",
+    ]
+
+    r = subprocess.run(cmd, capture_output=True)
+    assert r.returncode == 1
+
+    lines = [json.loads(line) for line in r.stdout.decode().splitlines()]
+    assert [line["type"] for line in lines] == ["linter"] * 3 + ["summary"]
+
+    results = {line["linter"]: line for line in lines[:-1]}
+    assert set(results) == {
+        "missing-bug-references",
+        "missing-version-suffix",
+        "release-mismatch",
+    }
+    assert results["missing-version-suffix"]["result"] == "FAIL"
+    assert results["missing-version-suffix"]["findings"]
+    assert "wall_time" in results["release-mismatch"]["stats"]
+
+    assert lines[-1]["status"] == 1
+    assert lines[-1]["results"]["FAIL"] == 1
+    assert lines[-1]["results"]["OK"] == 2
+
+
+def test_exec_cli_offline_latency_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        latency_file = os.path.join(tmpdir, "latencies.json")
+        with open(latency_file, "w") as f:
+            json.dump({"format": 1, "latencies": {"distribution-invalid": 5.0}}, f)
+
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "--json-lines",
+            "--offline",
+            f"--latency-file={latency_file}",
+            "--all=warn",
+            f"--changes-file={get_cli_testdata_dir()}/baseline/changes",
+            f"--changelog={get_cli_testdata_dir()}/baseline/changelog",
+        ]
+
+        r = subprocess.run(cmd, capture_output=True)
+        assert r.returncode == 0
+
+        lines = [json.loads(line) for line in r.stdout.decode().splitlines()]
+        linters = [line["linter"] for line in lines[:-1]]
+
+        # Network lint checks do not run offline, and the lint check which was
+        # slow in previous runs runs last.
+        assert "git-ubuntu-references-mismatch" not in linters
+        assert "missing-pending-changelog-entry" not in linters
+        assert linters[-1] == "distribution-invalid"
+
+        with open(latency_file) as f:
+            latencies = json.load(f)["latencies"]
+
+        assert set(latencies) <= set(linters)
+        assert latencies["distribution-invalid"] < 5.0
+
+
+def test_exec_cli_timings():
+    cmd = [
+        get_ubuntu_lint_bin(),
+        "--json",
+        "--timings",
+        "--all=off",
+        "--distribution-invalid=fail",
+        f"--changes-file={get_cli_testdata_dir()}/baseline/changes",
+        f"--changelog={get_cli_testdata_dir()}/baseline/changelog",
+    ]
+
+    r = subprocess.run(cmd, capture_output=True)
+    assert r.returncode == 0
+
+    # The timings are kept apart from the results, keyed by linter name.
+    out = json.loads(r.stdout.decode())
+    assert list(out) == ["results", "timings"]
+    assert out["results"]["distribution-invalid"]["stats"]["requests"] == {}
+    assert out["results"]["distribution-invalid"]["stats"]["wall_time"] >= 0
+    assert {"context", "changes-parse", "changelog-parse"} <= set(
+        out["timings"]["phases"]
+    )
+
+
+def test_exec_cli_profile():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "--json",
+            f"--profile={tmpdir}",
+            "--all=off",
+            "--distribution-invalid=fail",
+            f"--changelog={get_cli_testdata_dir()}/baseline/changelog",
+        ]
+
+        r = subprocess.run(cmd, capture_output=True)
+        assert r.returncode == 0
+
+        # The profile summary must not interfere with the JSON output.
+        out = json.loads(r.stdout.decode())
+        assert out["distribution-invalid"]["result"] == "OK"
+        assert "check_distribution_invalid" in r.stderr.decode()
+
+        assert sorted(os.listdir(tmpdir)) == [
+            "context.pstats",
+            "distribution-invalid.pstats",
+        ]
+
+
+def test_exec_cli_metrics_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metrics_file = os.path.join(tmpdir, "ubuntu-lint.prom")
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "--json",
+            f"--metrics-file={metrics_file}",
+            "--all=off",
+            "--distribution-invalid=fail",
+            f"--changelog={get_cli_testdata_dir()}/baseline/changelog",
+        ]
+
+        # Counters are carried over from one run to the next.
+        for _ in range(2):
+            r = subprocess.run(cmd, capture_output=True)
+            assert r.returncode == 0
+
+        with open(metrics_file, "r") as f:
+            metrics = f.read().splitlines()
+
+        assert "ubuntu_lint_runs_total 2" in metrics
+        assert (
+            'ubuntu_lint_linter_results_total{linter="distribution-invalid",result="OK"} 2'
+            in metrics
+        )
+        assert (
+            'ubuntu_lint_linter_duration_seconds_count{linter="distribution-invalid"} 2'
+            in metrics
+        )
+        assert (
+            'ubuntu_lint_linter_duration_seconds_bucket{linter="distribution-invalid",le="+Inf"} 2'
+            in metrics
+        )
+
+        # Concurrent runs all add up.
+        procs = [subprocess.Popen(cmd, stdout=subprocess.DEVNULL) for _ in range(4)]
+        assert all(p.wait() == 0 for p in procs)
+
+        r = subprocess.run(cmd + ["--metrics-format=openmetrics"], capture_output=True)
+        assert r.returncode == 0
+
+        with open(metrics_file, "r") as f:
+            metrics = f.read().splitlines()
+
+        assert "ubuntu_lint_runs_total 7" in metrics
+        assert "# TYPE ubuntu_lint_runs counter" in metrics
+        assert metrics[-1] == "# EOF"
 
 
 def run_dput_hook_with_tmpdir(name: str, changes: str) -> subprocess.CompletedProcess:
@@ -204,3 +395,140 @@ def test_dput_hook_expect_fail(name: str):
     out = r.stderr.decode()
     assert f"running {name}:" in out
     assert "ERROR:" in out
+
+
+def test_exec_cli_replay():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        recording = os.path.join(tmpdir, "recording.json")
+        with open(recording, "w") as f:
+            json.dump(
+                {
+                    "format": 1,
+                    "responses": [
+                        [
+                            '["lp-proposed-sources","hello","resolute"]',
+                            [["2.10-4ubuntu9", "Published"]],
+                            0.1,
+                        ]
+                    ],
+                },
+                f,
+            )
+
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "--json",
+            f"--replay={recording}",
+            "--all=off",
+            "--missing-pending-changelog-entry=fail",
+            f"--changes-file={get_cli_testdata_dir()}/baseline/changes",
+        ]
+
+        r = subprocess.run(cmd, capture_output=True)
+        assert r.returncode == 1
+
+        out = json.loads(r.stdout.decode())
+        assert out["missing-pending-changelog-entry"]["result"] == "FAIL"
+        assert "2.10-4ubuntu9" in out["missing-pending-changelog-entry"]["reason"]
+        assert out["missing-pending-changelog-entry"]["stats"]["requests"] == {
+            "launchpad": 1
+        }
+
+
+def test_exec_cli_sweep():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index = os.path.join(tmpdir, "Sources")
+        with open(index, "w") as f:
+            f.write(
+                "Package: hello\nVersion: 2.10-5ubuntu1\n\n"
+                "Package: hello-sync\nVersion: 2.10-5\n"
+            )
+
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "sweep",
+            "--json",
+            "--jobs=1",
+            "--distribution=resolute",
+            index,
+        ]
+
+        r = subprocess.run(cmd, capture_output=True)
+        assert r.returncode == 1
+
+        out = json.loads(r.stdout.decode())
+        assert out["packages"] == 2
+        assert out["results"]["distribution-invalid"] == {"OK": 2}
+        assert out["findings"] == [
+            {
+                "package": "hello-sync",
+                "version": "2.10-5",
+                "linter": "missing-version-suffix",
+                "result": "FAIL",
+                "reason": out["findings"][0]["reason"],
+            }
+        ]
+
+        # The distribution cannot be inferred from this path.
+        r = subprocess.run(cmd[:4] + [index], capture_output=True)
+        assert r.returncode == 2
+
+
+def test_exec_cli_serve():
+    testdata = get_cli_testdata_dir()
+    with open(os.path.join(testdata, "missing-version-suffix/changelog")) as f:
+        changelog = f.read()
+
+    jobs = [
+        {
+            "id": "baseline",
+            "changes_file": f"{testdata}/baseline/changes",
+            "changelog_file": f"{testdata}/baseline/changelog",
+            "levels": {"all": "off", "missing-version-suffix": "fail"},
+        },
+        {
+            "id": 2,
+            "changelog": changelog,
+            "levels": {"all": "off", "missing-version-suffix": "fail"},
+        },
+        {"id": "unknown", "levels": {"no-such-linter": "fail"}},
+    ]
+    stdin = "".join(json.dumps(job) + "\n" for job in jobs) + "not json\n"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metrics_file = os.path.join(tmpdir, "ubuntu-lint.prom")
+        cmd = [
+            get_ubuntu_lint_bin(),
+            "serve",
+            "--jobs=2",
+            "--backlog=0",
+            f"--metrics-file={metrics_file}",
+        ]
+
+        r = subprocess.run(cmd, input=stdin.encode(), capture_output=True)
+        assert r.returncode == 2
+
+        with open(metrics_file, "r") as f:
+            metrics = f.read().splitlines()
+
+    # Each job which was linted counts as one run.
+    assert "ubuntu_lint_runs_total 2" in metrics
+    assert (
+        'ubuntu_lint_linter_results_total{linter="missing-version-suffix",result="FAIL"} 1'
+        in metrics
+    )
+
+    lines = [json.loads(line) for line in r.stdout.decode().splitlines()]
+    results = {line["id"]: line for line in lines}
+    assert len(lines) == 4
+
+    assert results["baseline"]["status"] == 0
+    assert list(results["baseline"]["results"]) == ["missing-version-suffix"]
+    assert results["baseline"]["results"]["missing-version-suffix"]["result"] == "OK"
+
+    assert results[2]["status"] == 1
+    assert results[2]["results"]["missing-version-suffix"]["result"] == "FAIL"
+
+    assert results["unknown"]["status"] == 2
+    assert "no-such-linter" in results["unknown"]["error"]
+    assert results[None]["status"] == 2
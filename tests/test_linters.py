@@ -1,13 +1,28 @@
 # Copyright 2026 Canonical Ltd.
 # SPDX-License-Identifier: GPL-3.0-only
 
+import concurrent.futures
 import copy
+import gzip
+import io
+import os
 import pytest
+import random
 import ubuntu_lint
+import ubuntu_lint.sweep
+import ubuntu_lint.versions
 import re
 import textwrap
+import threading
+import time
 
-from debian import deb822, changelog
+from debian import deb822, changelog, debian_support
+from lazr.restfulclient.errors import NotFound
+from typing import Any
+from ubuntu_lint.cache import LaunchpadLinks
+from ubuntu_lint.madison import MadisonTable
+from ubuntu_lint.proposed import ProposedIndexes
+from ubuntu_lint.recording import Recording
 
 basic_changes_no_ubuntu_delta = deb822.Changes("""
 Format: 1.8
@@ -445,6 +460,61 @@ def test_check_sru_version_string_breaks_upgrades(requests_mock):
             )
 
 
+def test_findings(requests_mock):
+    requests_mock.get(
+        "https://people.canonical.com/~ubuntu-archive/madison.cgi?package=hello&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n"
+        "hello | 2.10-3build2  | plucky          | source\n"
+        "hello | 2.10-3build3  | questing        | source\n"
+        "hello | 2.10-5build1  | resolute        | source\n",
+    )
+    changes = copy.deepcopy(basic_changes_sru)
+    changes["Version"] = "2.10-4ubuntu0.1"
+
+    # Every series whose version is lower is reported, not just the first one.
+    with pytest.raises(ubuntu_lint.LintException) as e:
+        ubuntu_lint.check_sru_version_string_breaks_upgrades(
+            ubuntu_lint.Context(changes=changes)
+        )
+
+    assert e.value.result == ubuntu_lint.LintResult.FAIL
+    assert [f.reason for f in e.value.findings] == [
+        f"2.10-4ubuntu0.1 for noble is greater than {v}, which breaks the upgrade path"
+        for v in ("2.10-3build2 for plucky", "2.10-3build3 for questing")
+    ]
+
+    # Findings are raised along with an exception raised by lint_*.
+    context = ubuntu_lint.Context(changes=changes)
+    with pytest.raises(ubuntu_lint.LintException) as e:
+        with context.findings() as findings:
+            findings.warn("first")
+            context.lint_error("second")
+
+    assert e.value.result == ubuntu_lint.LintResult.ERROR
+    assert [(f.reason, f.result) for f in e.value.findings] == [
+        ("first", ubuntu_lint.LintResult.WARN),
+        ("second", ubuntu_lint.LintResult.ERROR),
+    ]
+
+    # Nor are they lost when the linter is skipped partway through, e.g. as a
+    # remote service is unavailable, or cannot go on.
+    for skip in (
+        lambda: context.lint_skip("launchpad is unavailable"),
+        lambda: context.debian_tar,
+    ):
+        with pytest.raises(ubuntu_lint.LintException) as e:
+            with context.findings() as findings:
+                findings.fail("first")
+                skip()
+
+        assert e.value.result == ubuntu_lint.LintResult.FAIL
+        assert [f.reason for f in e.value.findings][0] == "first"
+        assert len(e.value.findings) == 2
+
+    with context.findings():
+        pass
+
+
 def test_check_sru_version_string_convention(requests_mock):
     changelog_tmpl = """hello ({next_version}) noble; urgency=medium
 
@@ -815,6 +885,129 @@ def test_check_missing_pending_changelog_entry_ignore_syncs(
     )
 
 
+def test_check_missing_pending_changelog_entry_proposed_index(
+    mock_lp_handle, add_published_source_mock, tmp_path
+):
+    def publication(
+        package, version, pocket, date, status="Published", superseded=None
+    ):
+        p = add_published_source_mock(version, pocket=pocket, status=status)
+        p.source_package_name = package
+        p.date_created = date
+        p.date_superseded = superseded
+        return p
+
+    def get_published_sources(distro_series, pocket=None, status=None, **kwargs):
+        if "created_since_date" in kwargs:
+            return refreshed
+        if status == "Published":
+            return [
+                publication("hello", "2.10-3ubuntu0.2", "Proposed", "2026-01-02"),
+                publication("other", "1.0-1ubuntu0.1", "Proposed", "2026-01-01"),
+            ]
+        if status == "Superseded":
+            return [
+                # Superseded by 2.10-3ubuntu0.2 in -proposed, neither released.
+                publication(
+                    "hello",
+                    "2.10-3ubuntu0.1",
+                    "Proposed",
+                    "2026-01-01",
+                    "Superseded",
+                    superseded="2026-01-02",
+                ),
+                # Superseded before an earlier migration.
+                publication(
+                    "hello",
+                    "2.10-2ubuntu0.2",
+                    "Proposed",
+                    "2025-06-01",
+                    "Superseded",
+                    superseded="2025-06-02",
+                ),
+                publication(
+                    "gone",
+                    "1.0-1ubuntu0.1",
+                    "Proposed",
+                    "2025-06-01",
+                    "Superseded",
+                    superseded="2025-06-02",
+                ),
+            ]
+        return []
+
+    # This upload includes the changelog entry of 2.10-3ubuntu0.2, but not that
+    # of 2.10-3ubuntu0.1 which it superseded.
+    changes = deb822.Changes(
+        basic_changes_sru.dump()
+        .replace("2.10-3ubuntu0.1", "2.10-3ubuntu0.3")
+        .replace(
+            " hello (2.10-3ubuntu0.3) noble; urgency=medium\n",
+            " hello (2.10-3ubuntu0.3) noble; urgency=medium\n"
+            " .\n"
+            "   * Fix a regression\n"
+            " .\n"
+            " hello (2.10-3ubuntu0.2) noble; urgency=medium\n",
+        )
+    )
+
+    refreshed: list = []
+    mock_archive = mock_lp_handle.main_archive
+    mock_archive.getPublishedSources.side_effect = get_published_sources
+
+    indexes = ProposedIndexes(str(tmp_path))
+    for _ in range(2):
+        with pytest.raises(
+            ubuntu_lint.LintException,
+            match=r"published in proposed but have not migrated.*: 2.10-3ubuntu0.1$",
+        ):
+            ubuntu_lint.check_missing_pending_changelog_entry(
+                ubuntu_lint.Context(
+                    changes=changes,
+                    launchpad_handle=mock_lp_handle,
+                    proposed_indexes=indexes,
+                )
+            )
+
+    # The index is built once, from the publications still in -proposed, rather
+    # than queried for each package.
+    assert mock_archive.getPublishedSources.call_count == 3
+    index = indexes.get("noble", lambda since: [])
+    assert index.lookup("hello") == [
+        ["2.10-3ubuntu0.2", "Published"],
+        ["2.10-3ubuntu0.1", "Superseded"],
+    ]
+    assert index.lookup("other") == [["1.0-1ubuntu0.1", "Published"]]
+    assert index.lookup("gone") == []
+
+    # The next run refreshes the saved index, in which 2.10-3ubuntu0.2 has been
+    # released.
+    refreshed = [publication("hello", "2.10-3ubuntu0.2", "Updates", "2026-01-03")]
+    ubuntu_lint.check_missing_pending_changelog_entry(
+        ubuntu_lint.Context(
+            changes=changes,
+            launchpad_handle=mock_lp_handle,
+            proposed_indexes=ProposedIndexes(str(tmp_path)),
+        )
+    )
+    assert mock_archive.getPublishedSources.call_count == 4
+    assert "created_since_date" in mock_archive.getPublishedSources.call_args.kwargs
+
+    # An index in use, e.g. by a server, is refreshed once it is old enough.
+    since: list = []
+
+    def fetch(s):
+        since.append(s)
+        return [["other", "1.0-1ubuntu0.1", "Updates", "", "2026-01-04"]]
+
+    assert indexes.get("noble", fetch) is index
+    assert since == []
+
+    indexes._refreshed["noble"] -= indexes.refresh_age + 1
+    assert indexes.get("noble", fetch).lookup("other") == []
+    assert since == [index.since]
+
+
 @pytest.fixture
 def add_bug_mock(mocker):
     def _add_bug_mock(bug_id, description="", bug_tasks=None):
@@ -858,20 +1051,21 @@ Any code that initializes the application could be affected.
         mock_bug = add_bug_mock(bug_number, description=bug_description)
         mock_lp_handle.bugs = {bug_number: mock_bug}
 
-        if not all(
-            (impact_stanza, test_plan_stanza, where_problems_could_occur_stanza)
-        ):
-            if not impact_stanza:
-                section = "Impact"
-            elif not test_plan_stanza:
-                section = "Test Plan"
-            else:
-                section = "Where Problems Could Occur"
-
+        missing = [
+            section
+            for section, stanza in [
+                ("[Impact]", impact_stanza),
+                ("[Test Plan]", test_plan_stanza),
+                ("[Where Problems Could Occur]", where_problems_could_occur_stanza),
+            ]
+            if not stanza
+        ]
+        if missing:
             with pytest.raises(
                 ubuntu_lint.LintException,
                 match=re.escape(
-                    f"bug {bug_number} description is missing the [{section}] section"
+                    f"bug {bug_number} description is missing the "
+                    f"{', '.join(missing)} section"
                 ),
             ):
                 ubuntu_lint.check_sru_bug_missing_template(
@@ -886,8 +1080,28 @@ Any code that initializes the application could be affected.
                 )
             )
 
+    # All bugs are checked, and all problems reported at once.
+    changes = copy.deepcopy(basic_changes_sru)
+    changes["Launchpad-Bugs-Fixed"] = "1 2 3"
+    mock_lp_handle.bugs = {
+        "1": add_bug_mock("1", description=f"{impact}\n{test_plan}"),
+        "2": add_bug_mock(
+            "2", description=f"{impact}\n{test_plan}\n{where_problems_could_occur}"
+        ),
+    }
+    with pytest.raises(ubuntu_lint.LintException) as e:
+        ubuntu_lint.check_sru_bug_missing_template(
+            ubuntu_lint.Context(changes=changes, launchpad_handle=mock_lp_handle)
+        )
+
+    assert [f.reason.split(",")[0] for f in e.value.findings] == [
+        "bug 1 description is missing the [Where Problems Could Occur] section",
+        "bug 3 does not exist or is not public",
+    ]
+    assert e.value.reason == "; ".join(f.reason for f in e.value.findings)
+
 
-def test_check_sru_bug_missing_release_tasks(mock_lp_handle, add_bug_mock):
+def test_check_sru_bug_missing_release_tasks(mocker, mock_lp_handle):
     bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
     dist = basic_changes_sru["Distribution"]
     package = basic_changes_sru["Source"]
@@ -896,21 +1110,21 @@ def test_check_sru_bug_missing_release_tasks(mock_lp_handle, add_bug_mock):
     series_url = f"https://api.launchpad.net/1.0/ubuntu/{dist}"
     mock_series.__str__.return_value = series_url
 
-    mock_bug_with_task = add_bug_mock(
-        bug_number,
-        bug_tasks=[
-            f"https://api.launchpad.net/1.0/ubuntu/{dist}/+source/{package}/+bug/{bug_number}"
-        ],
-    )
-    mock_lp_handle.bugs = {bug_number: mock_bug_with_task}
-
     ubuntu_lint.check_sru_bug_missing_release_tasks(
         ubuntu_lint.Context(changes=basic_changes_sru, launchpad_handle=mock_lp_handle)
     )
 
-    mock_bug_missing_task = add_bug_mock(bug_number, bug_tasks=[])
-    mock_lp_handle.bugs = {bug_number: mock_bug_missing_task}
+    # Only the link to the task of the package in the series is requested.
+    task_url = f"{series_url}/+source/{package}/+bug/{bug_number}"
+    mock_lp_handle._browser._request.assert_called_once_with(task_url, method="HEAD")
+
+    def request(url, method):
+        if url == task_url:
+            raise NotFound(mocker.MagicMock(status=404), b"")
 
+        return mocker.MagicMock(status=200), b""
+
+    mock_lp_handle._browser._request.side_effect = request
     with pytest.raises(
         ubuntu_lint.LintException,
         match=re.escape(f"LP: #{bug_number} is missing a bug task for noble"),
@@ -921,6 +1135,65 @@ def test_check_sru_bug_missing_release_tasks(mock_lp_handle, add_bug_mock):
             )
         )
 
+    mock_lp_handle._browser._request.side_effect = NotFound(
+        mocker.MagicMock(status=404), b""
+    )
+    with pytest.raises(
+        ubuntu_lint.LintException,
+        match=re.escape(f"bug {bug_number} does not exist or is not public"),
+    ):
+        ubuntu_lint.check_sru_bug_missing_release_tasks(
+            ubuntu_lint.Context(
+                changes=basic_changes_sru, launchpad_handle=mock_lp_handle
+            )
+        )
+
+
+def test_launchpad_links(mocker, mock_lp_handle, add_bug_mock, tmp_path):
+    bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
+    package = basic_changes_sru["Source"]
+
+    series_url = "https://api.launchpad.net/1.0/ubuntu/noble"
+    mock_lp_handle.getSeries.return_value.__str__.return_value = series_url
+    mock_lp_handle.bugs = {
+        bug_number: add_bug_mock(
+            bug_number, bug_tasks=[f"{series_url}/+source/{package}/+bug/{bug_number}"]
+        )
+    }
+
+    path = str(tmp_path / "links.json")
+    for _ in range(2):
+        ubuntu_lint.check_sru_bug_missing_release_tasks(
+            ubuntu_lint.Context(
+                changes=basic_changes_sru,
+                launchpad_handle=mock_lp_handle,
+                launchpad_links=LaunchpadLinks(path),
+            )
+        )
+
+    # The series is only looked up once, and then loaded from the saved links.
+    assert mock_lp_handle.getSeries.call_count == 1
+    assert LaunchpadLinks(path).lookup("series:noble") == series_url
+
+    # The main archive is loaded from its link once it is known.
+    mock_lp_handle.main_archive.__str__.return_value = "https://lp/ubuntu/+archive"
+    mock_lp_handle.main_archive.getPublishedSources.return_value = []
+    for _ in range(2):
+        ubuntu_lint.check_missing_pending_changelog_entry(
+            ubuntu_lint.Context(
+                changes=basic_changes_ubuntu_delta,
+                launchpad_handle=mock_lp_handle,
+                launchpad_links=LaunchpadLinks(path),
+            )
+        )
+
+    assert (
+        mock_lp_handle.load.call_args_list.count(
+            mocker.call("https://lp/ubuntu/+archive")
+        )
+        == 1
+    )
+
 
 def test_check_merge_missing_new_debian_changelog():
     ubuntu_lint.check_merge_missing_new_debian_changelog(
@@ -977,3 +1250,884 @@ def test_check_merge_missing_new_debian_changelog_skip(
         )
 
     assert e.value.result == ubuntu_lint.LintResult.SKIP
+
+
+def test_context_in_memory():
+    testdata = os.path.join(os.path.dirname(__file__), "testdata/dput/baseline")
+    name = "hello_2.12.3-1ubuntu1"
+
+    def read(suffix: str) -> bytes:
+        with open(os.path.join(testdata, f"{name}{suffix}"), "rb") as f:
+            return f.read()
+
+    tar = read(".debian.tar.xz")
+    from_paths = ubuntu_lint.Context(
+        changes=os.path.join(testdata, f"{name}_source.changes"),
+        debian_tar=os.path.join(testdata, f"{name}.debian.tar.xz"),
+    )
+
+    cases: list[tuple[Any, Any]] = [
+        (read("_source.changes"), tar),
+        (memoryview(read("_source.changes")), memoryview(tar)),
+        (io.BytesIO(read("_source.changes")), io.BytesIO(tar)),
+        (io.StringIO(read("_source.changes").decode()), bytearray(tar)),
+    ]
+    for changes, debian_tar in cases:
+        context = ubuntu_lint.Context(changes=changes, debian_tar=debian_tar)
+        assert context.changes == from_paths.changes
+        assert str(context.changelog_entry) == str(from_paths.changelog_entry)
+
+    # A debian tar can be read from a stream which cannot seek, e.g. a pipe.
+    r, w = os.pipe()
+
+    def write():
+        with os.fdopen(w, "wb") as f:
+            f.write(tar)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    with os.fdopen(r, "rb") as stream:
+        assert not stream.seekable()
+        context = ubuntu_lint.Context(debian_tar=stream)
+    writer.join()
+    assert str(context.changelog_entry) == str(from_paths.changelog_entry)
+
+    # Only the changelog is read from a debian tar given in memory.
+    with pytest.raises(ubuntu_lint.MissingContextException):
+        context.debian_tar
+
+    # A dsc alone gives the source package name and version.
+    context = ubuntu_lint.Context(dsc=memoryview(read(".dsc")))
+    assert context.dsc["Source"] == "hello"
+    assert context.get_source_package_name() == "hello"
+    assert context.get_package_version() == "2.12.3-1ubuntu1"
+
+    context = ubuntu_lint.Context(debian_changelog=str(basic_changelog_sru).encode())
+    assert context.get_package_version() == "2.10-3ubuntu0.1"
+
+    with pytest.raises(ValueError, match="invalid content in debian tar"):
+        ubuntu_lint.Context(debian_tar=io.BytesIO(b"\0" * 1024))
+
+
+def test_context_stats(requests_mock):
+    package = basic_changes_sru.get("Source")
+    requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n"
+        "hello | 2.10-5build1  | resolute        | source\n",
+    )
+
+    context = ubuntu_lint.Context(
+        changes=basic_changes_sru, debian_changelog=basic_changelog_sru
+    )
+    assert "context" in context.stats.phases
+    assert "changelog-parse" not in context.stats.phases
+
+    with context.stats.linter("breaks-upgrades") as first:
+        ubuntu_lint.check_sru_version_string_breaks_upgrades(context)
+    with context.stats.linter("convention") as second:
+        ubuntu_lint.check_sru_version_string_convention(context)
+
+    # The rmadison data is fetched once, and re-used by the second linter.
+    assert first.requests == {"madison": 1}
+    assert (first.cache_hits, first.cache_misses) == (0, 1)
+    assert second.requests == {}
+    assert (second.cache_hits, second.cache_misses) == (1, 0)
+
+    assert context.stats.requests == {"madison": 1}
+    assert first.wall_time >= first.network_time
+
+
+def test_context_stats_launchpad_login(mocker, mock_lp_handle, add_bug_mock):
+    bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
+    mock_lp_handle.bugs = {
+        bug_number: add_bug_mock(bug_number, description="[Impact]\n"),
+    }
+    mocker.patch(
+        "ubuntu_lint.context.Launchpad.login_anonymously",
+        return_value=mock_lp_handle,
+    )
+
+    # Logging in is part of the first request, rather than another one.
+    context = ubuntu_lint.Context(changes=basic_changes_sru)
+    with pytest.raises(ubuntu_lint.LintException, match=r"\[Test Plan\]"):
+        ubuntu_lint.check_sru_bug_missing_template(context)
+    assert context.stats.requests == {"launchpad": 1}
+
+
+def test_context_threads(
+    mocker, requests_mock, mock_lp_handle, add_bug_mock, add_published_source_mock
+):
+    package = basic_changes_sru.get("Source")
+    bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n"
+        "hello | 2.10-5build1  | resolute        | source\n",
+    )
+    mock_lp_handle.bugs = {
+        bug_number: add_bug_mock(bug_number, description="[Impact]\n"),
+    }
+    mock_lp_handle.main_archive.getPublishedSources.return_value = [
+        add_published_source_mock("2.10-3ubuntu0.1", pocket="Proposed"),
+    ]
+
+    def login(*args, **kwargs):
+        time.sleep(0.05)
+        return mock_lp_handle
+
+    login_anonymously = mocker.patch(
+        "ubuntu_lint.context.Launchpad.login_anonymously", side_effect=login
+    )
+
+    linters = [
+        fn for name, fn in vars(ubuntu_lint).items() if name.startswith("check_")
+    ]
+
+    def run_all(context: ubuntu_lint.Context) -> dict[str, str]:
+        results = {}
+        for fn in linters:
+            try:
+                fn(context)
+                results[fn.__name__] = "OK"
+            except ubuntu_lint.LintException as e:
+                results[fn.__name__] = f"{e.result.name}: {e.reason}"
+            except ubuntu_lint.MissingContextException as e:
+                results[fn.__name__] = f"missing: {e}"
+
+        return results
+
+    expected = run_all(
+        ubuntu_lint.Context(
+            changes=basic_changes_sru, debian_changelog=basic_changelog_sru
+        )
+    )
+    assert login_anonymously.call_count == 1
+    assert madison.call_count == 1
+
+    # All linters run from many threads at once against the same context, which
+    # logs in to Launchpad and fetches each remote data once.
+    context = ubuntu_lint.Context(
+        changes=basic_changes_sru, debian_changelog=basic_changelog_sru
+    )
+    threads = 16
+    barrier = threading.Barrier(threads)
+
+    def worker(_) -> dict[str, str]:
+        barrier.wait()
+        return run_all(context)
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(worker, range(threads)))
+
+    assert all(result == expected for result in results)
+    assert login_anonymously.call_count == 2
+    assert madison.call_count == 2
+
+
+def test_context_record_replay(requests_mock, mock_lp_handle, add_bug_mock, tmp_path):
+    package = basic_changes_sru.get("Source")
+    bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n"
+        "hello | 2.10-5build1  | resolute        | source\n",
+    )
+    mock_lp_handle.bugs = {
+        bug_number: add_bug_mock(bug_number, description="[Impact]\n"),
+    }
+
+    recording = Recording()
+    context = ubuntu_lint.Context(
+        changes=basic_changes_sru,
+        launchpad_handle=mock_lp_handle,
+        recording=recording,
+    )
+    ubuntu_lint.check_sru_version_string_breaks_upgrades(context)
+    with pytest.raises(ubuntu_lint.LintException, match=r"\[Test Plan\]"):
+        ubuntu_lint.check_sru_bug_missing_template(context)
+
+    path = str(tmp_path / "recording.json.gz")
+    recording.save(path)
+
+    # The replayed run gives the same results, without any requests.
+    mock_lp_handle.bugs = {}
+    context = ubuntu_lint.Context(
+        changes=basic_changes_sru,
+        launchpad_handle=mock_lp_handle,
+        recording=Recording.load(path, latency=0.01),
+    )
+    ubuntu_lint.check_sru_version_string_breaks_upgrades(context)
+    with pytest.raises(ubuntu_lint.LintException, match=r"\[Test Plan\]"):
+        ubuntu_lint.check_sru_bug_missing_template(context)
+
+    assert madison.call_count == 1
+    assert context.stats.requests == {"madison": 1, "launchpad": 1}
+    assert context.stats.network_time >= 0.02
+
+    # Requests that were not recorded cannot be replayed.
+    with pytest.raises(ubuntu_lint.MissingContextException):
+        ubuntu_lint.check_sru_bug_missing_release_tasks(context)
+
+
+sweep_sources = """Package: hello
+Binary: hello
+Version: 2.10-5ubuntu1
+Files:
+ 7c304e61e5f173cb0db96fb7953fd2a3 1305 hello_2.10-5ubuntu1.dsc
+\t0ae5d6bd1e4fc3a4e6dbe6a5ea8d5b12 12688 hello_2.10-5ubuntu1.debian.tar.xz
+Directory: pool/main/h/hello
+
+Package: hello-backport
+Version: 1.0-1ubuntu0~24.04.1
+
+Package: hello-sync
+Version: 2.10-5
+
+Package: hello-native
+Version: 1.0build1
+"""
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sweep(tmp_path, jobs):
+    index = tmp_path / "dists/resolute/main/source/Sources.gz"
+    index.parent.mkdir(parents=True)
+    with gzip.open(index, "wt") as f:
+        f.write(sweep_sources)
+
+    with ubuntu_lint.sweep.open_index(str(index)) as f:
+        assert list(ubuntu_lint.sweep.read_sources(f)) == [
+            ("hello", "2.10-5ubuntu1"),
+            ("hello-backport", "1.0-1ubuntu0~24.04.1"),
+            ("hello-sync", "2.10-5"),
+            ("hello-native", "1.0build1"),
+        ]
+
+    assert ubuntu_lint.sweep.suite_from_path(str(index)) == "resolute"
+
+    report = ubuntu_lint.sweep.sweep(
+        [(str(index), "resolute")],
+        [
+            ("missing-version-suffix", ubuntu_lint.check_missing_version_suffix),
+            ("release-mismatch", ubuntu_lint.check_release_mismatch),
+        ],
+        jobs=jobs,
+    )
+
+    assert report.packages == 4
+    assert report.results == {
+        "missing-version-suffix": {"OK": 3, "FAIL": 1},
+        "release-mismatch": {"OK": 3, "WARN": 1},
+    }
+    assert [finding[:4] for finding in report.findings] == [
+        ("hello-backport", "1.0-1ubuntu0~24.04.1", "release-mismatch", "WARN"),
+        ("hello-sync", "2.10-5", "missing-version-suffix", "FAIL"),
+    ]
+
+
+def test_madison_table(tmp_path, requests_mock):
+    indexes = []
+    for suite, text in [
+        ("noble", "Package: hello\nVersion: 2.10-3build1\n"),
+        ("noble-updates", "Package: hello\nVersion: 2.10-3ubuntu0.1\n"),
+        ("noble-backports", "Package: hello\nVersion: 2.10-5~bpo24.04.1\n"),
+        ("resolute", sweep_sources),
+    ]:
+        index = tmp_path / f"dists/{suite}/main/source/Sources"
+        index.parent.mkdir(parents=True)
+        index.write_text(text)
+        indexes.append((str(index), suite))
+
+    path = str(tmp_path / "madison.table")
+    MadisonTable.write(path, ubuntu_lint.sweep.max_versions_from_sources(indexes))
+
+    with MadisonTable(path) as table:
+        assert len(table) == 4
+        assert "hello-sync" in table
+        assert "hello-missing" not in table
+        assert table.max_version_by_series("hello-missing") is None
+        assert table.max_version_by_series("hello") == {
+            "noble": "2.10-3ubuntu0.1",
+            "resolute": "2.10-5ubuntu1",
+        }
+
+        ranks = table.ranks("hello")
+        assert ranks is not None
+        assert ranks["noble"] < ranks["resolute"]
+        assert table.version(ranks["noble"]) == "2.10-3ubuntu0.1"
+
+        # Packages in the table are not looked up on madison.
+        madison = requests_mock.get(
+            "https://people.canonical.com/~ubuntu-archive/madison.cgi", text=""
+        )
+        ubuntu_lint.check_sru_version_string_breaks_upgrades(
+            ubuntu_lint.Context(changes=basic_changes_sru, madison_table=table)
+        )
+        assert madison.call_count == 0
+
+    with pytest.raises(ValueError):
+        MadisonTable(indexes[0][0])
+
+    # Truncated tables are rejected when opened, rather than failing lookups.
+    with open(path, "rb") as f:
+        data = f.read()
+    for size in (len(data) - 1, 40):
+        truncated = tmp_path / f"truncated-{size}.table"
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="truncated"):
+            MadisonTable(str(truncated))
+
+
+def test_version_key():
+    ordered = [
+        "1.0~rc1",
+        "1.0",
+        "1.0-0ubuntu1",
+        "1.0-1~bpo1",
+        "1.0-1",
+        "1.0-1build1",
+        "1.0-1ubuntu0.24.04.1",
+        "1.0-1ubuntu1",
+        "1.0-1ubuntu1.1",
+        "1.0a",
+        "1.0+dfsg",
+        "1.00.1",
+        "1.1",
+        "1:0.1",
+    ]
+    assert ubuntu_lint.versions.sort_versions(reversed(ordered)) == ordered
+    assert ubuntu_lint.versions.max_version(ordered) == "1:0.1"
+
+    # Versions which compare equal have equal keys.
+    assert ubuntu_lint.versions.compare("1.0", "1.0-0") == 0
+    assert ubuntu_lint.versions.compare("0:1.01", "1.1") == 0
+
+    # The keys agree with debian_support.version_compare.
+    rng = random.Random(0)
+    chars = "0123456789~+.abzAZ"
+
+    def random_version() -> str:
+        version = "".join(rng.choice(chars) for _ in range(rng.randint(0, 5)))
+        version = f"{rng.randint(0, 12)}{version}"
+        if rng.random() < 0.2:
+            version = f"{rng.randint(0, 2)}:{version}"
+        if rng.random() < 0.7:
+            version += "-" + "".join(
+                rng.choice(chars) for _ in range(rng.randint(1, 5))
+            )
+        return version
+
+    for _ in range(10000):
+        a, b = random_version(), random_version()
+        expect = debian_support.version_compare(a, b)
+        expect = (expect > 0) - (expect < 0)
+        assert ubuntu_lint.versions.compare(a, b) == expect, (a, b)
+
+
+def test_version_bulk_queries():
+    assert ubuntu_lint.versions.max_version_by_series(
+        [
+            ("noble", "2.10-3"),
+            ("noble", "2.10-3ubuntu0.1"),
+            ("noble", "2.10-3~bpo1"),
+            ("resolute", "2.10-5build1"),
+            ("resolute", "2.10-5"),
+        ]
+    ) == {"noble": "2.10-3ubuntu0.1", "resolute": "2.10-5build1"}
+
+    assert ubuntu_lint.versions.is_below_all("2.10-3ubuntu0.1", ["2.10-5", "2.10-4"])
+    assert ubuntu_lint.versions.is_below_all("2.10-4", ["2.10-5", "2.10-4"])
+    assert ubuntu_lint.versions.find_lower("2.10-4ubuntu1", ["2.10-5", "2.10-4"]) == (
+        "2.10-4"
+    )
+
+
+def test_parse_version():
+    for s in ("2.10-5ubuntu1", "1:2.0~rc1", "1.0-beta-1ubuntu0.24.04.1", "3.0"):
+        version = ubuntu_lint.versions.parse_version(s)
+        expect = debian_support.Version(s)
+
+        assert version is ubuntu_lint.versions.parse_version(s)
+        assert str(version) == s
+        assert version.epoch == expect.epoch
+        assert version.upstream_version == expect.upstream_version
+        assert version.debian_revision == expect.debian_revision
+        assert version.debian_version == expect.debian_version
+
+        assert version == expect and expect == version
+        assert version == s
+        assert version < f"{s}+1" and expect < version.full_version + "+1"
+
+    with pytest.raises(ValueError):
+        ubuntu_lint.versions.parse_version("a:1.0")
+
+    version = ubuntu_lint.versions.parse_version("2.10-5ubuntu1")
+    assert not hasattr(version, "__dict__")
+    with pytest.raises(AttributeError):
+        version.epoch = "1"
+
+    # Contexts share the parsed versions.
+    first = ubuntu_lint.Context(changes=basic_changes_sru)
+    second = ubuntu_lint.Context(debian_changelog=basic_changelog_sru)
+    assert first.get_package_version() is second.get_package_version()
+
+
+def test_cli_run(capsys):
+    import ubuntu_lint.cli
+
+    testdata = os.path.join(os.path.dirname(__file__), "testdata/cli")
+
+    outcome = ubuntu_lint.cli.run(
+        [
+            "--all=off",
+            "--missing-version-suffix=fail",
+            f"--changes-file={testdata}/missing-version-suffix/changes",
+            f"--changelog={testdata}/missing-version-suffix/changelog",
+        ],
+        levels={"release-mismatch": "fail"},
+    )
+    assert outcome.status == 1
+    assert outcome.results() == {
+        "missing-version-suffix": ubuntu_lint.LintResult.FAIL,
+        "release-mismatch": ubuntu_lint.LintResult.OK,
+    }
+    assert outcome["missing-version-suffix"].reason
+    assert outcome["missing-version-suffix"].findings[0].result == (
+        ubuntu_lint.LintResult.FAIL
+    )
+    assert outcome["release-mismatch"].stats.name == "release-mismatch"
+
+    # Results are downgraded to the configured level, as on the command line.
+    context = ubuntu_lint.Context(changes=basic_changes_no_ubuntu_delta)
+    outcome = ubuntu_lint.cli.run(
+        context=context, levels={"all": "off", "distribution-invalid": "warn"}
+    )
+    assert outcome.status == 0
+    assert outcome.results() == {"distribution-invalid": ubuntu_lint.LintResult.WARN}
+    assert outcome.stats is context.stats
+
+    with pytest.raises(ubuntu_lint.cli.UsageError):
+        ubuntu_lint.cli.run(["--jobs=0"], context=context)
+
+    with pytest.raises(ubuntu_lint.cli.UsageError):
+        ubuntu_lint.cli.run([f"--changes-file={testdata}/baseline/changes"], context)
+
+    with pytest.raises(ubuntu_lint.cli.UsageError):
+        ubuntu_lint.cli.run(context=context, levels={"no-such-linter": "off"})
+
+    # Nothing is printed, e.g. for --help.
+    for argv in (["--help"], ["--json-lines"], ["--json"]):
+        with pytest.raises(ubuntu_lint.cli.UsageError):
+            ubuntu_lint.cli.run(argv, context=context)
+    assert capsys.readouterr() == ("", "")
+
+    # Options setting up the context cannot be given with one.
+    with pytest.raises(ubuntu_lint.cli.UsageError):
+        ubuntu_lint.cli.run(["--persistent-cache"], context=context)
+
+
+def test_plugin_linters():
+    import importlib.metadata
+    import sys
+    import tempfile
+    import ubuntu_lint.cli
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "team_lints.py"), "w") as f:
+            f.write(textwrap.dedent("""
+                import ubuntu_lint
+                from ubuntu_lint.cli import LinterConfiguration
+
+                def check_team_rules(context):
+                    context.lint_fail("team rules")
+
+                def check_team_version(context):
+                    pass
+
+                team_rules = LinterConfiguration(
+                    name="team-rules",
+                    fn=check_team_rules,
+                    default_level_devel=ubuntu_lint.LintResult.FAIL,
+                    default_level_stable=None,
+                    requires={"changes"},
+                )
+                """))
+
+        def entry_point(name: str, value: str) -> importlib.metadata.EntryPoint:
+            return importlib.metadata.EntryPoint(name, value, "ubuntu_lint.linters")
+
+        plugins = ubuntu_lint.cli.plugin_linters(
+            [
+                entry_point("team-rules", "team_lints:team_rules"),
+                entry_point("team-version", "team_lints:check_team_version"),
+                # Built-in linters cannot be replaced.
+                entry_point("release-mismatch", "team_lints:check_team_rules"),
+            ]
+        )
+        assert [p.name for p in plugins] == ["team-rules", "team-version"]
+
+        sys.path.insert(0, tmpdir)
+        try:
+            # Plugins turned off are never loaded.
+            runner = ubuntu_lint.cli.Runner(plugins)
+            runner.set_levels({"all": "off"})
+            context = ubuntu_lint.Context(changes=basic_changes_no_ubuntu_delta)
+            assert runner.lint(context) == 0
+            assert "team_lints" not in sys.modules
+
+            runner = ubuntu_lint.cli.Runner(plugins)
+            assert runner.lint(context) == 1
+            assert "team_lints" in sys.modules
+
+            outcome = runner.outcome(1)
+            assert outcome.results() == {
+                "team-rules": ubuntu_lint.LintResult.FAIL,
+                "team-version": ubuntu_lint.LintResult.OK,
+            }
+            assert outcome["team-rules"].reason == "team rules"
+            assert outcome["team-rules"].stats.name == "team-rules"
+            assert plugins[0].requires == {"changes"}
+            assert plugins[1].default_level_devel == ubuntu_lint.LintResult.WARN
+
+            # A plugin which cannot be loaded is reported as an error, rather
+            # than aborting the run.
+            broken = ubuntu_lint.cli.plugin_linters(
+                [
+                    entry_point("team-missing", "no_such_team_lints:check"),
+                    entry_point("team-not-linter", "team_lints:ubuntu_lint"),
+                ]
+            )
+            runner = ubuntu_lint.cli.Runner(plugins + broken)
+            assert runner.lint(context) == 2
+
+            outcome = runner.outcome(2)
+            assert outcome.results() == {
+                "team-rules": ubuntu_lint.LintResult.FAIL,
+                "team-version": ubuntu_lint.LintResult.OK,
+                "team-missing": ubuntu_lint.LintResult.ERROR,
+                "team-not-linter": ubuntu_lint.LintResult.ERROR,
+            }
+            assert "no_such_team_lints" in outcome["team-missing"].reason
+        finally:
+            sys.path.remove(tmpdir)
+            sys.modules.pop("team_lints", None)
+
+
+def test_prefetch_bundle(requests_mock, mock_lp_handle, add_bug_mock, tmp_path):
+    import ubuntu_lint.cli
+
+    package = basic_changes_sru.get("Source")
+    bug_number = basic_changes_sru["Launchpad-Bugs-Fixed"].split()[0]
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n"
+        "hello | 2.10-5build1  | resolute        | source\n",
+    )
+    mock_lp_handle.bugs = {
+        bug_number: add_bug_mock(bug_number, description="[Impact]\n"),
+    }
+
+    bundle = Recording()
+    bundle.metadata = {"uploads": ["hello_2.10-3ubuntu0.1_source.changes"]}
+    outcome = ubuntu_lint.cli.prefetch_context(
+        ubuntu_lint.Context(
+            changes=basic_changes_sru,
+            launchpad_handle=mock_lp_handle,
+            recording=bundle,
+        )
+    )
+    assert outcome["sru-bug-missing-template"].result == ubuntu_lint.LintResult.WARN
+    assert "missing-version-suffix" not in outcome.linters
+
+    path = str(tmp_path / "bundle.json.gz")
+    bundle.save(path)
+
+    # Without any access to Launchpad or madison, the network lint checks give
+    # the same results from the bundle.
+    bundle = Recording.load(path)
+    assert bundle.metadata == {"uploads": ["hello_2.10-3ubuntu0.1_source.changes"]}
+
+    levels = {"all": "off"} | {name: "warn" for name in outcome.linters}
+    offline = ubuntu_lint.cli.run(
+        context=ubuntu_lint.Context(changes=basic_changes_sru, recording=bundle),
+        levels=levels,
+    )
+    assert offline.results() == outcome.results()
+    assert offline["sru-bug-missing-template"].reason == (
+        outcome["sru-bug-missing-template"].reason
+    )
+    assert madison.call_count == 1
+
+
+def test_prefetch_errors(mocker, capsys):
+    import ubuntu_lint.cli
+
+    # Lint checks which cannot run are reported, even though they run at the
+    # warn level.
+    linter = ubuntu_lint.cli.all_linters_by_name["sru-version-string-breaks-upgrades"]
+    mocker.patch.object(
+        linter, "fn", side_effect=ubuntu_lint.MissingContextException("no dsc")
+    )
+    mocker.patch.object(ubuntu_lint.cli, "all_linters", [linter])
+
+    ret = ubuntu_lint.cli.prefetch_all(
+        ["hello.changes"],
+        lambda upload: ubuntu_lint.Context(changes=basic_changes_sru),
+        jobs=1,
+    )
+    assert ret == 1
+    assert (
+        "hello.changes: sru-version-string-breaks-upgrades: no dsc"
+        in capsys.readouterr().err
+    )
+
+
+def test_cache_warm_packages(requests_mock, tmp_path, monkeypatch, capsys):
+    import ubuntu_lint.cli
+
+    madison = requests_mock.get(
+        "https://people.canonical.com/~ubuntu-archive/madison.cgi?package=hello&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n",
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    packages = tmp_path / "packages"
+    packages.write_text("hello 2.10-3ubuntu0.1 noble\n")
+
+    # Only the lint checks which can run with the name, version and
+    # distribution of a package do, rather than failing for lack of context.
+    assert ubuntu_lint.cli.cache_main(["warm", f"--packages={packages}"]) == 0
+    assert madison.call_count == 1
+    assert "ERROR" not in capsys.readouterr().err
+
+
+def test_response_cache(requests_mock, tmp_path, mocker):
+    from ubuntu_lint.cache import ResponseCache
+
+    package = basic_changes_sru.get("Source")
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="hello | 2.10-3build1  | noble           | source\n",
+    )
+
+    path = str(tmp_path / "responses.sqlite")
+    for _ in range(2):
+        with ResponseCache(path) as cache:
+            context = ubuntu_lint.Context(
+                changes=basic_changes_sru, response_cache=cache
+            )
+            ubuntu_lint.check_sru_version_string_breaks_upgrades(context)
+
+    # The second run is served from the cache.
+    assert madison.call_count == 1
+
+    with ResponseCache(path) as cache:
+        stats = cache.stats()
+        assert stats["madison/http-get"]["entries"] == 1
+        assert stats["madison/http-get"]["hits"] == 1
+        assert stats["madison/http-get"]["misses"] == 1
+        assert stats["madison/http-get"]["hit_ratio"] == 0.5
+
+        # Responses are only used until they expire.
+        mocker.patch("time.time", return_value=time.time() + 2 * 60 * 60)
+        with pytest.raises(KeyError):
+            cache.get("madison", "http-get", next(iter(cache_keys(cache))))
+        mocker.stopall()
+
+        # Operations which are not to be cached are not stored.
+        cache.put("launchpad", "lp-proposed-publications", "key", [])
+        cache.put("launchpad", "lp-bug-description", "bug", "[Impact]")
+        assert len(cache_keys(cache)) == 1
+
+    # The least recently used responses are evicted beyond the maximum size.
+    with ResponseCache(path, max_size=200) as cache:
+        for i in range(10):
+            cache.put("git-web", "http-get", f"key-{i}", [200, "x" * 50])
+            time.sleep(0.001)
+
+        keys = cache_keys(cache)
+        assert "key-9" in keys
+        assert "key-0" not in keys
+        assert sum(e["bytes"] for e in cache.stats().values()) <= 200
+
+        # The total size is kept up to date as responses are replaced.
+        cache.put("git-web", "http-get", "key-9", [200, "x"])
+        (size,) = cache._db.execute("SELECT SUM(size) FROM responses").fetchone()
+        assert cache._size() == size
+
+        assert cache.prune(max_size=0) == len(keys)
+        assert cache._size() == 0
+        cache.clear()
+        assert cache.stats() == {}
+
+
+def cache_keys(cache) -> list[str]:
+    return [row[0] for row in cache._db.execute("SELECT key FROM responses")]
+
+
+def test_circuit_breaker(requests_mock, mock_lp_handle, tmp_path):
+    from ubuntu_lint.cache import ResponseCache
+    from ubuntu_lint.circuit import CircuitBreaker, CircuitBreakers
+
+    package = basic_changes_sru.get("Source")
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        status_code=503,
+    )
+
+    def lint(context: ubuntu_lint.Context) -> ubuntu_lint.LintException:
+        with pytest.raises(ubuntu_lint.LintException) as e:
+            ubuntu_lint.check_sru_version_string_breaks_upgrades(context)
+
+        return e.value
+
+    # After 3 failures, madison is no longer requested, and the lint check is
+    # skipped, by all the contexts sharing the circuit breakers.
+    breakers = CircuitBreakers(threshold=3, cooldown=60)
+    recording = Recording()
+    for _ in range(3):
+        e = lint(
+            ubuntu_lint.Context(
+                changes=basic_changes_sru, breakers=breakers, recording=recording
+            )
+        )
+        assert e.result == ubuntu_lint.LintResult.ERROR
+
+    # Failed responses are not recorded, to be replayed in place of data.
+    assert not recording.responses
+
+    context = ubuntu_lint.Context(changes=basic_changes_sru, breakers=breakers)
+    e = lint(context)
+    assert e.result == ubuntu_lint.LintResult.SKIP
+    assert "madison is unavailable" in e.reason
+    assert context.stats.remote_failures == {"madison": 1}
+    assert madison.call_count == 3
+
+    # Once the cool-down is over, madison is requested again, and an empty
+    # response for an unknown package is only cached for a short time.
+    breaker = breakers.get("madison")
+    assert breaker.opened_at is not None
+    breaker.opened_at -= 60
+    madison = requests_mock.get(
+        f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on",
+        text="",
+    )
+    with ResponseCache(str(tmp_path / "responses.sqlite")) as cache:
+        context = ubuntu_lint.Context(
+            changes=basic_changes_sru, breakers=breakers, response_cache=cache
+        )
+        e = lint(context)
+        assert e.result == ubuntu_lint.LintResult.FAIL
+        assert madison.call_count == 1
+        assert breaker.allow()
+
+        (ttl,) = cache._db.execute("SELECT ttl FROM responses").fetchone()
+        assert ttl == 5 * 60
+
+    # Once the cool-down is over, a single request probes the service, until it
+    # completes.
+    breaker = CircuitBreaker("madison", threshold=1, cooldown=60)
+    breaker.failure()
+    assert breaker.opened_at is not None
+    breaker.opened_at -= 60
+    assert breaker.allow()
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        assert not executor.submit(breaker.allow).result()
+    breaker.failure()
+    assert not breaker.allow()
+    breaker.opened_at -= 60
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.allow()
+    assert breaker.allow()
+
+    # Requests made by a probe to complete it, e.g. to look up the link to a
+    # series, are let through.
+    breakers = CircuitBreakers(threshold=1, cooldown=60)
+    breaker = breakers.get("launchpad")
+    breaker.failure()
+    assert breaker.opened_at is not None
+    breaker.opened_at -= 60
+    context = ubuntu_lint.Context(
+        changes=basic_changes_sru, launchpad_handle=mock_lp_handle, breakers=breakers
+    )
+    assert ubuntu_lint.linters._lp_has_bug_task(context, "1", "hello", "noble")
+    assert context.launchpad_links.lookup("series:noble") is not None
+    assert breaker.opened_at is None
+
+
+def test_runner_timeouts(tmp_path):
+    import ubuntu_lint.cli
+    from ubuntu_lint.cli import LinterConfiguration, Runner
+
+    release = threading.Event()
+
+    def check_fast(context: ubuntu_lint.Context):
+        pass
+
+    def check_hangs(context: ubuntu_lint.Context):
+        release.wait()
+        context.lint_fail("too late")
+
+    linters = [
+        LinterConfiguration(
+            name,
+            fn,
+            default_level_devel=ubuntu_lint.LintResult.FAIL,
+            default_level_stable=ubuntu_lint.LintResult.FAIL,
+            latency=latency,
+        )
+        for name, fn, latency in [
+            ("fast", check_fast, 0.0),
+            ("hangs", check_hangs, 1.0),
+            ("also-hangs", check_hangs, 2.0),
+        ]
+    ]
+    context = ubuntu_lint.Context(changes=basic_changes_no_ubuntu_delta)
+
+    # A linter which overruns its timeout is abandoned, and the next one gets
+    # its own time, while the results already known are kept.
+    runner = Runner(linters)
+    runner.set_timeouts({"hangs": 0.1, "also-hangs": 0.1})
+    start = time.monotonic()
+    status = runner.lint(context)
+    assert time.monotonic() - start < 5
+    assert status == 2
+    assert runner.outcome(status).results() == {
+        "fast": ubuntu_lint.LintResult.OK,
+        "hangs": ubuntu_lint.LintResult.TIMEOUT,
+        "also-hangs": ubuntu_lint.LintResult.TIMEOUT,
+    }
+    assert runner.results_json()["hangs"]["result"] == "TIMEOUT"
+    assert runner.results_json()["hangs"]["reason"].startswith("timed out after")
+
+    # Abandoned linters completing later do not change the results.
+    release.set()
+    time.sleep(0.05)
+    assert "findings" not in runner.results_json()["hangs"]
+    release.clear()
+
+    # With a deadline for the run, linters still running or waiting for a
+    # worker are abandoned, and the exit status follows the timeout policy.
+    runner = Runner(linters)
+    runner.deadline = 0.2
+    runner.on_timeout = "ignore"
+    status = runner.lint(context)
+    assert status == 0
+    assert runner.outcome(status).results() == {
+        "fast": ubuntu_lint.LintResult.OK,
+        "hangs": ubuntu_lint.LintResult.TIMEOUT,
+        "also-hangs": ubuntu_lint.LintResult.TIMEOUT,
+    }
+    assert runner.outcome(status)["also-hangs"].reason == (
+        "timed out before it started"
+    )
+    release.set()
+
+    with pytest.raises(ValueError):
+        runner.set_timeouts({"no-such-linter": 1.0})
+
+    # An abandoned lint check cannot be profiled.
+    for option in ("--timeout=1", "--deadline=1"):
+        with pytest.raises(ubuntu_lint.cli.UsageError):
+            ubuntu_lint.cli.run([f"--profile={tmp_path}", option], context)
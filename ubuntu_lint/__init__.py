@@ -3,6 +3,7 @@
 
 from .context import (
     Context,
+    Finding,
     LintException,
     LintResult,
     MissingContextException,
@@ -26,6 +27,7 @@ from .linters import (
 
 __all__ = [
     "Context",
+    "Finding",
     "LintException",
     "LintResult",
     "MissingContextException",
@@ -0,0 +1,332 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from typing import Any, Callable
+
+
+def cache_dir() -> str:
+    """
+    Return the directory for data cached on disk between runs, following the
+    XDG base directory specification, i.e. $XDG_CACHE_HOME/ubuntu-lint.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, "ubuntu-lint")
+
+
+class LaunchpadLinks:
+    """
+    Links to Launchpad objects which practically never change, such as the
+    main archive of Ubuntu and its series, keyed by what they were looked up
+    by. Once known, a link can be used in place of the object in API calls, or
+    loaded directly, saving the requests that looked it up.
+
+    If path is given, links are loaded from it, and saved back to it as they
+    are added, so that they are shared between runs.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.links: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if path is not None:
+            try:
+                with open(path, "r") as f:
+                    self.links = dict(json.load(f))
+            except (OSError, ValueError, TypeError):
+                pass
+
+    def lookup(self, key: str) -> str | None:
+        return self.links.get(key)
+
+    def add(self, key: str, link: str):
+        with self._lock:
+            self.links[key] = link
+
+            if self.path is not None:
+                self._save(self.path)
+
+    def get(self, key: str, fetch: Callable[[], str]) -> str:
+        """Return the link stored for key, calling fetch to look it up if needed."""
+        if (link := self.lookup(key)) is None:
+            link = fetch()
+            self.add(key, link)
+
+        return link
+
+    def _save(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-links-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.links, f, indent=4, sort_keys=True)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+# Time, in seconds, for which responses are kept in the response cache, by
+# remote operation, or else by remote service. Responses which are not to be
+# cached have no time.
+RESPONSE_TTL: dict[str, float] = {
+    "lp-series-url": 7 * 24 * 60 * 60,
+    # The publications created since a date are kept in the proposed index.
+    "lp-proposed-publications": 0,
+    # Bugs are looked up again on every run, as uploaders fix them, e.g. add a
+    # missing SRU template or release task, and lint again straight away.
+    "lp-bug-description": 0,
+    "lp-bug-exists": 0,
+    "lp-has-bug-task": 0,
+    "launchpad": 15 * 60,
+    "madison": 60 * 60,
+    "git-web": 15 * 60,
+}
+
+# Time, in seconds, for which negative responses, e.g. for a bug which does not
+# exist or is private, or a package unknown to madison, are kept at most, as
+# they are the most likely to change soon.
+NEGATIVE_TTL = 5 * 60
+
+# Default maximum size of the response cache, in bytes.
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+
+# Number of least recently used responses looked up at a time for eviction.
+EVICT_BATCH = 64
+
+
+class ResponseCache:
+    """
+    Responses from remote services, as returned by Context.remote, kept in an
+    SQLite database so that they are shared between runs and processes. A
+    response is served from the cache for the time given in RESPONSE_TTL for
+    its operation or service, and fetched again after that.
+
+    Negative responses are kept for NEGATIVE_TTL at most.
+
+    Responses are grouped by kind, i.e. service and operation, e.g.
+    madison/http-get, for statistics. Whenever the responses add up to more
+    than max_size bytes, the least recently used ones are evicted. Their total
+    size is kept up to date by triggers, so that it is not summed up again
+    whenever a response is stored.
+    """
+
+    # Version of the database schema. Databases with another version are
+    # emptied, rather than migrated.
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._db:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS responses")
+                self._db.execute("DROP TABLE IF EXISTS counters")
+                self._db.execute("DROP TABLE IF EXISTS totals")
+                self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, kind TEXT, value TEXT, size INTEGER, "
+                "created REAL, accessed REAL, ttl REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                "kind TEXT PRIMARY KEY, hits INTEGER, misses INTEGER)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS totals (size INTEGER)")
+            self._db.execute(
+                "INSERT INTO totals SELECT 0 WHERE NOT EXISTS (SELECT * FROM totals)"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT "
+                "ON responses BEGIN UPDATE totals SET size = size + new.size; END"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size "
+                "ON responses BEGIN "
+                "UPDATE totals SET size = size - old.size + new.size; END"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE "
+                "ON responses BEGIN UPDATE totals SET size = size - old.size; END"
+            )
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def ttl(service: str, op: str) -> float:
+        return RESPONSE_TTL.get(op, RESPONSE_TTL.get(service, 0))
+
+    def _count(self, kind: str, hits: int, misses: int):
+        self._db.execute(
+            "INSERT INTO counters VALUES (?, ?, ?) ON CONFLICT (kind) DO UPDATE "
+            "SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+            (kind, hits, misses),
+        )
+
+    def get(self, service: str, op: str, key: str) -> Any:
+        """
+        Return the cached response for key, fetched by op from service. Raises
+        KeyError if there is no such response, or if it has expired.
+        """
+        if not self.ttl(service, op):
+            raise KeyError(key)
+
+        kind = f"{service}/{op}"
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value, created, ttl FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > row[2]:
+                row = None
+                self._count(kind, 0, 1)
+            else:
+                self._db.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                )
+                self._count(kind, 1, 0)
+
+        if row is None:
+            raise KeyError(key)
+
+        return json.loads(row[0])
+
+    def put(self, service: str, op: str, key: str, value: Any, negative: bool = False):
+        """
+        Store the response for key, evicting others if the cache is full. If
+        negative is set, the response is only kept for NEGATIVE_TTL at most.
+        """
+        if not (ttl := self.ttl(service, op)):
+            return
+
+        if negative:
+            ttl = min(ttl, NEGATIVE_TTL)
+
+        data = json.dumps(value, separators=(",", ":"))
+        now = time.time()
+        with self._lock, self._db:
+            # Replaced responses are updated rather than deleted, which would
+            # not fire the delete trigger.
+            self._db.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET kind = excluded.kind, "
+                "value = excluded.value, size = excluded.size, "
+                "created = excluded.created, accessed = excluded.accessed, "
+                "ttl = excluded.ttl",
+                (key, f"{service}/{op}", data, len(key) + len(data), now, now, ttl),
+            )
+            self._evict(self.max_size)
+
+    def _evict(self, max_size: int) -> int:
+        evicted = 0
+        while (size := self._size()) > max_size:
+            batch = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT ?",
+                (EVICT_BATCH,),
+            ).fetchall()
+            if not batch:
+                break
+
+            for key, entry_size in batch:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                evicted += 1
+                size -= entry_size
+                if size <= max_size:
+                    break
+
+        return evicted
+
+    def _size(self) -> int:
+        return self._db.execute("SELECT size FROM totals").fetchone()[0]
+
+    def prune(self, max_age: float | None = None, max_size: int | None = None) -> int:
+        """
+        Remove the responses which were not used for max_age seconds, and then
+        the least recently used ones until the rest take at most max_size
+        bytes. Return the number of responses removed.
+        """
+        removed = 0
+        with self._lock, self._db:
+            if max_age is not None:
+                removed += self._db.execute(
+                    "DELETE FROM responses WHERE accessed < ?",
+                    (time.time() - max_age,),
+                ).rowcount
+
+            if max_size is not None:
+                removed += self._evict(max_size)
+
+        return removed
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+            self._db.execute("DELETE FROM counters")
+
+        self._db.execute("VACUUM")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return, for each kind of response, the number of entries, their size in
+        bytes, the number of cache hits and misses, and the age of the oldest
+        and newest entries, in seconds.
+        """
+        now = time.time()
+        ret: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for kind, entries, size, oldest, newest in self._db.execute(
+                "SELECT kind, COUNT(*), SUM(size), MIN(created), MAX(created) "
+                "FROM responses GROUP BY kind"
+            ):
+                ret[kind] = {
+                    "entries": entries,
+                    "bytes": size,
+                    "hits": 0,
+                    "misses": 0,
+                    "oldest": round(now - oldest, 3),
+                    "newest": round(now - newest, 3),
+                }
+
+            for kind, hits, misses in self._db.execute(
+                "SELECT kind, hits, misses FROM counters"
+            ):
+                entry = ret.setdefault(
+                    kind,
+                    {"entries": 0, "bytes": 0, "oldest": None, "newest": None},
+                )
+                entry["hits"] = hits
+                entry["misses"] = misses
+
+        for entry in ret.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_ratio"] = round(entry["hits"] / lookups, 4) if lookups else None
+
+        return dict(sorted(ret.items()))
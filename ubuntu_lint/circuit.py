@@ -0,0 +1,88 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Tracks the failures of requests to a remote service. After threshold
+    consecutive failures, the circuit opens, and requests to the service are
+    refused for cooldown seconds instead of each waiting to fail in turn. Once
+    the cool-down is over, the circuit is half-open: a single request is let
+    through to probe the service, and the circuit closes if it succeeds, or
+    opens again if it fails. Other requests are refused meanwhile, or until
+    another cool-down is over if the probe never completes, except those made
+    by the thread of the probe to complete it, e.g. to look up a link it needs.
+    """
+
+    def __init__(self, service: str, threshold: int = 3, cooldown: float = 60.0):
+        self.service = service
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._prober: int | None = None
+        self._lock = threading.Lock()
+
+    def retry_in(self) -> float:
+        """Return the time until requests are let through again, in seconds."""
+        if (opened_at := self.opened_at) is None:
+            return 0.0
+
+        return max(opened_at + self.cooldown - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+
+            # Requests made within the probe, which is waiting for them.
+            if self._prober == threading.get_ident():
+                return True
+
+            if self.retry_in() > 0.0:
+                return False
+
+            # Let this request probe the service, and refuse others until it
+            # completes.
+            self.opened_at = time.monotonic()
+            self._prober = threading.get_ident()
+            return True
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._prober = None
+
+    def failure(self):
+        with self._lock:
+            self._prober = None
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """
+    The circuit breakers of the remote services, e.g. launchpad, madison and
+    git-web, created as they are first used. Contexts which share them, e.g.
+    the jobs of a server, stop requesting a service that is down together.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service: str) -> CircuitBreaker:
+        with self._lock:
+            if (breaker := self.breakers.get(service)) is None:
+                breaker = self.breakers[service] = CircuitBreaker(
+                    service, self.threshold, self.cooldown
+                )
+
+        return breaker
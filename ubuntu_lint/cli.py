@@ -2,12 +2,52 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 import argparse
+import concurrent.futures
+import contextlib
+import copy
+import datetime
+import functools
+import glob
+import importlib.metadata
 import json
+import math
 import os
+import queue
 import sys
+import threading
+import time
 import ubuntu_lint
 
-from typing import Callable, Sequence, Any
+from typing import (
+    IO,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    NoReturn,
+    Sequence,
+    Any,
+)
+from ubuntu_lint.cache import (
+    DEFAULT_MAX_SIZE,
+    LaunchpadLinks,
+    ResponseCache,
+    cache_dir,
+)
+from ubuntu_lint.circuit import CircuitBreakers
+from ubuntu_lint.madison import MadisonTable
+from ubuntu_lint.context import VersionContext
+from ubuntu_lint.metrics import Metrics
+from ubuntu_lint.profiling import Profiler
+from ubuntu_lint.proposed import ProposedIndexes
+from ubuntu_lint.recording import Recording
+from ubuntu_lint.stats import LatencyHistory, LinterStats, Stats
+from ubuntu_lint.sweep import (
+    SweepReport,
+    max_versions_from_sources,
+    suite_from_path,
+    sweep,
+)
 
 try:
     from termcolor import colored
@@ -55,11 +95,26 @@ def format_result(msg: str, result: ubuntu_lint.LintResult):
             return format_error(msg)
         case ubuntu_lint.LintResult.FAIL:
             return format_error(msg)
+        case ubuntu_lint.LintResult.TIMEOUT:
+            return format_error(msg)
 
     return msg
 
 
+# Cost classes of linters: those which only run locally, and those which make
+# requests to remote services, and cannot run offline.
+COST_CPU = "cpu"
+COST_NETWORK = "network"
+
+
 class LinterConfiguration:
+    """
+    A linter, its default levels and what it requires to run. services lists
+    the remote services it may make requests to (launchpad, madison, git-web),
+    and latency is its typical wall time, in seconds, which is used to
+    schedule it unless a latency was learned from previous runs.
+    """
+
     def __init__(
         self,
         name: str,
@@ -68,6 +123,8 @@ class LinterConfiguration:
         default_level_stable: ubuntu_lint.LintResult | None,
         level: ubuntu_lint.LintResult | None = None,
         requires: set[str] = set(),
+        services: set[str] = set(),
+        latency: float = 0.0,
     ):
         self.name = name
         self.fn = fn
@@ -75,6 +132,12 @@ class LinterConfiguration:
         self.default_level_devel = default_level_devel
         self.default_level_stable = default_level_stable
         self.requires = requires
+        self.services = services
+        self.latency = latency
+
+    @property
+    def cost(self) -> str:
+        return COST_NETWORK if self.services else COST_CPU
 
     def get_level(self, is_stable: bool) -> ubuntu_lint.LintResult | None:
         if self.level is not None:
@@ -99,6 +162,8 @@ all_linters = [
         default_level_devel=ubuntu_lint.LintResult.FAIL,
         default_level_stable=ubuntu_lint.LintResult.FAIL,
         requires={"changes"},
+        services={"git-web"},
+        latency=0.5,
     ),
     LinterConfiguration(
         name="missing-bug-references",
@@ -127,6 +192,8 @@ all_linters = [
         default_level_devel=ubuntu_lint.LintResult.WARN,
         default_level_stable=ubuntu_lint.LintResult.FAIL,
         requires={"changes"},
+        services={"launchpad"},
+        latency=2.0,
     ),
     LinterConfiguration(
         name="missing-ubuntu-maintainer",
@@ -140,18 +207,24 @@ all_linters = [
         fn=ubuntu_lint.check_sru_bug_missing_template,
         default_level_devel=None,
         default_level_stable=ubuntu_lint.LintResult.WARN,
+        services={"launchpad"},
+        latency=1.5,
     ),
     LinterConfiguration(
         name="sru-bug-missing-release-tasks",
         fn=ubuntu_lint.check_sru_bug_missing_release_tasks,
         default_level_devel=None,
         default_level_stable=ubuntu_lint.LintResult.WARN,
+        services={"launchpad"},
+        latency=2.0,
     ),
     LinterConfiguration(
         name="sru-version-string-breaks-upgrades",
         fn=ubuntu_lint.check_sru_version_string_breaks_upgrades,
         default_level_devel=None,
         default_level_stable=ubuntu_lint.LintResult.WARN,
+        services={"madison"},
+        latency=1.0,
     ),
     LinterConfiguration(
         name="sru-version-string-convention",
@@ -159,6 +232,8 @@ all_linters = [
         default_level_devel=None,
         default_level_stable=ubuntu_lint.LintResult.WARN,
         requires={"changelog"},
+        services={"madison"},
+        latency=1.0,
     ),
     LinterConfiguration(
         name="release-mismatch",
@@ -180,19 +255,295 @@ all_linters = [
         requires={"changelog", "changes"},
     ),
 ]
+
+# Entry point group in which other packages register their linters.
+PLUGIN_GROUP = "ubuntu_lint.linters"
+
+_plugin_lock = threading.Lock()
+
+
+class PluginError(Exception):
+    """Raised in place of a plugin linter which could not be loaded."""
+
+
+def _raise_plugin_error(error: PluginError, context: ubuntu_lint.Context):
+    raise error
+
+
+class PluginLinterConfiguration(LinterConfiguration):
+    """
+    A linter registered by another package, through an entry point in the
+    ubuntu_lint.linters group, named after the linter. The entry point refers
+    to a LinterConfiguration, or to the linter function itself, which then
+    warns by default, in both development and stable releases.
+
+    Only the name and level of the linter are known up front. Its module is
+    imported, and the rest of its configuration loaded from it, the first time
+    it is needed, so that plugins which are turned off cost nothing. As the
+    default levels are part of that configuration, a plugin left at its
+    default level is loaded to find out whether it runs at all.
+
+    A plugin which cannot be loaded does not abort the run: it runs as a
+    linter which raises PluginError, so that it is reported as an error.
+    """
+
+    def __init__(self, entry_point: importlib.metadata.EntryPoint):
+        self.name = entry_point.name
+        self.level = None
+        self.entry_point = entry_point
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes which are not set yet, i.e. before the
+        # configuration is loaded.
+        if attr.startswith("__") or attr == "entry_point":
+            raise AttributeError(attr)
+
+        self._load()
+
+        return object.__getattribute__(self, attr)
+
+    def _load(self):
+        with _plugin_lock:
+            if "fn" in self.__dict__:
+                return
+
+            try:
+                loaded = self.entry_point.load()
+            except Exception as e:
+                loaded = PluginError(f"failed to load {self.entry_point.value}: {e}")
+
+            if isinstance(loaded, LinterConfiguration):
+                config = loaded
+            else:
+                if not callable(loaded):
+                    loaded = PluginError(
+                        f"{self.entry_point.value} is not a linter or "
+                        "LinterConfiguration"
+                    )
+
+                if isinstance(loaded, PluginError):
+                    loaded = functools.partial(_raise_plugin_error, loaded)
+
+                config = LinterConfiguration(
+                    name=self.name,
+                    fn=loaded,
+                    default_level_devel=ubuntu_lint.LintResult.WARN,
+                    default_level_stable=ubuntu_lint.LintResult.WARN,
+                )
+
+            self.default_level_devel = config.default_level_devel
+            self.default_level_stable = config.default_level_stable
+            self.requires = config.requires
+            self.services = config.services
+            self.latency = config.latency
+            self.fn = config.fn
+
+
+def plugin_linters(
+    entry_points: Iterable[importlib.metadata.EntryPoint] | None = None,
+) -> list[LinterConfiguration]:
+    """
+    Return the linters registered in the ubuntu_lint.linters entry point group,
+    or in entry_points if given, without loading them. Built-in linters take
+    precedence over plugins of the same name.
+    """
+    if entry_points is None:
+        entry_points = importlib.metadata.entry_points(group=PLUGIN_GROUP)
+
+    builtin = {linter.name for linter in all_linters}
+
+    return [
+        PluginLinterConfiguration(entry_point)
+        for entry_point in entry_points
+        if entry_point.name not in builtin
+    ]
+
+
+all_linters += plugin_linters()
 all_linters_by_name = {linter.name: linter for linter in all_linters}
 
 
+class LinterOutcome:
+    """
+    The outcome of one lint check in a run: its result, after applying the
+    configured level, the reason for it, its findings and its statistics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        result: ubuntu_lint.LintResult,
+        reason: str,
+        findings: list[ubuntu_lint.Finding],
+        stats: LinterStats,
+    ):
+        self.name = name
+        self.result = result
+        self.reason = reason
+        self.findings = findings
+        self.stats = stats
+
+    def __repr__(self) -> str:
+        return f"LinterOutcome({self.name!r}, {self.result})"
+
+
+class Outcome:
+    """
+    The outcome of a run of ubuntu-lint, as returned by run: the status it
+    would exit with, the outcome of each lint check that ran, by name, and the
+    statistics of the context.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        linters: dict[str, LinterOutcome],
+        stats: Stats,
+    ):
+        self.status = status
+        self.linters = linters
+        self.stats = stats
+
+    def __getitem__(self, name: str) -> LinterOutcome:
+        return self.linters[name]
+
+    def results(self) -> dict[str, ubuntu_lint.LintResult]:
+        """Return the result of each lint check, by name."""
+        return {name: linter.result for name, linter in self.linters.items()}
+
+
+# Exit status of a run for lint checks which time out, by --on-timeout policy.
+TIMEOUT_STATUS = {"ignore": 0, "fail": 1, "error": 2}
+
+# Interval, in seconds, at which lint checks waiting for a worker are checked
+# on, to time them out once they start.
+TIMEOUT_POLL_INTERVAL = 0.1
+
+
+class _Workers:
+    """
+    A pool of daemon threads running functions in the order they are submitted,
+    like a ThreadPoolExecutor. Unlike those of an executor, its threads do not
+    hold up the exit of the process, so that a function which overruns its
+    deadline can be abandoned: its thread is replaced, and exits once the
+    function returns, if ever. The time each function started is in started.
+    """
+
+    def __init__(self, jobs: int):
+        self.started: dict[concurrent.futures.Future, float] = {}
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._abandoned: set[concurrent.futures.Future] = set()
+        self._lock = threading.Lock()
+        self._threads = 0
+
+        for _ in range(jobs):
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            self._threads += 1
+
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((future, fn, args))
+
+        return future
+
+    def abandon(self, future: concurrent.futures.Future):
+        """
+        Stop waiting for future: cancel it if it has not started, or else
+        replace the thread running it.
+        """
+        if future.cancel():
+            return
+
+        with self._lock:
+            if future.done():
+                return
+
+            self._abandoned.add(future)
+
+        self._start()
+
+    def shutdown(self):
+        """Stop the threads once they have run the functions submitted."""
+        with self._lock:
+            threads = self._threads
+
+        for _ in range(threads):
+            self._queue.put(None)
+
+    def _work(self):
+        while (task := self._queue.get()) is not None:
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            self.started[future] = time.monotonic()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+            with self._lock:
+                if future in self._abandoned:
+                    self._threads -= 1
+                    return
+
+
 class Runner:
-    def __init__(self):
-        self._checks_by_name: dict = {linter.name: linter for linter in all_linters}
-        self._results: dict[ubuntu_lint.LintResult, list[tuple[str, str]]] = {}
+    def __init__(self, linters: list[LinterConfiguration] | None = None):
+        # Levels are set on copies, so that runners can be configured
+        # independently of each other.
+        self._checks_by_name: dict = {
+            linter.name: copy.copy(linter)
+            for linter in (all_linters if linters is None else linters)
+        }
+        self._results: dict[
+            ubuntu_lint.LintResult, list[tuple[str, str, LinterStats]]
+        ] = {}
+        self._stats: Stats | None = None
+        self._findings: dict[str, list[ubuntu_lint.Finding]] = {}
+        self._counts: dict[ubuntu_lint.LintResult, int] = {}
+        self._timed_out: set[str] = set()
 
         self.changes_file: str | None = None
         self.debian_changelog: str | None = None
         self.source_dir: str | None = None
         self.verbose: bool = False
         self.print_json: bool = False
+        self.print_json_lines: bool = False
+        self.print_timings: bool = False
+        self.profile_dir: str | None = None
+        self.profiler: Profiler | None = None
+        self.metrics_file: str | None = None
+        self.metrics_format: str = "prometheus"
+        self.metrics: Metrics | None = None
+        self.record_file: str | None = None
+        self.replay_file: str | None = None
+        self.replay_latency: float | None = 0.0
+        self.bundle_file: str | None = None
+        self.madison_table_file: str | None = None
+        self.use_proposed_index: bool = False
+        self.persistent_cache: bool = False
+        self.cache_max_size: int = DEFAULT_MAX_SIZE
+        self.jobs: int = 1
+        self.offline: bool = False
+        self.latency_file: str | None = None
+        self.latencies: LatencyHistory | None = None
+        self.timeout: float | None = None
+        self.timeouts: dict[str, float] = {}
+        self.deadline: float | None = None
+        self.on_timeout: str = "error"
+
+    def profile(self, name: str) -> ContextManager[None]:
+        """Profile the with block if profiling is enabled."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+
+        return self.profiler.profile(name)
 
     def set_linter_level(
         self,
@@ -202,7 +553,7 @@ class Runner:
         """Configure a linter on the runner."""
 
         if name not in self._checks_by_name:
-            self._checks_by_name[name] = all_linters_by_name[name]
+            self._checks_by_name[name] = copy.copy(all_linters_by_name[name])
 
         if level == "off":
             try:
@@ -218,9 +569,84 @@ class Runner:
         for name in list(self._checks_by_name):
             self.set_linter_level(name, level)
 
+    def set_levels(self, levels: dict[str, str]):
+        """
+        Set the level of each linter in levels, by name or "all", in order,
+        like the command line flags. Raises ValueError if a linter or level is
+        unknown.
+        """
+        for name, level in levels.items():
+            if name != "all" and name not in all_linters_by_name:
+                raise ValueError(f"unknown linter: {name}")
+            if level not in ("auto", "off", "warn", "fail"):
+                raise ValueError(f"invalid level for {name}: {level}")
+
+            if name == "all":
+                self.set_level_all(level)
+            else:
+                self.set_linter_level(name, level)
+
+    def set_timeouts(self, timeouts: dict[str, float]):
+        """
+        Set the time after which each linter in timeouts, by name or "all", is
+        abandoned, in order. Raises ValueError if a linter is unknown.
+        """
+        for name, timeout in timeouts.items():
+            if name == "all":
+                self.timeout = timeout
+            elif name in all_linters_by_name or name in self._checks_by_name:
+                self.timeouts[name] = timeout
+            else:
+                raise ValueError(f"unknown linter: {name}")
+
     def run(self, context: ubuntu_lint.Context) -> int:
         """Run the configured linters with the given context."""
+        start = time.perf_counter()
+        ret = self.lint(
+            context, progress=not (self.print_json or self.print_json_lines)
+        )
+
+        if self.print_json_lines:
+            self.print_summary_line(ret, time.perf_counter() - start)
+        else:
+            self.print_summary()
+
+        if self.profiler is not None:
+            self.profiler.print_summary()
+
+        self.finish(context)
+
+        return ret
+
+    def finish(self, context: ubuntu_lint.Context):
+        """
+        Write the metrics, the recording and the learned latencies of a run, if
+        configured.
+        """
+        if self.latencies is not None and self.latencies.path is not None:
+            self.latencies.save()
+
+        if self.metrics is not None:
+            self.metrics.observe_run(context.stats)
+
+            if self.metrics_file:
+                self.metrics.update(
+                    self.metrics_file,
+                    openmetrics=self.metrics_format == "openmetrics",
+                )
+
+        if self.record_file and context.recording is not None:
+            context.recording.save(self.record_file)
+
+    def lint(self, context: ubuntu_lint.Context, progress: bool = False) -> int:
+        """
+        Run the configured linters with the given context, collecting their
+        results, and return the exit status. If progress is set, print each
+        linter as it runs and its result. With print_json_lines, each result is
+        printed as a JSON line as soon as the linter completes instead.
+        """
         ret = 0
+        self._stats = context.stats
 
         context_sources = set()
         try:
@@ -235,6 +661,7 @@ class Runner:
         except ubuntu_lint.MissingContextException:
             pass
 
+        linters = []
         for name, linter in self._checks_by_name.items():
             level = linter.get_level(context.is_stable_release())
             if level is None:
@@ -243,54 +670,354 @@ class Runner:
             if not linter.requires <= context_sources:
                 continue
 
-            result = ubuntu_lint.LintResult.OK
-            msg: str = ""
-            if not self.print_json:
-                print(f"Running {name}...", end="", flush=True)
-            try:
-                linter.fn(context)
-            except ubuntu_lint.LintException as e:
-                result = e.result
+            if self.offline and linter.cost == COST_NETWORK:
+                continue
 
-                # If the level for this check was explicitly configured,
-                # downgrade the level if needed.
-                if level.value < result.value:
-                    result = level
+            linters.append((name, linter, level))
+
+        # Cheap linters run, and are reported, first, so that their results
+        # come early rather than after those waiting on the network.
+        linters.sort(key=lambda entry: self.expected_latency(entry[1]))
+
+        deadline: float | None = None
+        if self.deadline is not None:
+            deadline = time.monotonic() + self.deadline
+
+        # Linters run in worker threads if several run at once, or if they may
+        # have to be abandoned, which is only possible in a thread.
+        workers: _Workers | None = None
+        futures: list[concurrent.futures.Future] = []
+        if self.jobs > 1 or deadline is not None or self.timeout or self.timeouts:
+            workers = _Workers(self.jobs)
+
+            # With several jobs, all linters are started at once, the most
+            # expensive ones first so that they do not end up holding up the
+            # run, and their results are reported in order as they complete.
+            submit_order: Iterable[int] = range(len(linters))
+            if self.jobs > 1:
+                submit_order = reversed(range(len(linters)))
+
+            by_index = {}
+            for i in submit_order:
+                name, linter, level = linters[i]
+                by_index[i] = workers.submit(
+                    self.run_linter, context, name, linter, level
+                )
+            futures = [by_index[i] for i in range(len(linters))]
+
+        order: Iterable[tuple[int, bool]] = ((i, False) for i in range(len(linters)))
+        if workers is not None:
+            order = self._completed(
+                workers,
+                futures,
+                [self.linter_timeout(name) for name, _, _ in linters],
+                deadline,
+                in_order=not self.print_json_lines,
+            )
 
-                msg = str(e)
-                if level == ubuntu_lint.LintResult.FAIL and ret <= 0:
+        try:
+            for i, timed_out in order:
+                name, linter, level = linters[i]
+
+                if progress:
+                    print(f"Running {name}...", end="", flush=True)
+
+                if timed_out:
+                    assert workers is not None
+                    result, msg, stats, status = self._abandon(
+                        workers, futures[i], name
+                    )
+                elif futures:
+                    result, msg, stats, status = futures[i].result()
+                else:
+                    result, msg, stats, status = self.run_linter(
+                        context, name, linter, level
+                    )
+
+                if status == 1 and ret <= 0:
                     ret = 1
+                elif status == 2:
+                    ret = 2
 
-            except ubuntu_lint.MissingContextException as e:
-                if linter.is_auto():
-                    result = ubuntu_lint.LintResult.SKIP
+                self._counts[result] = self._counts.get(result, 0) + 1
+
+                if self.latencies is not None:
+                    # A linter which timed out took at least as long as it ran.
+                    if result == ubuntu_lint.LintResult.TIMEOUT:
+                        if stats.wall_time > 0:
+                            self.latencies.observe(name, stats.wall_time)
+                    elif status != 2 and result != ubuntu_lint.LintResult.SKIP:
+                        self.latencies.observe(name, stats.wall_time)
+
+                if self.print_json_lines:
+                    # Results are not kept, so that memory use does not grow
+                    # with the number of linters.
+                    line = {"type": "linter", "linter": name}
+                    line.update(self._result_json(name, result, msg, stats))
+                    print(json.dumps(line), flush=True)
+                    self._findings.pop(name, None)
                 else:
-                    result = ubuntu_lint.LintResult.ERROR
-                    ret = 2
+                    try:
+                        self._results[result].append((name, msg, stats))
+                    except KeyError:
+                        self._results[result] = [(name, msg, stats)]
 
-                msg = str(e)
+                if self.metrics is not None:
+                    self.metrics.observe_linter(stats, result)
 
-            try:
-                self._results[result].append((name, msg))
-            except KeyError:
-                self._results[result] = [(name, msg)]
+                if progress:
+                    print(format_result(result.name, result))
+        finally:
+            if workers is not None:
+                workers.shutdown()
 
-            if not self.print_json:
-                print(format_result(result.name, result))
+        return ret
 
-        self.print_summary()
+    def expected_latency(self, linter: LinterConfiguration) -> float:
+        """
+        Return the expected wall time of linter: its latency learned from
+        previous runs if known, otherwise its typical latency.
+        """
+        if self.latencies is not None:
+            if (latency := self.latencies.get(linter.name)) is not None:
+                return latency
 
-        return ret
+        return linter.latency
+
+    def linter_timeout(self, name: str) -> float | None:
+        """Return the time after which the linter name is abandoned, if any."""
+        return self.timeouts.get(name, self.timeout)
+
+    def _completed(
+        self,
+        workers: _Workers,
+        futures: list[concurrent.futures.Future],
+        timeouts: list[float | None],
+        deadline: float | None,
+        in_order: bool,
+    ) -> Iterator[tuple[int, bool]]:
+        """
+        Yield the index of each of futures as it completes, or as it overruns,
+        along with whether it did: the future at index i overruns timeouts[i]
+        seconds after it started, or at deadline, a time.monotonic() value,
+        whichever comes first. If in_order is set, the futures are yielded in
+        order, otherwise as they complete.
+        """
+        pending = list(range(len(futures)))
+        while pending:
+            waiting = pending[:1] if in_order else pending
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                # Those which have not started yet are not to start anymore.
+                for i in pending:
+                    futures[i].cancel()
+
+            limits: dict[int, float] = {}
+            not_started = False
+            for i in waiting:
+                limit = deadline
+                if (seconds := timeouts[i]) is not None:
+                    if (started := workers.started.get(futures[i])) is None:
+                        not_started = True
+                    else:
+                        limit = min(limit or math.inf, started + seconds)
+                if limit is not None:
+                    limits[i] = limit
+
+            done = [
+                i for i in waiting if futures[i].done() and not futures[i].cancelled()
+            ]
+            overrun = [
+                i
+                for i in waiting
+                if futures[i].cancelled()
+                or (i not in done and limits.get(i, now + 1) <= now)
+            ]
+            for i in done + overrun:
+                pending.remove(i)
+                yield i, i in overrun
+
+            if done or overrun:
+                continue
+
+            # Futures which have not started yet have no time limit of their
+            # own yet, so check on them regularly until they do.
+            timeout = min(limits.values(), default=None)
+            if timeout is not None:
+                timeout -= now
+            if not_started:
+                timeout = min(timeout or TIMEOUT_POLL_INTERVAL, TIMEOUT_POLL_INTERVAL)
+
+            concurrent.futures.wait(
+                [futures[i] for i in waiting],
+                timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+    def _abandon(
+        self,
+        workers: _Workers,
+        future: concurrent.futures.Future,
+        name: str,
+    ) -> tuple[ubuntu_lint.LintResult, str, LinterStats, int]:
+        """
+        Abandon the linter name, run by future, which overran its deadline, and
+        return its result like run_linter.
+        """
+        started = workers.started.get(future)
+        workers.abandon(future)
+
+        # The linter may still complete, but its findings are not reported.
+        self._timed_out.add(name)
+        self._findings.pop(name, None)
+
+        stats = LinterStats(name)
+        if started is None:
+            msg = "timed out before it started"
+        else:
+            stats.wall_time = time.monotonic() - started
+            msg = f"timed out after {stats.wall_time:.1f}s"
+
+        return (
+            ubuntu_lint.LintResult.TIMEOUT,
+            msg,
+            stats,
+            TIMEOUT_STATUS[self.on_timeout],
+        )
+
+    def run_linter(
+        self,
+        context: ubuntu_lint.Context,
+        name: str,
+        linter: LinterConfiguration,
+        level: ubuntu_lint.LintResult,
+    ) -> tuple[ubuntu_lint.LintResult, str, LinterStats, int]:
+        """
+        Run a linter, and return its result, the reason for it, its statistics,
+        and the exit status it calls for: 1 if it failed, 2 if it could not run,
+        0 otherwise.
+        """
+        result = ubuntu_lint.LintResult.OK
+        msg: str = ""
+        status = 0
+        try:
+            with context.stats.linter(name) as stats, self.profile(name):
+                linter.fn(context)
+        except ubuntu_lint.LintException as e:
+            result = e.result
+
+            # If the level for this check was explicitly configured,
+            # downgrade the level if needed.
+            if level.value < result.value:
+                result = level
+
+            msg = str(e)
+            if level == ubuntu_lint.LintResult.FAIL:
+                status = 1
+
+            if name not in self._timed_out:
+                self._findings[name] = [
+                    ubuntu_lint.Finding(
+                        f.reason, min(f.result, level, key=lambda r: r.value)
+                    )
+                    for f in e.findings
+                ]
+
+        except ubuntu_lint.MissingContextException as e:
+            if linter.is_auto():
+                result = ubuntu_lint.LintResult.SKIP
+            else:
+                result = ubuntu_lint.LintResult.ERROR
+                status = 2
+
+            msg = str(e)
+
+        except PluginError as e:
+            result = ubuntu_lint.LintResult.ERROR
+            status = 2
+            msg = str(e)
+
+        return result, msg, stats, status
+
+    def outcome(self, status: int) -> "Outcome":
+        """Return the results collected so far, and the given exit status."""
+        linters: dict[str, LinterOutcome] = {}
+        for result, results in self._results.items():
+            for name, msg, stats in results:
+                linters[name] = LinterOutcome(
+                    name, result, msg, self._findings.get(name, []), stats
+                )
+
+        return Outcome(status, linters, self._stats or Stats())
+
+    def results_json(self) -> dict[str, Any]:
+        """Return the results collected so far, as printed by --json."""
+        output: dict[str, Any] = {}
+
+        for level, results in self._results.items():
+            for name, msg, linter_stats in results:
+                output[name] = self._result_json(name, level, msg, linter_stats)
+
+        return output
+
+    def _result_json(
+        self,
+        name: str,
+        result: ubuntu_lint.LintResult,
+        msg: str,
+        stats: LinterStats,
+    ) -> dict[str, Any]:
+        output: dict[str, Any] = {"result": result.name}
+        if result != ubuntu_lint.LintResult.OK:
+            output["reason"] = msg
+        if name in self._findings:
+            output["findings"] = [
+                {"result": f.result.name, "reason": f.reason}
+                for f in self._findings[name]
+            ]
+        output["stats"] = stats.to_dict()
+
+        return output
+
+    def _timings_json(self, stats: Stats) -> dict[str, Any]:
+        return {
+            "phases": {
+                phase: round(elapsed, 6) for phase, elapsed in stats.phases.items()
+            },
+            "network_time": round(stats.network_time, 6),
+            "requests": dict(stats.requests),
+            "cache_hits": stats.cache_hits,
+            "cache_misses": stats.cache_misses,
+        }
+
+    def print_summary_line(self, status: int, wall_time: float):
+        """Print the summary of the run as the last line of --json-lines."""
+        output: dict[str, Any] = {
+            "type": "summary",
+            "status": status,
+            "results": {
+                level.name: self._counts.get(level, 0)
+                for level in ubuntu_lint.LintResult
+            },
+            "wall_time": round(wall_time, 6),
+        }
+
+        if self.print_timings and self._stats is not None:
+            output["timings"] = self._timings_json(self._stats)
+
+        print(json.dumps(output), flush=True)
 
     def print_summary(self):
         if self.print_json:
-            output = {}
+            output = self.results_json()
 
-            for level, results in self._results.items():
-                for name, msg in results:
-                    output[name] = {"result": level.name}
-                    if level != ubuntu_lint.LintResult.OK:
-                        output[name]["reason"] = msg
+            # Kept apart from the results, which are keyed by linter name.
+            if self.print_timings and self._stats is not None:
+                output = {
+                    "results": output,
+                    "timings": self._timings_json(self._stats),
+                }
 
             print(json.dumps(output, indent=4))
             return
@@ -312,8 +1039,12 @@ class Runner:
             else:
                 print(format_result(f"\n{level.name}: {num} issues", level))
 
-            for name, msg in results:
-                print(f"    {name}: {msg}")
+            for name, msg, _ in results:
+                if len(self._findings.get(name, [])) > 1:
+                    for finding in self._findings[name]:
+                        print(f"    {name}: {finding.reason}")
+                else:
+                    print(f"    {name}: {msg}")
 
         stats = []
         for level in ubuntu_lint.LintResult:
@@ -323,6 +1054,46 @@ class Runner:
 
         print(f"\nSummary: ran {ran} lint checks ({short})")
 
+        if self.print_timings:
+            self.print_timings_table()
+
+    def print_timings_table(self):
+        all_stats = [
+            stats for results in self._results.values() for *_, stats in results
+        ]
+        all_stats.sort(key=lambda stats: stats.wall_time, reverse=True)
+
+        width = max([len(stats.name) for stats in all_stats] + [len("linter")])
+
+        print("\nTimings:")
+        print(
+            f"    {'linter':<{width}}  {'wall':>9}  {'network':>9}  {'parse':>9}  "
+            f"{'requests':>8}  {'cache':>9}"
+        )
+        for stats in all_stats:
+            cache = f"{stats.cache_hits}/{stats.cache_misses}"
+            print(
+                f"    {stats.name:<{width}}  {stats.wall_time:>8.3f}s  "
+                f"{stats.network_time:>8.3f}s  {stats.parse_time:>8.3f}s  "
+                f"{stats.num_requests:>8}  {cache:>9}"
+            )
+
+        if self._stats is None:
+            return
+
+        print("\nPhases:")
+        for phase, elapsed in self._stats.phases.items():
+            print(f"    {phase:<{width}}  {elapsed:>8.3f}s")
+
+        if self._stats.requests:
+            requests = ", ".join(
+                f"{service}: {num}" for service, num in self._stats.requests.items()
+            )
+            print(
+                f"\nNetwork: {self._stats.network_time:.3f}s in "
+                f"{sum(self._stats.requests.values())} requests ({requests})"
+            )
+
 
 class ActionConfigureLinter(argparse.Action):
     def __call__(
@@ -342,8 +1113,1043 @@ class ActionConfigureLinter(argparse.Action):
             namespace.set_linter_level(name, values)
 
 
-def main():
+class ActionConfigureTimeout(argparse.Action):
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        # 'SECONDS' for all linters, or 'linter-name=SECONDS'
+        assert isinstance(values, str)
+        name, _, value = values.rpartition("=")
+        try:
+            timeout = duration(value)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
+        if timeout <= 0:
+            parser.error(f"invalid timeout: {values} (must be positive)")
+
+        if not name:
+            namespace.timeout = timeout
+        elif name not in all_linters_by_name:
+            parser.error(f"unknown linter: {name}")
+        else:
+            namespace.timeouts = {**(namespace.timeouts or {}), name: timeout}
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser):
+    """Add the options writing metrics to a file to parser."""
+    parser.add_argument(
+        "--metrics-file",
+        help=(
+            "Write lint durations, results, remote request latencies and cache "
+            "statistics to FILE, e.g. for the node-exporter textfile collector. "
+            "Counters already in FILE are carried over"
+        ),
+        metavar="FILE",
+        type=str,
+    )
+    parser.add_argument(
+        "--metrics-format",
+        help="Format of the metrics file (default: prometheus)",
+        type=str,
+        choices=["prometheus", "openmetrics"],
+        default="prometheus",
+    )
+
+
+def add_timeout_arguments(parser: argparse.ArgumentParser):
+    """Add the options setting the deadlines of lint checks to parser."""
+    parser.add_argument(
+        "--timeout",
+        help=(
+            "Abandon lint checks which run for longer than SECONDS, and report "
+            "them as TIMEOUT. Given as LINTER=SECONDS, only applies to LINTER. "
+            "Can be given several times"
+        ),
+        metavar="SECONDS",
+        type=str,
+        action=ActionConfigureTimeout,
+    )
+    parser.add_argument(
+        "--deadline",
+        help=(
+            "Abandon the lint checks still running SECONDS after they were "
+            "started, and report them as TIMEOUT along with the other results"
+        ),
+        metavar="SECONDS",
+        type=duration,
+    )
+    parser.add_argument(
+        "--on-timeout",
+        help=(
+            "Exit status for lint checks which time out: 0 with ignore, 1 with "
+            "fail, 2 with error (default: error)"
+        ),
+        choices=list(TIMEOUT_STATUS),
+        default="error",
+    )
+    parser.set_defaults(timeouts={})
+
+
+# Linters which only need the name, version and distribution of a package, and
+# can therefore run against archive indexes.
+sweep_linters = [
+    "distribution-invalid",
+    "missing-version-suffix",
+    "release-mismatch",
+]
+
+# Network linters which only need the name, version and distribution of a
+# package, and can therefore warm the cache for a list of packages.
+version_network_linters = [
+    "sru-version-string-breaks-upgrades",
+]
+
+
+def print_sweep_report(report: SweepReport, elapsed: float, print_json: bool):
+    if print_json:
+        output = {
+            "packages": report.packages,
+            "results": report.results,
+            "findings": [
+                {
+                    "package": package,
+                    "version": version,
+                    "linter": linter,
+                    "result": result,
+                    "reason": reason,
+                }
+                for package, version, linter, result, reason in report.findings
+            ],
+        }
+        print(json.dumps(output, indent=4))
+        return
+
+    for package, version, linter, result, reason in report.findings:
+        level = ubuntu_lint.LintResult[result]
+        print(f"{format_result(result, level)} {package} {version}: {linter}: {reason}")
+
+    print(f"\nSummary: linted {report.packages} packages in {elapsed:.2f}s")
+    for linter, counts in sorted(report.results.items()):
+        short = ", ".join(
+            f"{level.name}: {counts.get(level.name, 0)}"
+            for level in ubuntu_lint.LintResult
+        )
+        print(f"    {linter}: {short}")
+
+
+def sweep_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="ubuntu-lint sweep",
+        description=(
+            "Lint the version of every package in Sources indexes, e.g. from "
+            "a local archive mirror"
+        ),
+    )
+    parser.add_argument(
+        "indexes",
+        help=(
+            "Sources index, optionally compressed with xz, gzip or bzip2. Unless "
+            "--distribution is given, the distribution is taken from the path "
+            "of the index, e.g. dists/resolute/main/source/Sources.xz"
+        ),
+        metavar="SOURCES",
+        nargs="+",
+    )
+    parser.add_argument(
+        "--distribution",
+        help="Distribution of the packages in the indexes, e.g. resolute",
+        type=str,
+    )
+    parser.add_argument(
+        "--linter",
+        help=(
+            "Lint check to run, can be given multiple times "
+            f"(default: {', '.join(sweep_linters)})"
+        ),
+        choices=sweep_linters,
+        action="append",
+        dest="linters",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Number of worker processes (default: number of CPUs)",
+        type=int,
+    )
+    parser.add_argument(
+        "--json",
+        help="Print the report as JSON",
+        action="store_true",
+        dest="print_json",
+    )
+    args = parser.parse_args(argv)
+
+    indexes: list[tuple[str, str]] = []
+    for path in args.indexes:
+        distribution = args.distribution or suite_from_path(path)
+        if distribution is None:
+            parser.error(f"cannot tell the distribution of {path}, use --distribution")
+
+        indexes.append((path, distribution))
+
+    linters = [
+        (name, all_linters_by_name[name].fn) for name in args.linters or sweep_linters
+    ]
+
+    start = time.perf_counter()
+    report = sweep(indexes, linters, jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+
+    print_sweep_report(report, elapsed, args.print_json)
+
+    if any(result == "FAIL" for *_, result, _ in report.findings):
+        return 1
+
+    return 0
+
+
+def madison_table_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="ubuntu-lint madison-table",
+        description=(
+            "Write a table of the highest version of each package in each series, "
+            "from Sources indexes, for use with --madison-table"
+        ),
+    )
+    parser.add_argument(
+        "output",
+        help="Path of the table to write",
+        metavar="OUTPUT",
+    )
+    parser.add_argument(
+        "indexes",
+        help=(
+            "Sources index, optionally compressed with xz, gzip or bzip2. The "
+            "suite is taken from the path of the index, e.g. "
+            "dists/resolute-updates/main/source/Sources.xz"
+        ),
+        metavar="SOURCES",
+        nargs="+",
+    )
+    args = parser.parse_args(argv)
+
+    indexes: list[tuple[str, str]] = []
+    for path in args.indexes:
+        suite = suite_from_path(path)
+        if suite is None:
+            parser.error(f"cannot tell the suite of {path}")
+
+        indexes.append((path, suite))
+
+    table = max_versions_from_sources(indexes)
+    MadisonTable.write(args.output, table)
+
+    print(f"Wrote {len(table)} packages to {args.output}")
+
+    return 0
+
+
+class Server:
+    """
+    Lints a stream of jobs, each a JSON object on one line, and writes the
+    results of each job to output as one JSON line as soon as it completes, so
+    results may be written in a different order than the jobs were read.
+
+    A job gives its context as paths (source_dir, changes_file, changelog_file,
+    dsc_file, debian_tar) or, for the changes file, changelog and dsc, as inline
+    content (changes, changelog, dsc), and may set the level of linters in
+    levels, e.g. {"all": "off", "release-mismatch": "fail"}, applied in order
+    like the command line flags. Its id, if any, is copied to its results,
+    along with the exit status and the results as printed by --json.
+
+    Up to jobs jobs are linted concurrently, and at most backlog more are read
+    ahead of them, so that memory use stays bounded however fast jobs are
+    written. The madison table, proposed indexes, Launchpad links, response
+    cache, latency history and recording, e.g. a bundle to replay, given are
+    shared by all jobs, as are the circuit breakers of the remote services, so
+    that once a service is down, the jobs stop requesting it together. Each
+    worker thread reuses its Launchpad handle. If offline is set, no network
+    lint checks run. The timeouts, by linter or "all", deadline and on_timeout
+    policy of lint checks apply to each job, as set by the options of the same
+    names. If metrics_file is set, the metrics of each job are added to it as
+    soon as the job completes, in metrics_format.
+    """
+
+    def __init__(
+        self,
+        output: IO[str],
+        jobs: int = 1,
+        backlog: int | None = None,
+        madison_table: MadisonTable | None = None,
+        proposed_indexes: ProposedIndexes | None = None,
+        launchpad_links: LaunchpadLinks | None = None,
+        response_cache: ResponseCache | None = None,
+        latencies: LatencyHistory | None = None,
+        offline: bool = False,
+        recording: Recording | None = None,
+        breakers: CircuitBreakers | None = None,
+        timeouts: dict[str, float] | None = None,
+        deadline: float | None = None,
+        on_timeout: str = "error",
+        metrics_file: str | None = None,
+        metrics_format: str = "prometheus",
+    ):
+        self.output = output
+        self.jobs = jobs
+        self.recording = recording
+        self.latencies = latencies
+        self.offline = offline
+        self.madison_table = madison_table
+        self.proposed_indexes = proposed_indexes
+        self.launchpad_links = launchpad_links or LaunchpadLinks()
+        self.response_cache = response_cache
+        self.breakers = breakers or CircuitBreakers()
+        self.timeouts = timeouts or {}
+        self.deadline = deadline
+        self.on_timeout = on_timeout
+        self.metrics_file = metrics_file
+        self.metrics_format = metrics_format
+
+        self._pending = threading.BoundedSemaphore(
+            jobs + (jobs if backlog is None else backlog)
+        )
+        self._output_lock = threading.Lock()
+        self._local = threading.local()
+        self._status = 0
+
+    def serve(self, input: IO[str]) -> int:
+        """
+        Lint the jobs read from input until it is closed, and return the
+        highest exit status of all jobs.
+        """
+        with concurrent.futures.ThreadPoolExecutor(self.jobs) as executor:
+            for line in input:
+                if not line.strip():
+                    continue
+
+                self._pending.acquire()
+                try:
+                    future = executor.submit(self.run_job, line)
+                except BaseException:
+                    self._pending.release()
+                    raise
+
+                future.add_done_callback(lambda _: self._pending.release())
+
+        if self.latencies is not None and self.latencies.path is not None:
+            self.latencies.save()
+
+        return self._status
+
+    def run_job(self, line: str):
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            self.write({"id": None, "status": 2, "error": f"invalid job: {e}"})
+            return
+
+        job_id = job.get("id") if isinstance(job, dict) else None
+        try:
+            result = self.lint(job)
+        except Exception as e:
+            result = {"status": 2, "error": str(e)}
+
+        self.write({"id": job_id, **result})
+
+    def lint(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Lint a job, and return its exit status and results."""
+        if not isinstance(job, dict):
+            raise ValueError("invalid job: expected an object")
+
+        runner = Runner()
+        runner.offline = self.offline
+        runner.latencies = self.latencies
+        runner.deadline = self.deadline
+        runner.on_timeout = self.on_timeout
+        runner.set_timeouts(self.timeouts)
+        runner.set_levels(job.get("levels", {}))
+        if self.metrics_file:
+            runner.metrics = Metrics()
+
+        context = ubuntu_lint.Context(
+            source_dir=job.get("source_dir"),
+            changes=job.get("changes_file") or _encode(job.get("changes")),
+            debian_changelog=(
+                job.get("changelog_file") or _encode(job.get("changelog"))
+            ),
+            dsc=job.get("dsc_file") or _encode(job.get("dsc")),
+            debian_tar=job.get("debian_tar"),
+            launchpad_handle=getattr(self._local, "lp", None),
+            recording=self.recording,
+            madison_table=self.madison_table,
+            proposed_indexes=self.proposed_indexes,
+            launchpad_links=self.launchpad_links,
+            response_cache=self.response_cache,
+            breakers=self.breakers,
+        )
+
+        status = runner.lint(context)
+
+        # Launchpad handles are not thread-safe, but jobs run one at a time in
+        # each worker thread, which can therefore keep using the same handle,
+        # unless a lint check of this job was abandoned and may still use it.
+        self._local.lp = None if runner._timed_out else context._lp
+
+        if runner.metrics is not None:
+            assert self.metrics_file is not None
+            runner.metrics.observe_run(context.stats)
+            runner.metrics.update(
+                self.metrics_file, openmetrics=self.metrics_format == "openmetrics"
+            )
+
+        return {"status": status, "results": runner.results_json()}
+
+    def write(self, result: dict[str, Any]):
+        with self._output_lock:
+            self._status = max(self._status, result["status"])
+            self.output.write(json.dumps(result) + "\n")
+            self.output.flush()
+
+
+def _encode(content: str | None) -> bytes | None:
+    return content.encode() if content is not None else None
+
+
+def serve_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="ubuntu-lint serve",
+        description=(
+            "Lint jobs read from stdin, one JSON object per line, and write the "
+            "results of each job to stdout as one JSON line as it completes"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Number of jobs to lint concurrently (default: 4)",
+        metavar="N",
+        type=int,
+        default=4,
+    )
+    parser.add_argument(
+        "--backlog",
+        help=(
+            "Number of jobs to read ahead of those being linted, before waiting "
+            "for one to complete (default: same as --jobs)"
+        ),
+        metavar="N",
+        type=int,
+    )
+    parser.add_argument(
+        "--offline",
+        help="Disable every lint check which needs Launchpad, madison or git web",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--latency-file",
+        help="Learn the typical duration of each lint check in FILE",
+        metavar="FILE",
+        type=str,
+    )
+    add_timeout_arguments(parser)
+    parser.add_argument(
+        "--bundle",
+        help=(
+            "Serve the responses of Launchpad, madison and git web from FILE, "
+            "written by ubuntu-lint prefetch"
+        ),
+        metavar="FILE",
+        type=str,
+        dest="bundle_file",
+    )
+    add_metrics_arguments(parser)
+    parser.add_argument(
+        "--madison-table",
+        help="Look up the versions of packages in FILE before asking madison",
+        metavar="FILE",
+        type=str,
+        dest="madison_table_file",
+    )
+    parser.add_argument(
+        "--proposed-index",
+        help="Look up the versions pending in -proposed in a cached index",
+        action="store_true",
+        dest="use_proposed_index",
+    )
+    parser.add_argument(
+        "--persistent-cache",
+        help=(
+            "Keep the links to Launchpad objects and responses from remote "
+            "services in a cache between runs"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        help="Maximum size of the response cache (default: 100M)",
+        metavar="SIZE",
+        type=size,
+        default=DEFAULT_MAX_SIZE,
+    )
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.backlog is not None and args.backlog < 0:
+        parser.error("--backlog must not be negative")
+
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+
+    madison_table: MadisonTable | None = None
+    if args.madison_table_file:
+        try:
+            madison_table = MadisonTable(args.madison_table_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load madison table: {e}")
+
+    recording: Recording | None = None
+    if args.bundle_file:
+        try:
+            recording = Recording.load(args.bundle_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load bundle: {e}")
+
+    server = Server(
+        sys.stdout,
+        jobs=args.jobs,
+        backlog=args.backlog,
+        madison_table=madison_table,
+        proposed_indexes=(
+            ProposedIndexes(cache_dir()) if args.use_proposed_index else None
+        ),
+        launchpad_links=(
+            LaunchpadLinks(launchpad_links_path()) if args.persistent_cache else None
+        ),
+        response_cache=(
+            ResponseCache(response_cache_path(), args.cache_max_size)
+            if args.persistent_cache
+            else None
+        ),
+        latencies=(
+            LatencyHistory.load(args.latency_file) if args.latency_file else None
+        ),
+        offline=args.offline,
+        recording=recording,
+        timeouts=({"all": args.timeout} if args.timeout else {}) | args.timeouts,
+        deadline=args.deadline,
+        on_timeout=args.on_timeout,
+        metrics_file=args.metrics_file,
+        metrics_format=args.metrics_format,
+    )
+
+    return server.serve(sys.stdin)
+
+
+def prefetch_context(context: ubuntu_lint.Context) -> Outcome:
+    """
+    Run every lint check which needs remote data against context, whatever its
+    level, so that all the responses they need are fetched, e.g. into the
+    recording of context. Against a VersionContext, only those which need
+    nothing else run. Return the outcome of the lint checks.
+    """
+    linters = [linter for linter in all_linters if linter.cost == COST_NETWORK]
+
+    # Only the linters which can run with what it has, rather than reporting
+    # the others as errors.
+    if isinstance(context, VersionContext):
+        linters = [
+            linter for linter in linters if linter.name in version_network_linters
+        ]
+
+    runner = Runner(linters)
+    runner.set_levels({"all": "warn"})
+
+    return runner.outcome(runner.lint(context))
+
+
+def prefetch_all(
+    uploads: list[str],
+    upload_context: Callable[[str], ubuntu_lint.Context],
+    jobs: int,
+) -> int:
+    """
+    Prefetch the remote data of each upload, with the context returned for it
+    by upload_context, up to jobs at a time. Uploads for which this fails, e.g.
+    as a remote service is unavailable, or lint checks which could not run, are
+    reported on stderr, and the return value is 1 if there are any.
+    """
+    ret = 0
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        futures = {
+            upload: executor.submit(
+                lambda upload: prefetch_context(upload_context(upload)), upload
+            )
+            for upload in uploads
+        }
+        for upload, future in futures.items():
+            try:
+                outcome = future.result()
+            except Exception as e:
+                print(format_error(f"ERROR: {upload}: {e}"), file=sys.stderr)
+                ret = 1
+                continue
+
+            # Lint checks all run at the warn level, so those which could not
+            # run, e.g. for lack of context, are errors.
+            for name, linter in outcome.linters.items():
+                if linter.result == ubuntu_lint.LintResult.ERROR:
+                    print(
+                        format_error(f"ERROR: {upload}: {name}: {linter.reason}"),
+                        file=sys.stderr,
+                    )
+
+            if outcome.status != 0:
+                ret = 1
+
+            if failures := outcome.stats.remote_failures:
+                print(
+                    format_error(
+                        f"ERROR: {upload}: failed to fetch data from "
+                        f"{', '.join(sorted(failures))}"
+                    ),
+                    file=sys.stderr,
+                )
+                ret = 1
+
+    return ret
+
+
+def prefetch_main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(
+        prog="ubuntu-lint prefetch",
+        description=(
+            "Fetch the data from Launchpad, madison and git web needed to lint "
+            "uploads into a bundle, to lint them without network access with "
+            "--bundle"
+        ),
+    )
+    parser.add_argument(
+        "output",
+        help=("Path of the bundle to write, compressed with gzip if it ends with .gz"),
+        metavar="OUTPUT",
+    )
+    parser.add_argument(
+        "uploads",
+        help="Source changes file, or Debian source package directory",
+        metavar="UPLOAD",
+        nargs="+",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Number of uploads to fetch data for concurrently (default: 4)",
+        metavar="N",
+        type=int,
+        default=4,
+    )
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    recording = Recording()
+    recording.metadata = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "uploads": [os.path.basename(os.path.abspath(u)) for u in args.uploads],
+    }
+
+    breakers = CircuitBreakers()
+
+    def upload_context(upload: str) -> ubuntu_lint.Context:
+        if os.path.isdir(upload):
+            return ubuntu_lint.Context(
+                source_dir=upload, recording=recording, breakers=breakers
+            )
+
+        return ubuntu_lint.Context(
+            changes=upload, recording=recording, breakers=breakers
+        )
+
+    ret = prefetch_all(args.uploads, upload_context, args.jobs)
+
+    recording.save(args.output)
+
+    print(
+        f"Wrote {len(recording.responses)} responses for {len(args.uploads)} "
+        f"uploads to {args.output}"
+    )
+
+    return ret
+
+
+def launchpad_links_path() -> str:
+    return os.path.join(cache_dir(), "launchpad-links.json")
+
+
+def response_cache_path() -> str:
+    return os.path.join(cache_dir(), "responses.sqlite")
+
+
+def size(value: str) -> int:
+    """Parse a size in bytes, optionally with a K, M or G suffix."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    try:
+        if value[-1:].upper() in units:
+            return int(float(value[:-1]) * units[value[-1].upper()])
+
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid size: {value} (expected bytes, or e.g. 500K, 100M, 1G)"
+        )
+
+
+def duration(value: str) -> float:
+    """Parse a duration in seconds, optionally with an m, h or d suffix."""
+    units = {"m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+    try:
+        if value[-1:] in units:
+            return float(value[:-1]) * units[value[-1]]
+
+        return float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid duration: {value} (expected seconds, or e.g. 30m, 12h, 7d)"
+        )
+
+
+def print_cache_stats(stats: dict[str, dict[str, Any]], files: dict[str, int]):
+    def age(seconds: float | None) -> str:
+        if seconds is None:
+            return "-"
+        if seconds >= 24 * 60 * 60:
+            return f"{seconds / (24 * 60 * 60):.1f}d"
+        if seconds >= 60 * 60:
+            return f"{seconds / (60 * 60):.1f}h"
+
+        return f"{seconds / 60:.1f}m"
+
+    width = max([len(kind) for kind in stats] + [len("responses")])
+    print(
+        f"{'responses':<{width}}  {'entries':>8}  {'bytes':>10}  {'hit ratio':>9}  "
+        f"{'oldest':>7}  {'newest':>7}"
+    )
+    for kind, entry in stats.items():
+        ratio = "-" if entry["hit_ratio"] is None else f"{entry['hit_ratio']:.1%}"
+        print(
+            f"{kind:<{width}}  {entry['entries']:>8}  {entry['bytes']:>10}  "
+            f"{ratio:>9}  {age(entry['oldest']):>7}  {age(entry['newest']):>7}"
+        )
+
+    total = sum(entry["bytes"] for entry in stats.values())
+    print(
+        f"\nTotal: {total} bytes in {sum(e['entries'] for e in stats.values())} "
+        "responses"
+    )
+
+    if files:
+        print("\nFiles:")
+        for name, file_size in files.items():
+            print(f"    {name}: {file_size} bytes")
+
+
+def cache_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="ubuntu-lint cache",
+        description=(
+            "Manage the data kept in $XDG_CACHE_HOME/ubuntu-lint by "
+            "--persistent-cache"
+        ),
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm = commands.add_parser(
+        "warm",
+        help="Fetch the remote data needed to lint uploads into the cache",
+    )
+    warm.add_argument(
+        "uploads",
+        help="Source changes file, or Debian source package directory",
+        metavar="UPLOAD",
+        nargs="*",
+    )
+    warm.add_argument(
+        "--queue",
+        help="Warm the cache for every source changes file in DIR",
+        metavar="DIR",
+        type=str,
+        action="append",
+        default=[],
+    )
+    warm.add_argument(
+        "--packages",
+        help=(
+            "Warm the cache for the packages listed in FILE, one per line as "
+            "PACKAGE VERSION DISTRIBUTION"
+        ),
+        metavar="FILE",
+        type=str,
+    )
+    warm.add_argument(
+        "--jobs",
+        help="Number of uploads to fetch data for concurrently (default: 4)",
+        metavar="N",
+        type=int,
+        default=4,
+    )
+    warm.add_argument(
+        "--cache-max-size",
+        help="Maximum size of the response cache (default: 100M)",
+        metavar="SIZE",
+        type=size,
+        default=DEFAULT_MAX_SIZE,
+    )
+
+    stats = commands.add_parser(
+        "stats",
+        help="Print the number, size, hit ratio and age of cached responses",
+    )
+    stats.add_argument(
+        "--json",
+        help="Print the statistics as JSON",
+        action="store_true",
+        dest="print_json",
+    )
+
+    prune = commands.add_parser(
+        "prune",
+        help=(
+            "Remove the cached responses not used for a while, and then the "
+            "least recently used ones, down to a size"
+        ),
+    )
+    prune.add_argument(
+        "--max-age",
+        help="Remove responses not used for DURATION, e.g. 12h or 7d",
+        metavar="DURATION",
+        type=duration,
+    )
+    prune.add_argument(
+        "--max-size",
+        help="Remove the least recently used responses down to SIZE, e.g. 50M",
+        metavar="SIZE",
+        type=size,
+    )
+
+    commands.add_parser("clear", help="Remove all cached data")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "warm":
+        uploads = list(args.uploads)
+        for directory in args.queue:
+            uploads.extend(sorted(glob.glob(os.path.join(directory, "*.changes"))))
+
+        packages: list[str] = []
+        if args.packages:
+            with open(args.packages, "r") as f:
+                packages = [line.strip() for line in f if line.strip()]
+
+        if not uploads and not packages:
+            parser.error("nothing to warm the cache for")
+
+        links = LaunchpadLinks(launchpad_links_path())
+        breakers = CircuitBreakers()
+        with ResponseCache(response_cache_path(), args.cache_max_size) as cache:
+
+            package_lines = set(packages)
+
+            def upload_context(upload: str) -> ubuntu_lint.Context:
+                if upload in package_lines:
+                    try:
+                        package, version, distribution = upload.split()
+                    except ValueError:
+                        raise ValueError(
+                            "expected PACKAGE VERSION DISTRIBUTION in package list"
+                        )
+                    context: ubuntu_lint.Context = VersionContext(
+                        package, version, distribution
+                    )
+                    context.launchpad_links = links
+                    context.response_cache = cache
+                    context.breakers = breakers
+                elif os.path.isdir(upload):
+                    context = ubuntu_lint.Context(
+                        source_dir=upload,
+                        launchpad_links=links,
+                        response_cache=cache,
+                        breakers=breakers,
+                    )
+                else:
+                    context = ubuntu_lint.Context(
+                        changes=upload,
+                        launchpad_links=links,
+                        response_cache=cache,
+                        breakers=breakers,
+                    )
+
+                return context
+
+            ret = prefetch_all(uploads + packages, upload_context, args.jobs)
+            entries = sum(e["entries"] for e in cache.stats().values())
+
+        print(
+            f"Warmed the cache for {len(uploads) + len(packages)} uploads "
+            f"({entries} responses cached)"
+        )
+
+        return ret
+
+    if args.command == "stats":
+        with ResponseCache(response_cache_path()) as cache:
+            response_stats = cache.stats()
+
+        files = {
+            name: os.path.getsize(os.path.join(cache_dir(), name))
+            for name in sorted(os.listdir(cache_dir()))
+            if os.path.isfile(os.path.join(cache_dir(), name))
+        }
+
+        if args.print_json:
+            print(json.dumps({"responses": response_stats, "files": files}, indent=4))
+        else:
+            print_cache_stats(response_stats, files)
+
+        return 0
+
+    if args.command == "prune":
+        if args.max_age is None and args.max_size is None:
+            parser.error("prune requires --max-age or --max-size")
+
+        with ResponseCache(response_cache_path()) as cache:
+            removed = cache.prune(max_age=args.max_age, max_size=args.max_size)
+
+        print(f"Removed {removed} responses")
+
+        return 0
+
+    with ResponseCache(response_cache_path()) as cache:
+        cache.clear()
+
+    removed_files = [launchpad_links_path()] + glob.glob(
+        os.path.join(cache_dir(), "proposed-*.json")
+    )
+    for path in removed_files:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+    print(f"Cleared the cache in {cache_dir()}")
+
+    return 0
+
+
+def replay_latency(value: str) -> float | None:
+    if value == "recorded":
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid latency: {value} (expected seconds or 'recorded')"
+        )
+
+
+class UsageError(Exception):
+    """
+    This exception is raised by run when the arguments are invalid, where the
+    command line would print the usage and exit with status 2.
+    """
+
+    pass
+
+
+class _APIArgumentParser(argparse.ArgumentParser):
+    """
+    The parser of the arguments of run, which raises UsageError rather than
+    printing anything or exiting. It has no --help option.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["add_help"] = False
+        super().__init__(*args, **kwargs)
+
+    def error(self, message: str):
+        raise UsageError(message)
+
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:
+        raise UsageError(message or f"exited with status {status}")
+
+
+def run(
+    argv: Sequence[str] = (),
+    context: ubuntu_lint.Context | None = None,
+    levels: dict[str, str] | None = None,
+) -> Outcome:
+    """
+    Run ubuntu-lint in this process, without printing the results or exiting,
+    and return its outcome. argv holds the command line arguments, e.g.
+    ["--all=off", "--release-mismatch=fail", "--changes-file=hello.changes"],
+    and levels optionally sets the level of lint checks by name, or "all",
+    after them. If context is given, the lint checks run against it rather
+    than one given by the context options.
+
+    Raises UsageError if the arguments are invalid, or select output, e.g.
+    --json, as nothing is printed.
+    """
+    parser = make_parser(_APIArgumentParser)
+    runner, context = prepare(parser, argv, context)
+
+    if any(
+        (
+            runner.verbose,
+            runner.print_json,
+            runner.print_json_lines,
+            runner.print_timings,
+        )
+    ):
+        raise UsageError(
+            "--verbose, --json, --json-lines and --timings cannot be used with run"
+        )
+
+    try:
+        runner.set_levels(levels or {})
+    except ValueError as e:
+        raise UsageError(str(e))
+
+    status = runner.lint(context)
+    runner.finish(context)
+
+    return runner.outcome(status)
+
+
+def main():
+    if sys.argv[1:2] == ["sweep"]:
+        sys.exit(sweep_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["madison-table"]:
+        sys.exit(madison_table_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["serve"]:
+        sys.exit(serve_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["prefetch"]:
+        sys.exit(prefetch_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["cache"]:
+        sys.exit(cache_main(sys.argv[2:]))
+
+    parser = make_parser()
+    runner, context = prepare(parser, sys.argv[1:])
+
+    sys.exit(runner.run(context))
+
+
+def make_parser(
+    parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser,
+) -> argparse.ArgumentParser:
+    """Return the parser of the ubuntu-lint command line."""
+    parser = parser_class(
         prog="ubuntu-lint",
         description="Lint checker for Ubuntu package uploads",
     )
@@ -352,12 +2158,110 @@ def main():
         help="Verbose output",
         action="store_true",
     )
-    parser.add_argument(
+    output_args = parser.add_mutually_exclusive_group()
+    output_args.add_argument(
         "--json",
         help="Print results as JSON",
         action="store_true",
         dest="print_json",
     )
+    output_args.add_argument(
+        "--json-lines",
+        help=(
+            "Print the result of each lint check as a JSON line as soon as it "
+            "completes, followed by a summary line"
+        ),
+        action="store_true",
+        dest="print_json_lines",
+    )
+    parser.add_argument(
+        "--timings",
+        help=(
+            "Print how long each lint check took, the network requests and cache "
+            "lookups it made, and how long it took to load the context"
+        ),
+        action="store_true",
+        dest="print_timings",
+    )
+    parser.add_argument(
+        "--profile",
+        help=(
+            "Profile the run with cProfile, writing one pstats file per lint "
+            "check and one for loading the context to DIR"
+        ),
+        metavar="DIR",
+        type=str,
+        dest="profile_dir",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Number of lint checks to run concurrently (default: 1)",
+        metavar="N",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--offline",
+        help=("Disable every lint check which needs Launchpad, madison or git web"),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--latency-file",
+        help=(
+            "Learn the typical duration of each lint check from previous runs in "
+            "FILE, and update it, to run cheap lint checks first and start "
+            "expensive ones earliest with --jobs"
+        ),
+        metavar="FILE",
+        type=str,
+    )
+    add_timeout_arguments(parser)
+    add_metrics_arguments(parser)
+
+    recording_args = parser.add_mutually_exclusive_group()
+    recording_args.add_argument(
+        "--record",
+        help=(
+            "Record the responses from Launchpad, madison and git web to FILE, "
+            "to replay them later with --replay. FILE is compressed if its name "
+            "ends with .gz"
+        ),
+        metavar="FILE",
+        type=str,
+        dest="record_file",
+    )
+    recording_args.add_argument(
+        "--bundle",
+        help=(
+            "Serve responses from FILE, written by ubuntu-lint prefetch, instead "
+            "of contacting Launchpad, madison and git web. Lint checks needing "
+            "data which is not in the bundle are treated as missing context"
+        ),
+        metavar="FILE",
+        type=str,
+        dest="bundle_file",
+    )
+    recording_args.add_argument(
+        "--replay",
+        help=(
+            "Serve responses from FILE, written by --record, instead of contacting "
+            "Launchpad, madison and git web. Lint checks needing a response that "
+            "was not recorded are treated as missing context"
+        ),
+        metavar="FILE",
+        type=str,
+        dest="replay_file",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        help=(
+            "Simulated latency of each replayed response, in seconds, or "
+            "'recorded' to use the latency measured when recording (default: 0)"
+        ),
+        metavar="SECONDS",
+        type=replay_latency,
+        default=0.0,
+    )
 
     context_args = parser.add_argument_group(
         "context options",
@@ -385,6 +2289,46 @@ def main():
         help="Path to source changes file",
         type=str,
     )
+    context_args.add_argument(
+        "--madison-table",
+        help=(
+            "Look up the versions of the package in each series in FILE, written "
+            "by ubuntu-lint madison-table, before asking madison"
+        ),
+        metavar="FILE",
+        type=str,
+        dest="madison_table_file",
+    )
+    context_args.add_argument(
+        "--proposed-index",
+        help=(
+            "Look up the versions pending in -proposed in an index of the whole "
+            "series, cached in $XDG_CACHE_HOME/ubuntu-lint and refreshed "
+            "incrementally, instead of querying Launchpad for the package"
+        ),
+        action="store_true",
+        dest="use_proposed_index",
+    )
+    context_args.add_argument(
+        "--persistent-cache",
+        help=(
+            "Keep data which practically never changes, such as the links to the "
+            "Ubuntu series and archive on Launchpad, and recent responses from "
+            "Launchpad, madison and git web, in $XDG_CACHE_HOME/ubuntu-lint "
+            "between runs"
+        ),
+        action="store_true",
+    )
+    context_args.add_argument(
+        "--cache-max-size",
+        help=(
+            "Maximum size of the cached responses, e.g. 500M, beyond which the "
+            "least recently used are evicted (default: 100M)"
+        ),
+        metavar="SIZE",
+        type=size,
+        default=DEFAULT_MAX_SIZE,
+    )
 
     linter_args = parser.add_argument_group(
         "linter options",
@@ -414,15 +2358,52 @@ def main():
             action=ActionConfigureLinter,
         )
 
-    runner = parser.parse_args(namespace=Runner())
+    return parser
+
+
+def prepare(
+    parser: argparse.ArgumentParser,
+    argv: Sequence[str],
+    context: ubuntu_lint.Context | None = None,
+) -> tuple[Runner, ubuntu_lint.Context]:
+    """
+    Parse the command line argv with parser, and return a runner configured
+    accordingly and the context to run it with. If context is given, it is
+    used instead of one loaded from the context options, which cannot be
+    given then.
+    """
+    runner = parser.parse_args(argv, namespace=Runner())
 
-    if not any(
+    context_given = any(
         (
             runner.source_dir,
             runner.debian_changelog,
             runner.changes_file,
         )
-    ):
+    )
+    if context is not None:
+        if context_given:
+            parser.error(
+                "changelog, changes file and source directory cannot be given "
+                "with a context"
+            )
+
+        # These set up the context, which is already given.
+        if any(
+            (
+                runner.record_file,
+                runner.replay_file,
+                runner.bundle_file,
+                runner.madison_table_file,
+                runner.use_proposed_index,
+                runner.persistent_cache,
+            )
+        ):
+            parser.error(
+                "--record, --replay, --bundle, --madison-table, --proposed-index "
+                "and --persistent-cache cannot be given with a context"
+            )
+    elif not context_given:
         if os.path.exists("debian"):
             runner.source_dir = "."
         else:
@@ -430,10 +2411,73 @@ def main():
                 "must specify a combination of changelog, changes file, or source directory"
             )
 
-    context = ubuntu_lint.Context(
-        source_dir=runner.source_dir,
-        debian_changelog=runner.debian_changelog,
-        changes=runner.changes_file,
-    )
+    if runner.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    sys.exit(runner.run(context))
+    if runner.deadline is not None and runner.deadline <= 0:
+        parser.error("--deadline must be positive")
+
+    if runner.profile_dir:
+        if runner.jobs > 1:
+            parser.error("--profile cannot be used with --jobs")
+
+        # An abandoned lint check would keep profiling in its thread, and
+        # only one profiler can be active at a time.
+        if runner.timeout or runner.timeouts or runner.deadline is not None:
+            parser.error("--profile cannot be used with --timeout or --deadline")
+
+        runner.profiler = Profiler(runner.profile_dir)
+
+    if runner.metrics_file:
+        runner.metrics = Metrics()
+
+    if runner.latency_file:
+        runner.latencies = LatencyHistory.load(runner.latency_file)
+
+    if context is not None:
+        return runner, context
+
+    recording: Recording | None = None
+    if runner.record_file:
+        recording = Recording()
+    elif runner.replay_file:
+        try:
+            recording = Recording.load(runner.replay_file, runner.replay_latency)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load recording: {e}")
+    elif runner.bundle_file:
+        try:
+            recording = Recording.load(runner.bundle_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load bundle: {e}")
+
+    madison_table: MadisonTable | None = None
+    if runner.madison_table_file:
+        try:
+            madison_table = MadisonTable(runner.madison_table_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load madison table: {e}")
+
+    with runner.profile("context"):
+        context = ubuntu_lint.Context(
+            source_dir=runner.source_dir,
+            debian_changelog=runner.debian_changelog,
+            changes=runner.changes_file,
+            recording=recording,
+            madison_table=madison_table,
+            proposed_indexes=(
+                ProposedIndexes(cache_dir()) if runner.use_proposed_index else None
+            ),
+            launchpad_links=(
+                LaunchpadLinks(launchpad_links_path())
+                if runner.persistent_cache
+                else None
+            ),
+            response_cache=(
+                ResponseCache(response_cache_path(), runner.cache_max_size)
+                if runner.persistent_cache
+                else None
+            ),
+        )
+
+    return runner, context
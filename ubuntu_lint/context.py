@@ -1,25 +1,115 @@
 # Copyright 2026 Canonical Ltd.
 # SPDX-License-Identifier: GPL-3.0-only
 
+import contextlib
+import datetime
 import distro_info
 import enum
+import functools
+import httplib2
+import io
 import os
 import tarfile
+import threading
+import time
 
 from debian import (
     deb822,
-    debian_support,
     changelog,
 )
 from launchpadlib.launchpad import Launchpad
+from lazr.restfulclient.errors import ServerError
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, ContextManager
+from ubuntu_lint.cache import LaunchpadLinks, ResponseCache
+from ubuntu_lint.circuit import CircuitBreakers
+from ubuntu_lint.madison import MadisonTable
+from ubuntu_lint.proposed import ProposedIndexes
+from ubuntu_lint.recording import Recording
+from ubuntu_lint.stats import Stats
+from ubuntu_lint.versions import Version, parse_version
+
+# The content of a file given in memory, rather than by its path: as bytes, a
+# buffer such as a memoryview, or a file object opened in binary or text mode.
+Content = bytes | bytearray | memoryview | IO[bytes] | IO[str]
+
+# Time, in seconds, after which a request to Launchpad is abandoned.
+LAUNCHPAD_TIMEOUT = 30
+
+# Errors which mean that a remote service is unavailable, rather than that the
+# request was wrong: failures to connect, timeouts and server errors.
+REMOTE_ERRORS = (OSError, httplib2.HttpLib2Error, ServerError)
+
+
+def _is_content(value: Any) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview)) or hasattr(value, "read")
+
+
+def _text(content: Content) -> str | IO[bytes] | IO[str]:
+    """
+    Return content in a form accepted by the deb822 and changelog parsers:
+    buffers are decoded directly, and file objects are read as they are parsed.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return str(content, "utf-8")
+
+    return content
+
+
+@functools.lru_cache(maxsize=1)
+def _ubuntu_distro_info(today: datetime.date) -> distro_info.UbuntuDistroInfo:
+    return distro_info.UbuntuDistroInfo()
+
+
+def ubuntu_distro_info() -> distro_info.UbuntuDistroInfo:
+    """
+    Return an UbuntuDistroInfo instance. Loading the distro-info data is
+    relatively expensive, so the instance is shared until the date changes.
+    """
+    return _ubuntu_distro_info(datetime.date.today())
+
+
+def _changelog_from_tar_stream(tar: tarfile.TarFile, tar_name: str) -> bytes:
+    """
+    Return the content of debian/changelog, or of <dir>/debian/changelog for
+    native packages, from a tar opened as a stream. The members can only be
+    read in order, so every changelog is kept until the right one is known.
+    """
+    dirs: list[str] = []
+    debian_links: dict[str, str] = {}
+    changelogs: dict[str, bytes] = {}
+
+    for member in tar:
+        parts = Path(member.name).parts
+
+        if member.isdir() and len(parts) == 1:
+            dirs.append(member.name)
+        elif member.issym() and len(parts) == 2 and parts[1] == "debian":
+            # This is rare, but snapd does this.
+            debian_links[parts[0]] = member.linkname
+        elif member.isfile() and parts[-1] == "changelog":
+            if (f := tar.extractfile(member)) is not None:
+                changelogs[member.name] = f.read()
+
+    if (data := changelogs.get("debian/changelog")) is not None:
+        return data
+
+    if len(dirs) != 1:
+        raise ValueError(f"invalid content in {tar_name}")
+
+    debian = debian_links.get(dirs[0], "debian")
+    if (data := changelogs.get(f"{dirs[0]}/{debian}/changelog")) is None:
+        raise ValueError(f"invalid content in {tar_name}")
+
+    return data
 
 
 class LintResult(enum.Enum):
     """
     The possible results of a lint check. When a LintException is raised,
     its result attribute will be set with one of SKIP, WARN, ERROR, FAIL.
+    TIMEOUT is only given by runners, to lint checks abandoned as they overran
+    their deadline.
     """
 
     OK = enum.auto()
@@ -27,6 +117,18 @@ class LintResult(enum.Enum):
     WARN = enum.auto()
     ERROR = enum.auto()
     FAIL = enum.auto()
+    TIMEOUT = enum.auto()
+
+
+class Finding:
+    """A problem found by a linter, and how severe it is."""
+
+    def __init__(self, reason: str, result: LintResult = LintResult.FAIL):
+        self.reason = reason
+        self.result = result
+
+    def __repr__(self) -> str:
+        return f"Finding({self.reason!r}, {self.result})"
 
 
 class LintException(Exception):
@@ -34,14 +136,79 @@ class LintException(Exception):
     This exception is raised when a linter calls lint_fail, lint_warn, or lint_skip.
     Callers of linters should handle this exception to determine why a specific linter
     failed.
+
+    A linter which collects several findings raises them together: findings lists
+    all of them, and result and reason are those of the most severe finding and
+    the reasons of all findings, respectively.
     """
 
-    def __init__(self, reason: str, result: LintResult = LintResult.FAIL):
+    def __init__(
+        self,
+        reason: str,
+        result: LintResult = LintResult.FAIL,
+        findings: list[Finding] | None = None,
+    ):
         self.result = result
         self.reason = reason
+        self.findings = findings or [Finding(reason, result)]
 
         super().__init__(reason)
 
+    @classmethod
+    def from_findings(cls, findings: list[Finding]) -> "LintException":
+        result = max((f.result for f in findings), key=lambda r: r.value)
+        reason = "; ".join(f.reason for f in findings)
+
+        return cls(reason, result, findings)
+
+
+class Findings:
+    """
+    Collects the findings of a linter, so that it can report several problems
+    rather than stopping at the first one. When the with block ends, all the
+    findings are raised together as a LintException, along with any raised in
+    the block, e.g. by lint_fail or lint_skip. Other exceptions raised in the
+    block, e.g. MissingContextException, are added as errors, so that the
+    findings collected until then are not lost.
+    """
+
+    def __init__(self):
+        self.findings: list[Finding] = []
+
+    def add(self, reason: str, result: LintResult = LintResult.FAIL):
+        self.findings.append(Finding(reason, result))
+
+    def fail(self, reason: str):
+        self.add(reason, LintResult.FAIL)
+
+    def warn(self, reason: str):
+        self.add(reason, LintResult.WARN)
+
+    def error(self, reason: str):
+        self.add(reason, LintResult.ERROR)
+
+    def __bool__(self) -> bool:
+        return bool(self.findings)
+
+    def __enter__(self) -> "Findings":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.findings:
+            return
+
+        if exc is None:
+            raise LintException.from_findings(self.findings)
+
+        if isinstance(exc, LintException):
+            findings = exc.findings
+        elif isinstance(exc, Exception):
+            findings = [Finding(str(exc), LintResult.ERROR)]
+        else:
+            return
+
+        raise LintException.from_findings(self.findings + findings) from exc
+
 
 class MissingContextException(Exception):
     """
@@ -73,42 +240,91 @@ class Context:
     """
     A class to encapsulate the context of a source package, or package upload
     for a linter. Instances of Context are passed to linters.
+
+    Linters may run concurrently against the same context from several threads:
+    lazily created resources and cached data are only created once, and as the
+    Launchpad handle is not thread-safe, requests to Launchpad are serialized.
     """
 
+    _source_dir: str | None
+    _debian_tar: Path | None
+    _changelog: changelog.Changelog | None
+    _dsc: deb822.Dsc | None
+    _changes: deb822.Changes | None
+
     def __init__(
         self,
-        changes: str | deb822.Changes | None = None,
-        debian_changelog: str | changelog.Changelog | None = None,
+        changes: str | deb822.Changes | Content | None = None,
+        debian_changelog: str | changelog.Changelog | Content | None = None,
         launchpad_handle: Launchpad | None = None,
         source_dir: str | None = None,
-        debian_tar: str | Path | None = None,
+        debian_tar: str | Path | Content | None = None,
+        dsc: str | deb822.Dsc | Content | None = None,
+        recording: Recording | None = None,
+        madison_table: MadisonTable | None = None,
+        proposed_indexes: ProposedIndexes | None = None,
+        launchpad_links: LaunchpadLinks | None = None,
+        response_cache: ResponseCache | None = None,
+        breakers: CircuitBreakers | None = None,
     ):
-        self._source_dir: str | None = None
+        start = time.perf_counter()
+        self._init_state(
+            launchpad_handle,
+            recording,
+            madison_table,
+            proposed_indexes,
+            launchpad_links,
+            response_cache,
+            breakers,
+        )
+
         if source_dir:
             self.source_dir = source_dir
 
             if debian_changelog is None:
                 debian_changelog = os.path.join(self.source_dir, "debian/changelog")
 
-        self._debian_tar: Path | None = None
+        tar_file: IO[bytes] | None = None
         if isinstance(debian_tar, str):
             self._debian_tar = Path(debian_tar)
         elif isinstance(debian_tar, Path):
             self._debian_tar = debian_tar
+        elif isinstance(debian_tar, (bytes, bytearray, memoryview)):
+            tar_file = io.BytesIO(debian_tar)
+        elif debian_tar is not None and hasattr(debian_tar, "read"):
+            tar_file = debian_tar  # type: ignore[assignment]
 
         if self._debian_tar and not self._debian_tar.is_file():
             raise ValueError("invalid path for debian tar")
 
-        self._changelog: changelog.Changelog | None = None
+        tar_name = str(self._debian_tar or "debian tar")
+
         if isinstance(debian_changelog, str):
-            with open(debian_changelog, "r") as f:
+            with self.stats.phase("changelog-parse"), open(debian_changelog, "r") as f:
                 self._changelog = changelog.Changelog(f)
 
         elif isinstance(debian_changelog, changelog.Changelog):
             self._changelog = debian_changelog
 
-        elif self._debian_tar is not None:
-            with tarfile.open(self._debian_tar, "r:*") as tar:
+        elif debian_changelog is not None and _is_content(debian_changelog):
+            with self.stats.phase("changelog-parse"):
+                self._changelog = changelog.Changelog(_text(debian_changelog))
+
+        elif tar_file is not None and not tar_file.seekable():
+            # A stream, e.g. a pipe or the body of an HTTP response, can only
+            # be read once, from start to end.
+            tar_start = time.perf_counter()
+            with tarfile.open(mode="r|*", fileobj=tar_file) as tar:
+                changelog_data = _changelog_from_tar_stream(tar, tar_name)
+
+            self.stats.add_phase("tar-extraction", time.perf_counter() - tar_start)
+
+            with self.stats.phase("changelog-parse"):
+                self._changelog = changelog.Changelog(changelog_data)
+
+        elif self._debian_tar is not None or tar_file is not None:
+            tar_start = time.perf_counter()
+            with tarfile.open(self._debian_tar, "r:*", fileobj=tar_file) as tar:
                 try:
                     changelog_from_tar = tar.extractfile("debian/changelog")
                 except KeyError:
@@ -127,7 +343,7 @@ class Context:
                         dirs.append(member.name)
 
                     if len(dirs) != 1:
-                        raise ValueError(f"invalid content in {self._debian_tar}")
+                        raise ValueError(f"invalid content in {tar_name}")
 
                     try:
                         member = tar.getmember(f"{dirs[0]}/debian")
@@ -141,14 +357,32 @@ class Context:
                                 f"{member.name}/changelog"
                             )
                     except KeyError:
-                        raise ValueError(f"invalid content in {self._debian_tar}")
+                        raise ValueError(f"invalid content in {tar_name}")
+
+                if changelog_from_tar is None:
+                    raise ValueError(f"invalid content in {tar_name}")
+
+                changelog_data = changelog_from_tar.read()
+
+            self.stats.add_phase("tar-extraction", time.perf_counter() - tar_start)
 
-                self._changelog = changelog.Changelog(changelog_from_tar)
+            with self.stats.phase("changelog-parse"):
+                self._changelog = changelog.Changelog(changelog_data)
 
         elif debian_changelog is not None:
             raise ValueError("invalid type for changelog")
 
-        self._changes: deb822.Changes | None = None
+        if isinstance(dsc, str):
+            with self.stats.phase("dsc-parse"), open(dsc, "r") as f:
+                self._dsc = deb822.Dsc(f)
+        elif isinstance(dsc, deb822.Dsc):
+            self._dsc = dsc
+        elif dsc is not None and _is_content(dsc):
+            with self.stats.phase("dsc-parse"):
+                self._dsc = deb822.Dsc(_text(dsc))
+        elif dsc is not None:
+            raise ValueError("invalid type for dsc")
+
         if changes is not None:
             self.changes = changes
 
@@ -165,12 +399,12 @@ class Context:
             if os.path.exists(changes):
                 self.changes = changes
 
-        if not any((self._changes, self._changelog)):
-            raise ValueError("context requires at least one of changes or changelog")
+        if not any((self._changes, self._changelog, self._dsc)):
+            raise ValueError(
+                "context requires at least one of changes, changelog or dsc"
+            )
 
-        self._lp: Launchpad | None = None
-        if launchpad_handle is not None:
-            self._lp = launchpad_handle
+        self.stats.add_phase("context", time.perf_counter() - start)
 
     @property
     def changes(self) -> deb822.Changes:
@@ -181,17 +415,29 @@ class Context:
         return self._changes
 
     @changes.setter
-    def changes(self, changes: str | deb822.Changes):
+    def changes(self, changes: str | deb822.Changes | Content):
         if isinstance(changes, str):
-            with open(changes, "r") as f:
+            with self.stats.phase("changes-parse"), open(changes, "r") as f:
                 self._changes = deb822.Changes(f)
 
         elif isinstance(changes, deb822.Changes):
             self._changes = changes
 
+        elif _is_content(changes):
+            with self.stats.phase("changes-parse"):
+                self._changes = deb822.Changes(_text(changes))
+
         else:
             raise ValueError("invalid type for changes file")
 
+    @property
+    def dsc(self) -> deb822.Dsc:
+        if not self._dsc:
+            raise MissingContextException("missing context for dsc")
+        assert self._dsc is not None
+
+        return self._dsc
+
     def changelog_entry_by_index(self, index: int) -> changelog.ChangeBlock:
         if not self._changelog:
             raise MissingContextException("missing context for changelog entry")
@@ -203,13 +449,177 @@ class Context:
     def changelog_entry(self) -> changelog.ChangeBlock:
         return self.changelog_entry_by_index(0)
 
+    def _init_state(
+        self,
+        launchpad_handle: Launchpad | None = None,
+        recording: Recording | None = None,
+        madison_table: MadisonTable | None = None,
+        proposed_indexes: ProposedIndexes | None = None,
+        launchpad_links: LaunchpadLinks | None = None,
+        response_cache: ResponseCache | None = None,
+        breakers: CircuitBreakers | None = None,
+    ):
+        # Everything but the sources, which are left empty.
+        self.stats = Stats()
+        self._cache: dict[str, Any] = {}
+        self._init_locks()
+        self.recording = recording
+        self.madison_table = madison_table
+        self.proposed_indexes = proposed_indexes
+        self.launchpad_links = launchpad_links or LaunchpadLinks()
+        self.response_cache = response_cache
+        self.breakers = breakers or CircuitBreakers()
+        self._lp: Launchpad | None = launchpad_handle
+
+        self._source_dir = None
+        self._debian_tar = None
+        self._changelog = None
+        self._dsc = None
+        self._changes = None
+
+    def _init_locks(self):
+        # Guards the creation of lazy resources and of the per-key locks below.
+        self._lock = threading.RLock()
+        # Held while computing the value of a key in the cache.
+        self._key_locks: dict[str, threading.Lock] = {}
+        # Held while making requests to Launchpad. Re-entrant, as fetching data
+        # may need other data from Launchpad, e.g. the link to a series.
+        self._lp_lock = threading.RLock()
+
     @property
     def lp(self) -> Launchpad:
         if not self._lp:
-            self._lp = Launchpad.login_anonymously("ubuntu-lint", "production")
+            with self._lock:
+                if not self._lp:
+                    with self.network("launchpad"):
+                        self._lp = Launchpad.login_anonymously(
+                            "ubuntu-lint", "production", timeout=LAUNCHPAD_TIMEOUT
+                        )
 
         return self._lp
 
+    def network(self, service: str) -> ContextManager[None]:
+        """
+        Return a context manager that accounts its with block as a request
+        to the given remote service in the statistics of this context.
+        """
+        return self.stats.network(service)
+
+    def remote[T](
+        self,
+        service: str,
+        op: str,
+        args: list[str],
+        fetch: Callable[[], T],
+        negative: Callable[[T], bool] | None = None,
+        failed: Callable[[T], bool] | None = None,
+    ) -> T:
+        """
+        Return data from the given remote service, as returned by fetch. The op
+        and args identify the request, so that the response can be recorded and
+        replayed if this context has a recording, or cached if it has a
+        response cache. The data must therefore be JSON serializable.
+
+        Responses for which negative returns True, e.g. for a bug which does not
+        exist, are only cached for a short time. Responses for which failed
+        returns True, e.g. a server error, are neither cached nor recorded, and
+        count as failures of the service, along with the errors in
+        REMOTE_ERRORS raised by fetch. Once the circuit breaker of the service
+        opens, linters requesting it are skipped, and if fetch fails, the linter
+        reports an error.
+        """
+        key = Recording.key(op, args)
+
+        if self.recording is not None and self.recording.replay:
+            with self.network(service):
+                try:
+                    value, latency = self.recording.get(key)
+                except KeyError:
+                    raise MissingContextException(
+                        f"no recorded response for {op} {' '.join(args)}"
+                    )
+
+                if latency:
+                    time.sleep(latency)
+
+            return value
+
+        if self.response_cache is not None:
+            try:
+                value = self.response_cache.get(service, op, key)
+            except KeyError:
+                pass
+            else:
+                if self.recording is not None:
+                    self.recording.add(key, value, 0.0)
+
+                return value
+
+        breaker = self.breakers.get(service)
+        if not breaker.allow():
+            self.stats.remote_failure(service)
+            self.lint_skip(
+                f"{service} is unavailable, retrying in {breaker.retry_in():.0f}s"
+            )
+
+        start = time.perf_counter()
+        try:
+            with (
+                self._lp_lock if service == "launchpad" else contextlib.nullcontext(),
+                self.network(service),
+            ):
+                value = fetch()
+        except REMOTE_ERRORS as e:
+            breaker.failure()
+            self.stats.remote_failure(service)
+            self.lint_error(f"{service} is unavailable: {e}")
+
+        if failed is not None and failed(value):
+            breaker.failure()
+            self.stats.remote_failure(service)
+            return value
+
+        if self.recording is not None:
+            self.recording.add(key, value, time.perf_counter() - start)
+
+        breaker.success()
+        if self.response_cache is not None:
+            self.response_cache.put(
+                service,
+                op,
+                key,
+                value,
+                negative=negative is not None and negative(value),
+            )
+
+        return value
+
+    def cached[T](self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Return the value stored for key on this context, calling fn to compute
+        it on the first lookup. If several threads look up the same key at
+        once, fn is only called by one of them, and the others wait for it.
+        """
+        try:
+            value = self._cache[key]
+            self.stats.cache_hit()
+            return value
+        except KeyError:
+            pass
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                value = self._cache[key]
+                self.stats.cache_hit()
+            except KeyError:
+                self.stats.cache_miss()
+                value = self._cache[key] = fn()
+
+        return value
+
     @property
     def source_dir(self) -> str:
         if not self._source_dir:
@@ -227,11 +637,22 @@ class Context:
 
     @property
     def debian_tar(self) -> Path:
+        """
+        The path of the debian tar. A debian tar given in memory or as a stream
+        is only read for its changelog, and is missing here.
+        """
         if self._debian_tar is None:
             raise MissingContextException("missing context for debian tar")
 
         return self._debian_tar
 
+    def findings(self) -> Findings:
+        """
+        Return a collector for several findings of a linter, to be used as a
+        context manager around the checks.
+        """
+        return Findings()
+
     def lint_fail(self, msg: str):
         raise LintException(msg)
 
@@ -295,7 +716,7 @@ class Context:
         Returns True if the context represents an upload targeting a stable
         release.
         """
-        di = distro_info.UbuntuDistroInfo()
+        di = ubuntu_distro_info()
         stable = set(di.supported() + di.supported_esm()) - set([di.devel()])
 
         return self.get_series() in stable
@@ -317,21 +738,24 @@ class Context:
 
         return self._ensure_get("launchpad bugs fixed", from_changes, from_changelog)
 
-    def get_package_version(self) -> debian_support.Version:
+    def get_package_version(self) -> Version:
         """
         Returns the current package version, according to changes
         file or most recent changelog entry.
         """
         try:
-            from_changes = debian_support.Version(self.changes.get("Version"))
+            from_changes = parse_version(self.changes.get("Version"))
         except MissingContextException:
             from_changes = None
 
         try:
-            from_changelog = self.changelog_entry.version
+            from_changelog = parse_version(str(self.changelog_entry.version))
         except MissingContextException:
             from_changelog = None
 
+        if (from_changes, from_changelog) == (None, None) and self._dsc:
+            from_changes = parse_version(self._dsc["Version"])
+
         return self._ensure_get("version", from_changes, from_changelog)
 
     def get_source_package_name(self):
@@ -345,4 +769,33 @@ class Context:
         except MissingContextException:
             from_changelog = None
 
+        if (from_changes, from_changelog) == (None, None) and self._dsc:
+            from_changes = self._dsc["Source"]
+
         return self._ensure_get("source name", from_changes, from_changelog)
+
+
+class VersionContext(Context):
+    """
+    A lightweight Context with only the name, version and distribution of a
+    source package, e.g. as listed in an archive index. Only linters which
+    need nothing else can run against it; the changelog and changes file are
+    always missing.
+    """
+
+    def __init__(self, package: str, version: str, distribution: str):
+        self._package = package
+        self._version = parse_version(version)
+        self._distribution = distribution
+
+        # Skips Context.__init__, as there are no sources to parse.
+        self._init_state()
+
+    def get_distribution(self) -> str:
+        return self._distribution
+
+    def get_package_version(self) -> Version:
+        return self._version
+
+    def get_source_package_name(self):
+        return self._package
@@ -1,8 +1,15 @@
 # Copyright 2026 Canonical Ltd.
 # SPDX-License-Identifier: GPL-3.0-only
 
+import argparse
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import os
 import re
 import sys
+import threading
 import ubuntu_lint
 
 from dput.changes import Changes
@@ -11,7 +18,73 @@ from dput.exceptions import HookException
 from dput.interfaces.cli import CLInterface
 from pathlib import Path
 from typing import Callable
-from ubuntu_lint.cli import format_error, format_warning
+from ubuntu_lint.cli import (
+    COST_NETWORK,
+    all_linters_by_name,
+    duration,
+    format_error,
+    format_warning,
+)
+from ubuntu_lint.profiling import PROFILE_DIR_ENV, Profiler
+
+# If set, hooks of lint checks which need Launchpad, madison or git web are
+# skipped, e.g. on builders without network access.
+OFFLINE_ENV = "UBUNTU_LINT_OFFLINE"
+
+# If set, the number of seconds after which the hook of a lint check is
+# abandoned, and the lint check skipped, so that an upload is not held up by a
+# remote service which does not respond.
+TIMEOUT_ENV = "UBUNTU_LINT_TIMEOUT"
+
+
+@functools.cache
+def hook_timeout() -> float | None:
+    """
+    Return the timeout of hooks set by UBUNTU_LINT_TIMEOUT, in seconds, if
+    any. An invalid value is ignored with a warning, rather than failing every
+    hook.
+    """
+    if not (value := os.environ.get(TIMEOUT_ENV)):
+        return None
+
+    try:
+        timeout = duration(value)
+    except argparse.ArgumentTypeError as e:
+        logger.warning(format_warning(f"ignoring {TIMEOUT_ENV}: {e}"))
+        return None
+
+    if timeout <= 0:
+        logger.warning(format_warning(f"ignoring {TIMEOUT_ENV}: must be positive"))
+        return None
+
+    return timeout
+
+
+def run_lint(
+    lint: Callable[[ubuntu_lint.Context], None],
+    context: ubuntu_lint.Context,
+    timeout: float | None,
+):
+    """
+    Run lint against context, abandoning it after timeout seconds, if given,
+    in which case concurrent.futures.TimeoutError is raised.
+    """
+    if timeout is None:
+        lint(context)
+        return
+
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    run = contextvars.copy_context().run
+
+    def target():
+        try:
+            future.set_result(run(lint, context))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # A daemon thread, so that the hook does not wait for it on exit.
+    threading.Thread(target=target, daemon=True).start()
+    future.result(timeout)
 
 
 def call_lint_as_hook(
@@ -22,6 +95,18 @@ def call_lint_as_hook(
     can_ignore: bool = False,
     stable_can_ignore: bool = False,
 ):
+    # Hooks wrap built-in lint checks, which are looked up by name so that
+    # plugins are not loaded to compare their functions.
+    linter = all_linters_by_name.get(
+        lint.__name__.removeprefix("check_").replace("_", "-")
+    )
+    if (
+        os.environ.get(OFFLINE_ENV)
+        and linter is not None
+        and linter.cost == COST_NETWORK
+    ):
+        logger.debug(f"skipping {lint.__name__}: offline")
+        return
 
     raw_changes = changes.get_raw_changes()
     source = raw_changes.get_as_string("Source")
@@ -45,12 +130,33 @@ def call_lint_as_hook(
             format_error("ERROR: could not find source package tarball")
         )
 
-    context = ubuntu_lint.Context(
-        changes=raw_changes,
-        debian_tar=debian_tar,
-    )
+    timeout = hook_timeout()
+
+    profiler = Profiler.from_env()
+    if profiler is not None and timeout is not None:
+        raise HookException(
+            format_error(f"ERROR: {PROFILE_DIR_ENV} cannot be used with {TIMEOUT_ENV}")
+        )
+
+    with (
+        profiler.profile(f"{lint.__name__}.context")
+        if profiler
+        else contextlib.nullcontext()
+    ):
+        context = ubuntu_lint.Context(
+            changes=raw_changes,
+            debian_tar=debian_tar,
+        )
     try:
-        lint(context)
+        with (
+            context.stats.linter(lint.__name__) as stats,
+            profiler.profile(lint.__name__) if profiler else contextlib.nullcontext(),
+        ):
+            run_lint(lint, context, timeout)
+    except concurrent.futures.TimeoutError:
+        logger.warning(format_warning(f"skipping {lint.__name__}: timed out"))
+        return
+
     except ubuntu_lint.LintException as e:
         msg = str(e)
 
@@ -67,7 +173,20 @@ def call_lint_as_hook(
             ):
                 return
 
-        raise HookException(format_error(f"ERROR: {msg}"))
+        raise HookException(
+            "\n".join(format_error(f"ERROR: {f.reason}") for f in e.findings)
+        )
+
+    finally:
+        logger.debug(
+            f"{lint.__name__} took {stats.wall_time:.3f}s "
+            f"(network: {stats.network_time:.3f}s in {stats.num_requests} requests, "
+            f"context: {context.stats.phases.get('context', 0.0):.3f}s)"
+        )
+
+        if profiler is not None:
+            for line in profiler.summary():
+                logger.info(line)
 
 
 def dput_ppa_version_string(changes: Changes, profile: dict, interface: CLInterface):
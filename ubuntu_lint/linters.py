@@ -1,13 +1,268 @@
 # Copyright 2026 Canonical Ltd.
 # SPDX-License-Identifier: GPL-3.0-only
 
-import distro_info
 import re
 import requests
 
-from debian import changelog, debian_support
-from functools import lru_cache
+from debian import changelog
+from lazr.restfulclient.errors import NotFound, Unauthorized
+from typing import Any
 from ubuntu_lint import Context, MissingContextException
+from ubuntu_lint import versions
+from ubuntu_lint.context import ubuntu_distro_info
+from ubuntu_lint.versions import Version, parse_version
+
+# The madison instance used to look up the versions of a package in each series.
+MADISON_URL = "https://people.canonical.com/~ubuntu-archive/madison.cgi"
+
+# Time, in seconds, after which an HTTP request is abandoned.
+HTTP_TIMEOUT = 30
+
+# The sections of the SRU bug template, which every SRU bug must have.
+SRU_TEMPLATE_SECTIONS = ("Impact", "Test Plan", "Where Problems Could Occur")
+SRU_TEMPLATE_URL = (
+    "https://documentation.ubuntu.com/project/SRU/"
+    "reference/bug-template/#reference-sru-bug-template"
+)
+
+_sru_section_re = re.compile(
+    r"\[\s*({})\s*\]".format("|".join(s.lower() for s in SRU_TEMPLATE_SECTIONS)),
+    re.IGNORECASE,
+)
+
+
+# Remote lookups used by the linters. These go through Context.remote, so they
+# return plain data which can be recorded and replayed.
+
+
+def _http_get(context: Context, service: str, url: str) -> tuple[int, str]:
+    """
+    Return the status code and text of the response to a GET request. Empty
+    responses, e.g. from madison for an unknown package, and 404 responses are
+    negative, and server errors are failures of the service.
+    """
+
+    def fetch() -> list:
+        r = requests.get(url, timeout=HTTP_TIMEOUT)
+        return [r.status_code, r.text]
+
+    status_code, text = context.remote(
+        service,
+        "http-get",
+        [url],
+        fetch,
+        negative=lambda r: r[0] == 404 or not r[1],
+        failed=lambda r: r[0] >= 500,
+    )
+    return status_code, text
+
+
+def _lp_bug_description(context: Context, n: str) -> str | None:
+    """Return the description of a bug, or None if it is not accessible."""
+
+    def fetch() -> str | None:
+        try:
+            return context.lp.bugs[n].description
+        except KeyError:
+            return None
+
+    return context.remote(
+        "launchpad", "lp-bug-description", [n], fetch, negative=lambda d: d is None
+    )
+
+
+def _lp_exists(context: Context, url: str) -> bool:
+    """
+    Return True if the Launchpad object at url exists and is accessible. Only
+    the headers of the response are requested, rather than the whole entry.
+    This must only be called when fetching remote data.
+    """
+    try:
+        context.lp._browser._request(url, method="HEAD")
+    except (NotFound, Unauthorized):
+        return False
+
+    return True
+
+
+def _lp_bug_exists(context: Context, n: str) -> bool:
+    """Return True if bug n exists and is public."""
+
+    def fetch() -> bool:
+        return _lp_exists(context, str(context.lp._root_uri.append(f"bugs/{n}")))
+
+    return context.remote(
+        "launchpad", "lp-bug-exists", [n], fetch, negative=lambda exists: not exists
+    )
+
+
+def _lp_has_bug_task(context: Context, n: str, package: str, dist: str) -> bool:
+    """
+    Return True if bug n has a task for package in dist. Only the link to that
+    task is looked up, rather than all the tasks of the bug.
+    """
+
+    def fetch() -> bool:
+        series_url = _lp_series_url(context, dist)
+        return _lp_exists(context, f"{series_url}/+source/{package}/+bug/{n}")
+
+    return context.remote(
+        "launchpad",
+        "lp-has-bug-task",
+        [n, package, dist],
+        fetch,
+        negative=lambda has_task: not has_task,
+    )
+
+
+def _lp_series_url(context: Context, dist: str) -> str:
+    """
+    Return the link to a series of Ubuntu, which can be passed in place of the
+    series object to API calls.
+    """
+
+    def fetch() -> str:
+        lp_ubuntu = context.lp.distributions["ubuntu"]
+        return str(lp_ubuntu.getSeries(name_or_version=dist))
+
+    return context.launchpad_links.get(
+        f"series:{dist}",
+        lambda: context.remote("launchpad", "lp-series-url", [dist], fetch),
+    )
+
+
+def _lp_main_archive(context: Context) -> Any:
+    """
+    Return the main archive of Ubuntu, loading it from its link if known.
+    This must only be called when fetching remote data.
+    """
+
+    def load() -> Any:
+        if (link := context.launchpad_links.lookup("archive:ubuntu")) is not None:
+            return context.lp.load(link)
+
+        archive = context.lp.distributions["ubuntu"].main_archive
+        context.launchpad_links.add("archive:ubuntu", str(archive))
+
+        return archive
+
+    return context.cached("lp-main-archive", load)
+
+
+def _lp_proposed_sources(context: Context, package: str, dist: str) -> list[list[str]]:
+    """
+    Return the [version, status] of the publications of package in dist which
+    are still in -proposed, newest first. If the context has proposed indexes,
+    this is looked up in the index of dist.
+    """
+    if context.proposed_indexes is not None:
+        index = context.proposed_indexes.get(
+            dist, lambda since: _lp_proposed_publications(context, dist, since)
+        )
+        return index.lookup(package)
+
+    def fetch() -> list[list[str]]:
+        published = _lp_main_archive(context).getPublishedSources(
+            source_name=package,
+            distro_series=_lp_series_url(context, dist),
+            exact_match=True,
+        )
+
+        proposed = []
+        for v in published:
+            # The published versions are sorted newest to oldest. Once we encounter
+            # something that is not in -proposed, it was published somewhere that is
+            # not "pending", so stop looking.
+            if v.pocket != "Proposed":
+                break
+
+            proposed.append([v.source_package_version, v.status])
+
+        return proposed
+
+    return context.remote("launchpad", "lp-proposed-sources", [package, dist], fetch)
+
+
+def _lp_proposed_publications(
+    context: Context, dist: str, since: str | None
+) -> list[list[str]]:
+    """
+    Return the [package, version, pocket, status, date created] of the
+    publications in dist which are still in -proposed, i.e. pending or
+    published there, or superseded there by a later upload which is, or if
+    since is given, of all publications created since then.
+    """
+
+    def fetch() -> list[list[str]]:
+        series = _lp_series_url(context, dist)
+        archive = _lp_main_archive(context)
+
+        if since is not None:
+            batches = [
+                archive.getPublishedSources(
+                    distro_series=series, created_since_date=since
+                )
+            ]
+        else:
+            batches = [
+                list(
+                    archive.getPublishedSources(
+                        distro_series=series, pocket="Proposed", status=status
+                    )
+                )
+                for status in ("Pending", "Published")
+            ]
+
+            # Superseded publications are only still in -proposed if they were
+            # superseded after the oldest upload of their package which is, as
+            # when looking up one package, in which case they become the oldest
+            # one. Others were superseded before an earlier migration.
+            oldest: dict[str, Any] = {}
+            for p in batches[0] + batches[1]:
+                if (
+                    p.source_package_name not in oldest
+                    or p.date_created < oldest[p.source_package_name]
+                ):
+                    oldest[p.source_package_name] = p.date_created
+
+            superseded = []
+            for p in sorted(
+                archive.getPublishedSources(
+                    distro_series=series, pocket="Proposed", status="Superseded"
+                ),
+                key=lambda p: p.date_created,
+                reverse=True,
+            ):
+                if p.source_package_name not in oldest:
+                    continue
+
+                if (
+                    p.date_superseded is None
+                    or p.date_superseded < oldest[p.source_package_name]
+                ):
+                    del oldest[p.source_package_name]
+                    continue
+
+                superseded.append(p)
+                oldest[p.source_package_name] = p.date_created
+
+            batches.append(superseded)
+
+        return [
+            [
+                p.source_package_name,
+                p.source_package_version,
+                p.pocket,
+                p.status,
+                str(p.date_created),
+            ]
+            for published in batches
+            for p in published
+        ]
+
+    return context.remote(
+        "launchpad", "lp-proposed-publications", [dist, since or ""], fetch
+    )
 
 
 def check_missing_ubuntu_maintainer(context: Context):
@@ -50,7 +305,7 @@ def check_distribution_invalid(context: Context):
     Check that the debian/changelog entry uses a valid Ubuntu release name.
     """
     dist = context.get_series()
-    if not distro_info.UbuntuDistroInfo().valid(dist):
+    if not ubuntu_distro_info().valid(dist):
         context.lint_fail(f'"{dist}" is not a valid Ubuntu codename')
 
 
@@ -88,18 +343,18 @@ def check_git_ubuntu_references_mismatch(context: Context):
         context.lint_skip("changes file does not have Vcs-Git-Ref")
 
     url = f"{vcs_git}/patch/?h={vcs_git_ref}"
-    r = requests.get(url)
-    if not r.ok:
-        if r.status_code == 404:
+    status_code, text = _http_get(context, "git-web", url)
+    if status_code >= 400:
+        if status_code == 404:
             context.lint_error(f"{url} does not exist")
 
-        elif r.status_code == 503:
+        elif status_code == 503:
             context.lint_skip("Launchpad git web is unavailable")
 
         else:
-            context.lint_warn(f"failed to check {url} (status_code={r.status_code})")
+            context.lint_warn(f"failed to check {url} (status_code={status_code})")
 
-    if not r.text.startswith(f"From {vcs_git_commit} "):
+    if not text.startswith(f"From {vcs_git_commit} "):
         context.lint_fail("Vcs-Git fields in changes file do not match the remote")
 
 
@@ -125,29 +380,18 @@ def check_missing_pending_changelog_entry(context: Context):
     changes_versions = set([str(v) for v in ch.get_versions()])
 
     # Check Launchpad for pending package versions in -proposed.
-    lp_ubuntu = context.lp.distributions["ubuntu"]
-    series = lp_ubuntu.getSeries(name_or_version=dist)
-    published = lp_ubuntu.main_archive.getPublishedSources(
-        source_name=package, distro_series=series, exact_match=True
-    )
-
     pending_versions = set()
-    for v in published:
-        # The published versions are sorted newest to oldest. Once we encounter
-        # something that is not in -proposed, it was published somewhere that is not
-        # "pending", so stop looking.
-        if v.pocket != "Proposed":
-            break
-
-        if v.status == "Deleted":
+    for version, status in _lp_proposed_sources(context, package, dist):
+        if status == "Deleted":
             continue
 
-        # Conventionally, we would not expect someone to include the Debian changelog
-        # entry, e.g. for an ubuntu1 upload fixing a sync that is stuck in -proposed.
-        if "ubuntu" not in v.source_package_version:
+        # Conventionally, we would not expect someone to include the Debian
+        # changelog entry, e.g. for an ubuntu1 upload fixing a sync that is stuck
+        # in -proposed.
+        if "ubuntu" not in version:
             continue
 
-        pending_versions.add(v.source_package_version)
+        pending_versions.add(version)
 
     if not pending_versions:
         # There is not anything in -proposed, nothing more to do.
@@ -182,26 +426,42 @@ def check_sru_bug_missing_template(context: Context):
     if not bugs:
         context.lint_fail("no bug references found, cannot check for SRU template")
 
-    for n in bugs:
-        try:
-            bug = context.lp.bugs[n]
-            desc = bug.description
-        except KeyError:
-            context.lint_fail(f"bug {n} does not exist or is not public")
-
-        for section in ("impact", "test plan", "where problems could occur"):
-            if not re.search(rf"\[\s*{section}\s*\]", desc.lower()):
-                context.lint_fail(
-                    f"bug {n} description is missing the [{section.title()}] section"
-                    ", see: https://documentation.ubuntu.com/project/SRU/"
-                    "reference/bug-template/#reference-sru-bug-template"
+    with context.findings() as findings:
+        for n in bugs:
+            if (desc := _lp_bug_description(context, n)) is None:
+                findings.fail(f"bug {n} does not exist or is not public")
+                continue
+
+            if missing := _sru_template_missing_sections(desc):
+                findings.fail(
+                    "bug {} description is missing the {} section{}, see: {}".format(
+                        n,
+                        ", ".join(f"[{section}]" for section in missing),
+                        "s" if len(missing) > 1 else "",
+                        SRU_TEMPLATE_URL,
+                    )
                 )
 
 
+def _sru_template_missing_sections(desc: str) -> list[str]:
+    """
+    Return the sections of the SRU template missing from a bug description,
+    found in a single pass over the description.
+    """
+    found = set()
+    for m in _sru_section_re.finditer(desc):
+        found.add(m.group(1).lower())
+        if len(found) == len(SRU_TEMPLATE_SECTIONS):
+            break
+
+    return [s for s in SRU_TEMPLATE_SECTIONS if s.lower() not in found]
+
+
 def check_sru_bug_missing_release_tasks(context: Context):
     """
     For uploads to stable releases, checks if the referenced bugs are
-    missing a task for the appropriate release, and warns if not.
+    missing a task for the package in the appropriate release, and warns if
+    not.
     """
     if not context.is_stable_release():
         context.lint_skip("this check applies to SRUs only")
@@ -215,29 +475,26 @@ def check_sru_bug_missing_release_tasks(context: Context):
         context.lint_fail("no bug references found, cannot check for SRU template")
 
     dist = context.get_series()
-    lp_ubuntu = context.lp.distributions["ubuntu"]
-    series = lp_ubuntu.getSeries(name_or_version=dist)
-    series_url = str(series)
+    package = context.get_source_package_name()
 
     warn = []
-    for n in bugs:
-        try:
-            bug = context.lp.bugs[n]
-        except KeyError:
-            context.lint_fail(f"bug {n} does not exist or is not public")
-
-        for task in bug.bug_tasks:
-            if str(task).startswith(series_url):
-                break
-        else:
-            warn.append(f"LP: #{n}")
-
-    if warn:
-        context.lint_fail(
-            "{} {} missing a bug task for {}".format(
-                ", ".join(warn), "is" if len(warn) == 1 else "are", dist
+    with context.findings() as findings:
+        for n in bugs:
+            if _lp_has_bug_task(context, n, package, dist):
+                continue
+
+            # Tell bugs which do not exist or are private apart.
+            if not _lp_bug_exists(context, n):
+                findings.fail(f"bug {n} does not exist or is not public")
+            else:
+                warn.append(f"LP: #{n}")
+
+        if warn:
+            findings.fail(
+                "{} {} missing a bug task for {}".format(
+                    ", ".join(warn), "is" if len(warn) == 1 else "are", dist
+                )
             )
-        )
 
 
 def check_release_mismatch(context: Context):
@@ -255,35 +512,50 @@ def check_release_mismatch(context: Context):
         return
 
     target_series = context.get_series()
-    target_version = distro_info.UbuntuDistroInfo().version(target_series).split()[0]
+    target_version = ubuntu_distro_info().version(target_series).split()[0]
 
-    for ubuntu_version in ubuntu_versions:
-        if ubuntu_version != target_version:
-            context.lint_warn(
-                f"ubuntu version {version} contains {ubuntu_version} which does not match target ({target_series} {target_version})"
-            )
+    with context.findings() as findings:
+        for ubuntu_version in ubuntu_versions:
+            if ubuntu_version != target_version:
+                findings.warn(
+                    f"ubuntu version {version} contains {ubuntu_version} which does not match target ({target_series} {target_version})"
+                )
 
 
-@lru_cache(maxsize=128)
 def _rmadison_get_max_version_by_series(context: Context) -> dict[str, str]:
     """
     Construct a map of series -> highest version (excluding -backports). This can then
     be used to compare the target version against all newer releases, to ensure it
-    sorts before them.
+    sorts before them. The versions are read from the context's madison table if
+    it has the package, and fetched from madison otherwise.
     """
     package = context.get_source_package_name()
 
-    url = f"https://people.canonical.com/~ubuntu-archive/madison.cgi?package={package}&a=source&text=on"
+    def fetch() -> dict[str, str]:
+        if context.madison_table is not None:
+            max_version_by_series = context.madison_table.max_version_by_series(package)
+            if max_version_by_series is not None:
+                return max_version_by_series
 
-    r = requests.get(url)
-    if not r.ok:
-        if r.status_code == 404:
+        return _rmadison_fetch_max_version_by_series(context, package)
+
+    return context.cached(f"madison:{package}", fetch)
+
+
+def _rmadison_fetch_max_version_by_series(
+    context: Context, package: str
+) -> dict[str, str]:
+    url = f"{MADISON_URL}?package={package}&a=source&text=on"
+
+    status_code, text = _http_get(context, "madison", url)
+    if status_code >= 400:
+        if status_code == 404:
             context.lint_error(f"{url} does not exist")
         else:
-            context.lint_error(f"failed to check {url} (status_code={r.status_code})")
+            context.lint_error(f"failed to check {url} (status_code={status_code})")
 
-    max_version_by_series: dict[str, str] = {}
-    for line in r.text.splitlines():
+    published: list[tuple[str, str]] = []
+    for line in text.splitlines():
         # An rmadison line is formatted like:
         # <source_package> | <version> | <suite> | source
         values = [c.strip() for c in line.split("|")]
@@ -299,16 +571,9 @@ def _rmadison_get_max_version_by_series(context: Context) -> dict[str, str]:
             # Exclude -backports, as different rules apply.
             continue
 
-        try:
-            if (
-                debian_support.version_compare(version, max_version_by_series[series])
-                > 0
-            ):
-                max_version_by_series[series] = version
-        except KeyError:
-            max_version_by_series[series] = version
+        published.append((series, version))
 
-    return max_version_by_series
+    return versions.max_version_by_series(published)
 
 
 def check_sru_version_string_breaks_upgrades(context: Context):
@@ -330,21 +595,21 @@ def check_sru_version_string_breaks_upgrades(context: Context):
 
     try:
         compare_series = [
-            d
-            for d in distro_info.UbuntuDistroInfo().get_all()
-            if d in max_version_by_series
+            d for d in ubuntu_distro_info().get_all() if d in max_version_by_series
         ]
         index = compare_series.index(target_series)
     except ValueError:
         context.lint_error(f"{target_series} is not known by distro-info")
 
-    for s in compare_series[index + 1 :]:
-        v = max_version_by_series[s]
-        if debian_support.version_compare(target_version, v) > 0:
-            context.lint_fail(
-                f"{target_version} for {target_series} is greater than {v} for {s}, "
-                "which breaks the upgrade path"
-            )
+    target_key = versions.version_key(str(target_version))
+    with context.findings() as findings:
+        for s in compare_series[index + 1 :]:
+            v = max_version_by_series[s]
+            if versions.version_key(v) < target_key:
+                findings.fail(
+                    f"{target_version} for {target_series} is greater than {v} for {s}, "
+                    "which breaks the upgrade path"
+                )
 
 
 def check_sru_version_string_convention(context: Context):
@@ -357,27 +622,27 @@ def check_sru_version_string_convention(context: Context):
         context.lint_skip("this check applies to SRUs only")
 
     next_version = context.get_package_version()
-    prev_version = context.changelog_entry_by_index(1).version
+    prev_version = parse_version(str(context.changelog_entry_by_index(1).version))
 
-    match = re.search(r"-[0-9]*", prev_version.full_version)
-    if match:
-        upstream_version, debian_revison, ubuntu_revision = str(prev_version).partition(
-            match.group()
-        )
-    else:
+    if prev_version.debian_revision is None:
         context.lint_skip(
             "check not implemented for native packages, "
             f"please check {docs} to ensure version string is correct"
         )
+    assert prev_version.debian_revision is not None
+
+    # Split e.g. 2.0-1ubuntu1.1 into 2.0, -1 and ubuntu1.1.
+    revision = prev_version.debian_revision
+    ubuntu_revision = revision.lstrip("0123456789")
+    debian_revison = "-" + revision[: len(revision) - len(ubuntu_revision)]
+    upstream_version = prev_version.full_version[: -len(revision) - 1]
 
-    series_version = distro_info.UbuntuDistroInfo().version(context.get_series())
+    series_version = ubuntu_distro_info().version(context.get_series())
     # Strip off " LTS" if needed.
     series_version = series_version.partition(" ")[0]
 
     if (
-        debian_support.version_compare(
-            next_version.upstream_version, prev_version.upstream_version
-        )
+        versions.compare(next_version.upstream_version, prev_version.upstream_version)
         > 0
     ):
         # Handle new upstream version separately from the rest. This check could be
@@ -392,7 +657,7 @@ def check_sru_version_string_convention(context: Context):
     # If the previous version is published across multiple series, then we expect e.g.
     # ubuntu24.04.x suffixes.
     max_version_by_series = _rmadison_get_max_version_by_series(context)
-    series_with_version = list(max_version_by_series.values()).count(prev_version)
+    series_with_version = sum(prev_version == v for v in max_version_by_series.values())
 
     suffix_extra: str = ""
     if series_with_version > 1:
@@ -435,7 +700,7 @@ def check_missing_version_suffix(context: Context):
     """
     docs = "https://documentation.ubuntu.com/project/how-ubuntu-is-made/concepts/version-strings"
 
-    if not distro_info.UbuntuDistroInfo().valid(context.get_series()):
+    if not ubuntu_distro_info().valid(context.get_series()):
         context.lint_skip("upload is not targeting an Ubuntu series")
 
     version = context.get_package_version()
@@ -475,8 +740,8 @@ def check_merge_missing_new_debian_changelog(context: Context):
     # are included in the changes file. This could also be done using
     # rmadison data, but generally the worst case here (parsing the entire
     # changelog to find no Ubuntu delta) is still faster than rmadison.
-    di = distro_info.UbuntuDistroInfo()
-    old_version: debian_support.Version | None = None
+    di = ubuntu_distro_info()
+    old_version: Version | None = None
     index = 1
     expect: set[str] = {str(new_version)}
     while True:
@@ -484,7 +749,7 @@ def check_merge_missing_new_debian_changelog(context: Context):
             entry = context.changelog_entry_by_index(index)
 
             if di.valid(str(entry.distributions).partition("-")[0]):
-                old_version = entry.version
+                old_version = parse_version(str(entry.version))
                 break
 
             expect.add(str(entry.version))
@@ -505,7 +770,7 @@ def check_merge_missing_new_debian_changelog(context: Context):
 
     old_debian = str(old_version).partition("ubuntu")[0]
     new_debian = str(new_version).partition("ubuntu")[0]
-    if debian_support.version_compare(old_debian, new_debian) >= 0:
+    if versions.compare(old_debian, new_debian) >= 0:
         context.lint_skip("upload does not look like a merge")
 
     # Mangle the Changes field so that we can parse it like a changelog.
@@ -0,0 +1,225 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import mmap
+import os
+import struct
+import tempfile
+
+from ubuntu_lint.versions import version_key
+
+_MAGIC = b"ULMT"
+_FORMAT_VERSION = 1
+
+# magic, format version, number of series, versions, packages and entries.
+_header = struct.Struct("<4sIIIII")
+_u32 = struct.Struct("<I")
+# series index, version rank
+_entry = struct.Struct("<II")
+
+
+class MadisonTable:
+    """
+    A read-only table of the highest version of each source package in each
+    series, i.e. what the linters otherwise get from madison, for the whole
+    archive.
+
+    The table is a compact binary file, which is memory-mapped rather than
+    loaded, so that any number of processes can share one copy of it in the
+    page cache. Packages are found by binary search. The distinct versions in
+    the table are stored in sorted order, and entries refer to them by their
+    index, or rank, so that comparing versions from the table only compares
+    integers.
+
+    The file consists of a header, arrays of 32-bit offsets (series names,
+    versions, package names, and the first entry of each package), the
+    entries, and a blob with the strings.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, fmt, *counts = _header.unpack_from(self._mm, 0)
+        except struct.error:
+            magic, fmt = b"", 0
+
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a supported madison table")
+
+        self._num_series, self._num_versions, self._num_packages, _ = counts
+
+        pos = _header.size
+        self._series_offsets = pos
+        pos += (self._num_series + 1) * _u32.size
+        self._version_offsets = pos
+        pos += (self._num_versions + 1) * _u32.size
+        self._package_offsets = pos
+        pos += (self._num_packages + 1) * _u32.size
+        self._entry_offsets = pos
+        pos += (self._num_packages + 1) * _u32.size
+        self._entries = pos
+        pos += counts[3] * _entry.size
+        self._strings = pos
+
+        # A truncated table, e.g. one still being written by other means than
+        # MadisonTable.write, would only fail when looked up otherwise.
+        if (
+            len(self._mm) < self._strings
+            or self._offset(self._entry_offsets, self._num_packages) != counts[3]
+            or len(self._mm)
+            != self._strings + self._offset(self._package_offsets, self._num_packages)
+        ):
+            self._mm.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self._series = [
+            self._string(self._series_offsets, i) for i in range(self._num_series)
+        ]
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> "MadisonTable":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._num_packages
+
+    def __contains__(self, package: str) -> bool:
+        return self._find(package) is not None
+
+    def _offset(self, array: int, index: int) -> int:
+        return _u32.unpack_from(self._mm, array + index * _u32.size)[0]
+
+    def _bytes(self, array: int, index: int) -> bytes:
+        start = self._strings + self._offset(array, index)
+        end = self._strings + self._offset(array, index + 1)
+        return self._mm[start:end]
+
+    def _string(self, array: int, index: int) -> str:
+        return self._bytes(array, index).decode()
+
+    def _find(self, package: str) -> int | None:
+        name = package.encode()
+        lo, hi = 0, self._num_packages
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(self._package_offsets, mid) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < self._num_packages and self._bytes(self._package_offsets, lo) == name:
+            return lo
+
+        return None
+
+    def version(self, rank: int) -> str:
+        """Return the version with the given rank."""
+        return self._string(self._version_offsets, rank)
+
+    def ranks(self, package: str) -> dict[str, int] | None:
+        """
+        Return the rank of the highest version of package in each series, or
+        None if package is not in the table. Versions with a higher rank sort
+        after those with a lower rank.
+        """
+        if (index := self._find(package)) is None:
+            return None
+
+        ret: dict[str, int] = {}
+        start = self._offset(self._entry_offsets, index)
+        end = self._offset(self._entry_offsets, index + 1)
+        for i in range(start, end):
+            series, rank = _entry.unpack_from(self._mm, self._entries + i * _entry.size)
+            ret[self._series[series]] = rank
+
+        return ret
+
+    def max_version_by_series(self, package: str) -> dict[str, str] | None:
+        """
+        Return the highest version of package in each series, or None if
+        package is not in the table.
+        """
+        if (ranks := self.ranks(package)) is None:
+            return None
+
+        return {series: self.version(rank) for series, rank in ranks.items()}
+
+    @staticmethod
+    def write(path: str, table: dict[str, dict[str, str]]):
+        """
+        Write a table, given the highest version of each package in each
+        series, to path. If path already exists, it is replaced atomically.
+        """
+        series_names = sorted({s for by_series in table.values() for s in by_series})
+        series_index = {s: i for i, s in enumerate(series_names)}
+
+        all_versions = sorted(
+            {v for by_series in table.values() for v in by_series.values()},
+            key=version_key,
+        )
+        rank = {v: i for i, v in enumerate(all_versions)}
+
+        # Packages are sorted by their encoded names, as they are compared when
+        # searching the table.
+        packages = sorted(table, key=str.encode)
+
+        blob = bytearray()
+
+        def strings(values: list[str]) -> bytes:
+            offsets = bytearray()
+            for value in values:
+                offsets += _u32.pack(len(blob))
+                blob.extend(value.encode())
+            offsets += _u32.pack(len(blob))
+            return bytes(offsets)
+
+        series_offsets = strings(series_names)
+        version_offsets = strings(all_versions)
+        package_offsets = strings(packages)
+
+        entry_offsets = bytearray()
+        entries = bytearray()
+        num_entries = 0
+        for package in packages:
+            entry_offsets += _u32.pack(num_entries)
+            for series, version in sorted(table[package].items()):
+                entries += _entry.pack(series_index[series], rank[version])
+                num_entries += 1
+        entry_offsets += _u32.pack(num_entries)
+
+        header = _header.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            len(series_names),
+            len(all_versions),
+            len(packages),
+            num_entries,
+        )
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-madison-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for data in (
+                    header,
+                    series_offsets,
+                    version_offsets,
+                    package_offsets,
+                    entry_offsets,
+                    entries,
+                    blob,
+                ):
+                    f.write(data)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
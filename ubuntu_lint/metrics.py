@@ -0,0 +1,352 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import fcntl
+import os
+import re
+import tempfile
+import threading
+
+from ubuntu_lint.context import LintResult
+from ubuntu_lint.stats import LinterStats, Stats
+
+# Bucket upper bounds, in seconds, for the duration histograms.
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_sample_re = re.compile(r"^(?P<name>[a-z_]+)(?:\{(?P<labels>.*)\})? (?P<value>\S+)$")
+_label_re = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+class Histogram:
+    """
+    A cumulative histogram, as used by Prometheus: each bucket counts the
+    observations less than or equal to its bound.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = DURATION_BUCKETS):
+        self.bounds = bounds
+        self.buckets: list[int] = [0] * len(bounds)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.buckets[i] += 1
+
+        self.count += 1
+        self.sum += value
+
+    def add(self, other: "Histogram"):
+        """Add the observations of other, which has the same bounds."""
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.sum += other.sum
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class Metrics:
+    """
+    Counters and histograms describing lint runs, suitable for exporting in the
+    Prometheus text format (e.g. for the node-exporter textfile collector), or as
+    OpenMetrics.
+
+    The values are cumulative. A long running process can keep one instance and
+    observe every run, and one-shot runs can add theirs to the file they write
+    to, with update.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.runs: int = 0
+        self.linter_durations: dict[str, Histogram] = {}
+        self.linter_results: dict[tuple[str, str], int] = {}
+        self.requests: dict[str, int] = {}
+        self.request_durations: dict[str, Histogram] = {}
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    def observe_linter(self, stats: LinterStats, result: LintResult):
+        """Record the result and duration of a lint check."""
+        with self._lock:
+            self.linter_durations.setdefault(stats.name, Histogram()).observe(
+                stats.wall_time
+            )
+
+            key = (stats.name, result.name)
+            self.linter_results[key] = self.linter_results.get(key, 0) + 1
+
+    def observe_run(self, stats: Stats):
+        """
+        Record a completed run, including the remote requests and cache lookups
+        made through its Context.
+        """
+        with self._lock:
+            self.runs += 1
+
+            for service, latencies in stats.request_latencies.items():
+                self.requests[service] = self.requests.get(service, 0) + len(latencies)
+
+                histogram = self.request_durations.setdefault(service, Histogram())
+                for latency in latencies:
+                    histogram.observe(latency)
+
+            self.cache_hits += stats.cache_hits
+            self.cache_misses += stats.cache_misses
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        if lookups == 0:
+            return 0.0
+
+        return self.cache_hits / lookups
+
+    def render(self, openmetrics: bool = False) -> str:
+        """
+        Render the metrics in the Prometheus text format, or in the OpenMetrics
+        text format if openmetrics is True.
+        """
+        lines: list[str] = []
+
+        def family(name: str, kind: str, description: str):
+            # In OpenMetrics, the name of a counter family does not include
+            # the _total suffix of its samples.
+            if openmetrics and kind == "counter":
+                name = name.removesuffix("_total")
+
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def sample(name: str, labels: dict[str, str], value: float | int):
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        def histogram(name: str, label: str, histograms: dict[str, Histogram]):
+            for key, h in sorted(histograms.items()):
+                for bound, count in zip(h.bounds, h.buckets):
+                    sample(
+                        f"{name}_bucket",
+                        {label: key, "le": _format_bound(bound)},
+                        count,
+                    )
+                sample(f"{name}_bucket", {label: key, "le": "+Inf"}, h.count)
+                sample(f"{name}_count", {label: key}, h.count)
+                sample(f"{name}_sum", {label: key}, round(h.sum, 6))
+
+        with self._lock:
+            family("ubuntu_lint_runs_total", "counter", "Number of lint runs.")
+            sample("ubuntu_lint_runs_total", {}, self.runs)
+
+            family(
+                "ubuntu_lint_linter_duration_seconds",
+                "histogram",
+                "Wall time of each lint check.",
+            )
+            histogram(
+                "ubuntu_lint_linter_duration_seconds",
+                "linter",
+                self.linter_durations,
+            )
+
+            family(
+                "ubuntu_lint_linter_results_total",
+                "counter",
+                "Number of lint check results, by linter and result.",
+            )
+            for (name, result), count in sorted(self.linter_results.items()):
+                sample(
+                    "ubuntu_lint_linter_results_total",
+                    {"linter": name, "result": result},
+                    count,
+                )
+
+            family(
+                "ubuntu_lint_remote_requests_total",
+                "counter",
+                "Number of requests to remote services.",
+            )
+            for service, count in sorted(self.requests.items()):
+                sample("ubuntu_lint_remote_requests_total", {"service": service}, count)
+
+            family(
+                "ubuntu_lint_remote_request_duration_seconds",
+                "histogram",
+                "Latency of requests to remote services.",
+            )
+            histogram(
+                "ubuntu_lint_remote_request_duration_seconds",
+                "service",
+                self.request_durations,
+            )
+
+            family(
+                "ubuntu_lint_cache_lookups_total",
+                "counter",
+                "Number of cache lookups, by outcome.",
+            )
+            sample(
+                "ubuntu_lint_cache_lookups_total", {"outcome": "hit"}, self.cache_hits
+            )
+            sample(
+                "ubuntu_lint_cache_lookups_total",
+                {"outcome": "miss"},
+                self.cache_misses,
+            )
+
+            family(
+                "ubuntu_lint_cache_hit_ratio",
+                "gauge",
+                "Ratio of cache lookups that were hits.",
+            )
+            sample("ubuntu_lint_cache_hit_ratio", {}, round(self.cache_hit_ratio, 6))
+
+        if openmetrics:
+            lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, openmetrics: bool = False):
+        """
+        Write the metrics to path. The file is replaced atomically, so that a
+        collector never reads a partially written file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-metrics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render(openmetrics=openmetrics))
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def add(self, other: "Metrics"):
+        """Add the values of other to these metrics."""
+        with self._lock:
+            self.runs += other.runs
+
+            for key, count in other.linter_results.items():
+                self.linter_results[key] = self.linter_results.get(key, 0) + count
+
+            for service, count in other.requests.items():
+                self.requests[service] = self.requests.get(service, 0) + count
+
+            for mine, theirs in (
+                (self.linter_durations, other.linter_durations),
+                (self.request_durations, other.request_durations),
+            ):
+                for name, histogram in theirs.items():
+                    mine.setdefault(name, Histogram()).add(histogram)
+
+            self.cache_hits += other.cache_hits
+            self.cache_misses += other.cache_misses
+
+    def update(self, path: str, openmetrics: bool = False):
+        """
+        Add these metrics to those previously written to path, if any, and
+        write the result to path. Runs updating the same path concurrently take
+        turns, holding a lock on a file next to it, so that no run is lost.
+        """
+        with open(f"{path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            metrics = Metrics.load(path)
+            metrics.add(self)
+            metrics.write(path, openmetrics=openmetrics)
+
+    @classmethod
+    def load(cls, path: str) -> "Metrics":
+        """
+        Load metrics previously written by Metrics.write, so that the counters
+        keep increasing across runs. If path does not exist, the returned
+        metrics are empty.
+        """
+        metrics = cls()
+
+        try:
+            with open(path, "r") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return metrics
+
+        for line in text.splitlines():
+            if not (m := _sample_re.match(line)):
+                continue
+
+            name = m.group("name")
+            labels = dict(_label_re.findall(m.group("labels") or ""))
+            value = float(m.group("value"))
+
+            match name:
+                case "ubuntu_lint_runs_total":
+                    metrics.runs = int(value)
+                case "ubuntu_lint_linter_results_total":
+                    key = (labels["linter"], labels["result"])
+                    metrics.linter_results[key] = int(value)
+                case "ubuntu_lint_remote_requests_total":
+                    metrics.requests[labels["service"]] = int(value)
+                case "ubuntu_lint_cache_lookups_total":
+                    if labels.get("outcome") == "hit":
+                        metrics.cache_hits = int(value)
+                    elif labels.get("outcome") == "miss":
+                        metrics.cache_misses = int(value)
+                case _:
+                    metrics._load_histogram_sample(name, labels, value)
+
+        return metrics
+
+    def _load_histogram_sample(self, name: str, labels: dict[str, str], value: float):
+        if name.startswith("ubuntu_lint_linter_duration_seconds_"):
+            histograms, key = self.linter_durations, labels.get("linter")
+        elif name.startswith("ubuntu_lint_remote_request_duration_seconds_"):
+            histograms, key = self.request_durations, labels.get("service")
+        else:
+            return
+
+        if key is None:
+            return
+
+        h = histograms.setdefault(key, Histogram())
+
+        if name.endswith("_count"):
+            h.count = int(value)
+        elif name.endswith("_sum"):
+            h.sum = value
+        elif name.endswith("_bucket") and labels.get("le") != "+Inf":
+            try:
+                i = h.bounds.index(float(labels["le"]))
+            except (KeyError, ValueError):
+                # Buckets with bounds we do not know about are dropped.
+                return
+
+            h.buckets[i] = int(value)
@@ -0,0 +1,83 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+
+from typing import Iterator, TextIO
+
+# Environment variable used to enable profiling in the dput-ng hooks, which do
+# not have a command line of their own.
+PROFILE_DIR_ENV = "UBUNTU_LINT_PROFILE_DIR"
+
+
+class Profiler:
+    """
+    Profile sections of a run with cProfile, writing one pstats file per
+    section to a directory.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.dumps: list[tuple[str, str]] = []
+
+    @classmethod
+    def from_env(cls) -> "Profiler | None":
+        """
+        Return a Profiler writing to the directory named by the
+        UBUNTU_LINT_PROFILE_DIR environment variable, if it is set.
+        """
+        directory = os.getenv(PROFILE_DIR_ENV)
+        if not directory:
+            return None
+
+        return cls(directory)
+
+    @contextlib.contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """Profile the with block, and write the result to <name>.pstats."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+            path = os.path.join(self.directory, f"{name}.pstats")
+            profiler.dump_stats(path)
+            self.dumps.append((name, path))
+
+    def summary(self, limit: int = 5) -> list[str]:
+        """
+        Return a summary of the written profiles, listing the functions
+        with the highest cumulative time in each.
+        """
+        lines = [f"Profile: wrote {len(self.dumps)} profiles to {self.directory}"]
+
+        for name, path in self.dumps:
+            out = io.StringIO()
+            stats = pstats.Stats(path, stream=out)
+            stats.strip_dirs().sort_stats("cumulative").print_stats(limit)
+
+            # Skip the header of the pstats report, and keep the number of calls
+            # and the table of functions.
+            report = [line for line in out.getvalue().splitlines() if line.strip()]
+            calls = next((r.strip() for r in report if "function calls" in r), "")
+            start = next(
+                (i for i, r in enumerate(report) if "ncalls" in r), len(report)
+            )
+            table = report[start:]
+
+            lines.append(f"    {name}: {calls}")
+            lines.extend(f"        {line}" for line in table)
+
+        return lines
+
+    def print_summary(self, limit: int = 5, file: TextIO = sys.stderr):
+        print("\n".join(self.summary(limit)), file=file)
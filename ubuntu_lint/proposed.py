@@ -0,0 +1,217 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+
+from typing import Callable
+
+# Version of the index file format, bumped on incompatible changes.
+FORMAT_VERSION = 1
+
+# Age, in seconds, after which an index on disk is rebuilt rather than
+# refreshed, to pick up changes to the status of publications already in it.
+REBUILD_AGE = 24 * 60 * 60
+
+# Time, in seconds, after which an index in use is refreshed again, e.g. by a
+# server linting uploads for days.
+REFRESH_AGE = 5 * 60
+
+# A publication: package, version, pocket, status and creation date (ISO 8601,
+# in UTC).
+Publication = list[str]
+
+# Returns publications in a series: if the argument is None, those still in
+# -proposed, otherwise all those created since that date.
+FetchPublications = Callable[[str | None], list[Publication]]
+
+
+class ProposedIndex:
+    """
+    The versions of each package in a series which have been uploaded to
+    -proposed and have not migrated yet, i.e. what the missing-pending-changelog-
+    entry check otherwise asks Launchpad for one package at a time.
+
+    The index is built from the publications still in -proposed, including
+    those superseded there by later uploads which have not migrated, and then
+    refreshed incrementally from the publications created since the last
+    refresh: a publication in -proposed is added to the pending versions of
+    its package, and a publication in any other pocket, e.g. after a
+    migration, clears them. Changes to the status of publications already in
+    the index, e.g. deletions, are only picked up by rebuilding it.
+    """
+
+    def __init__(self, series: str):
+        self.series = series
+        self.pending: dict[str, list[list[str]]] = {}
+        self.since: str | None = None
+        self.built: float = 0.0
+
+    def lookup(self, package: str) -> list[list[str]]:
+        """
+        Return the [version, status] of the publications of package which are
+        still in -proposed, newest first.
+        """
+        return self.pending.get(package, [])
+
+    def update(self, publications: list[Publication], since: str):
+        """Add publications, created up to since, to the index."""
+        for package, version, pocket, status, _ in sorted(
+            publications, key=lambda p: p[4]
+        ):
+            if pocket != "Proposed":
+                self.pending.pop(package, None)
+                continue
+
+            versions = [v for v in self.pending.get(package, []) if v[0] != version]
+            self.pending[package] = [[version, status], *versions]
+
+        self.since = since
+
+    def copy(self) -> "ProposedIndex":
+        """
+        Return a copy of the index, which can be refreshed while this one is
+        still looked up.
+        """
+        index = ProposedIndex(self.series)
+        index.pending = dict(self.pending)
+        index.since = self.since
+        index.built = self.built
+
+        return index
+
+    def refresh(self, fetch: FetchPublications):
+        """
+        Fetch the publications created since the last refresh, or build the
+        index if it is empty.
+        """
+        since = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+        if self.since is None:
+            self.built = time.time()
+
+        self.update(fetch(self.since), since)
+
+    def save(self, path: str):
+        """Save the index to path, replacing it atomically if it exists."""
+        data = {
+            "format": FORMAT_VERSION,
+            "series": self.series,
+            "since": self.since,
+            "built": self.built,
+            "pending": self.pending,
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-proposed-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "ProposedIndex":
+        """Load an index saved by ProposedIndex.save."""
+        with open(path, "r") as f:
+            content = json.load(f)
+
+        if content.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a supported ubuntu-lint proposed index")
+
+        index = cls(content["series"])
+        index.pending = content["pending"]
+        index.since = content["since"]
+        index.built = content["built"]
+
+        return index
+
+
+class ProposedIndexes:
+    """
+    The proposed indexes of each series, shared by any number of contexts. The
+    index of a series is loaded from cache_dir, refreshed and saved back the
+    first time it is needed, and then refreshed again whenever it is needed
+    more than refresh_age seconds later, or rebuilt once it is older than
+    rebuild_age.
+
+    Each series is refreshed on its own, so that a slow refresh does not hold
+    up lookups in other series. Lookups in a series being refreshed use its
+    previous index meanwhile, if there is one.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        rebuild_age: float = REBUILD_AGE,
+        refresh_age: float = REFRESH_AGE,
+    ):
+        self.cache_dir = cache_dir
+        self.rebuild_age = rebuild_age
+        self.refresh_age = refresh_age
+        self._indexes: dict[str, ProposedIndex] = {}
+        self._refreshed: dict[str, float] = {}
+        self._series_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def path(self, series: str) -> str:
+        return os.path.join(self.cache_dir, f"proposed-{series}.json")
+
+    def _current(self, series: str) -> ProposedIndex | None:
+        """Return the index of series if it does not need a refresh."""
+        with self._lock:
+            index = self._indexes.get(series)
+            if index is None:
+                return None
+
+            if time.monotonic() - self._refreshed[series] > self.refresh_age:
+                return None
+
+            return index
+
+    def get(self, series: str, fetch: FetchPublications) -> ProposedIndex:
+        if (index := self._current(series)) is not None:
+            return index
+
+        with self._lock:
+            previous = self._indexes.get(series)
+            lock = self._series_locks.setdefault(series, threading.Lock())
+
+        # Unless there is no index to use yet, do not wait for another thread
+        # refreshing it.
+        if not lock.acquire(blocking=previous is None):
+            assert previous is not None
+            return previous
+
+        try:
+            if (index := self._current(series)) is not None:
+                return index
+
+            if previous is not None:
+                index = previous.copy()
+            else:
+                try:
+                    index = ProposedIndex.load(self.path(series))
+                except (OSError, ValueError, KeyError):
+                    index = ProposedIndex(series)
+
+            if index.series != series or time.time() - index.built > self.rebuild_age:
+                index = ProposedIndex(series)
+
+            index.refresh(fetch)
+            index.save(self.path(series))
+
+            with self._lock:
+                self._indexes[series] = index
+                self._refreshed[series] = time.monotonic()
+
+            return index
+        finally:
+            lock.release()
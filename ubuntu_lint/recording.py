@@ -0,0 +1,109 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+
+from typing import Any
+
+# Version of the recording file format, bumped on incompatible changes.
+FORMAT_VERSION = 1
+
+
+class Recording:
+    """
+    Responses from remote services (Launchpad, madison, git web), keyed by the
+    operation that fetched them and its arguments.
+
+    When recording, every response fetched through Context.remote is stored,
+    along with its latency, so that it can be saved to a file. When replaying,
+    responses are served from a previously saved recording instead of the
+    remote services. By default, replayed responses are returned immediately,
+    but a fixed latency can be simulated, or the recorded latency of each
+    response if latency is None.
+
+    metadata holds free-form information about the recording, e.g. what it was
+    recorded for, which is saved along with the responses.
+    """
+
+    def __init__(self, replay: bool = False, latency: float | None = 0.0):
+        self.replay = replay
+        self.latency = latency
+        self.responses: dict[str, tuple[Any, float]] = {}
+        self.metadata: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(op: str, args: list[str]) -> str:
+        return json.dumps([op, *args], separators=(",", ":"))
+
+    def add(self, key: str, value: Any, latency: float):
+        with self._lock:
+            self.responses[key] = (value, latency)
+
+    def get(self, key: str) -> tuple[Any, float]:
+        """
+        Return the recorded response for key, and the latency to simulate when
+        replaying it. Raises KeyError if there is no such response.
+        """
+        value, latency = self.responses[key]
+        if self.latency is not None:
+            latency = self.latency
+
+        return value, latency
+
+    def save(self, path: str):
+        """
+        Save the recording to path, compressed with gzip if path ends with .gz.
+        If path already exists, it is replaced atomically.
+        """
+        data: dict[str, Any] = {
+            "format": FORMAT_VERSION,
+            "metadata": self.metadata,
+            "responses": [
+                [key, value, round(latency, 4)]
+                for key, (value, latency) in sorted(self.responses.items())
+            ],
+        }
+
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        if path.endswith(".gz"):
+            payload = gzip.compress(payload)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-recording-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str, latency: float | None = 0.0) -> "Recording":
+        """
+        Load a recording saved by Recording.save, to replay it with the given
+        latency.
+        """
+        with open(path, "rb") as f:
+            payload = f.read()
+
+        if path.endswith(".gz"):
+            payload = gzip.decompress(payload)
+
+        content = json.loads(payload)
+
+        if content.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a supported ubuntu-lint recording")
+
+        recording = cls(replay=True, latency=latency)
+        recording.metadata = content.get("metadata", {})
+        for key, value, recorded_latency in content["responses"]:
+            recording.responses[key] = (value, recorded_latency)
+
+        return recording
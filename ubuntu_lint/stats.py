@@ -0,0 +1,226 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import contextlib
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+
+from typing import Any, Iterator
+
+
+class LinterStats:
+    """
+    Timing, remote request and cache statistics collected while a single
+    linter runs.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_time: float = 0.0
+        self.network_time: float = 0.0
+        self.requests: dict[str, int] = {}
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    @property
+    def parse_time(self) -> float:
+        """Time spent running locally, i.e. not waiting on the network."""
+        return max(self.wall_time - self.network_time, 0.0)
+
+    @property
+    def num_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "wall_time": round(self.wall_time, 6),
+            "network_time": round(self.network_time, 6),
+            "parse_time": round(self.parse_time, 6),
+            "requests": dict(self.requests),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+# The statistics of the linter currently running, if any. Network requests and
+# cache lookups are attributed to it.
+_current_linter: contextvars.ContextVar[LinterStats | None] = contextvars.ContextVar(
+    "current_linter", default=None
+)
+
+# Whether a request is being accounted, in which case requests made to complete
+# it, e.g. logging in to Launchpad, are part of it rather than counted again.
+_in_network: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "in_network", default=False
+)
+
+
+class Stats:
+    """
+    Statistics for a Context: the time spent in each phase of its construction,
+    and totals for the remote requests and cache lookups made through it, and
+    for the requests which failed or were refused as their service was down.
+    The totals may be updated from several threads.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.network_time: float = 0.0
+        self.requests: dict[str, int] = {}
+        self.request_latencies: dict[str, list[float]] = {}
+        self.remote_failures: dict[str, int] = {}
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, elapsed: float):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Account the time spent in the with block to the given phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    @contextlib.contextmanager
+    def linter(self, name: str) -> Iterator[LinterStats]:
+        """
+        Collect statistics for the linter run in the with block. The yielded
+        LinterStats is complete once the block exits.
+        """
+        stats = LinterStats(name)
+        token = _current_linter.set(stats)
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.wall_time = time.perf_counter() - start
+            _current_linter.reset(token)
+
+    @contextlib.contextmanager
+    def network(self, service: str) -> Iterator[None]:
+        """
+        Account the with block as one request to the given remote service,
+        e.g. launchpad, madison or git-web. Blocks nested in it, in the same
+        thread, are accounted as part of it.
+        """
+        if _in_network.get():
+            yield
+            return
+
+        token = _in_network.set(True)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _in_network.reset(token)
+
+            with self._lock:
+                self.network_time += elapsed
+                self.requests[service] = self.requests.get(service, 0) + 1
+                self.request_latencies.setdefault(service, []).append(elapsed)
+
+            if (current := _current_linter.get()) is not None:
+                current.network_time += elapsed
+                current.requests[service] = current.requests.get(service, 0) + 1
+
+    def remote_failure(self, service: str):
+        with self._lock:
+            self.remote_failures[service] = self.remote_failures.get(service, 0) + 1
+
+    def cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+        if (current := _current_linter.get()) is not None:
+            current.cache_hits += 1
+
+    def cache_miss(self):
+        with self._lock:
+            self.cache_misses += 1
+        if (current := _current_linter.get()) is not None:
+            current.cache_misses += 1
+
+
+class LatencyHistory:
+    """
+    The typical wall time of each linter, learned from previous runs, and kept
+    in a file between them. Each new observation is blended into an
+    exponentially weighted moving average, so that the history follows changes
+    in latency, e.g. when a remote service gets slower, without being thrown
+    off by a single slow run.
+    """
+
+    # Version of the file format, bumped on incompatible changes.
+    FORMAT_VERSION = 1
+
+    # Weight of a new observation in the moving average.
+    WEIGHT = 0.25
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.latencies: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> float | None:
+        return self.latencies.get(name)
+
+    def observe(self, name: str, wall_time: float):
+        with self._lock:
+            if (latency := self.latencies.get(name)) is None:
+                self.latencies[name] = wall_time
+            else:
+                self.latencies[name] = latency + self.WEIGHT * (wall_time - latency)
+
+    def save(self, path: str | None = None):
+        """Save the history to path, or to the path it was loaded from."""
+        path = path or self.path
+        assert path is not None
+
+        data = {
+            "format": self.FORMAT_VERSION,
+            "latencies": {
+                name: round(latency, 6)
+                for name, latency in sorted(self.latencies.items())
+            },
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".ubuntu-lint-latencies-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "LatencyHistory":
+        """
+        Load a history saved by LatencyHistory.save. If path does not exist, or
+        is not a history, the returned history is empty, and is saved to path.
+        """
+        history = cls(path)
+        try:
+            with open(path, "r") as f:
+                content = json.load(f)
+
+            if content.get("format") == cls.FORMAT_VERSION:
+                history.latencies = {
+                    str(name): float(latency)
+                    for name, latency in content["latencies"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            pass
+
+        return history
@@ -0,0 +1,203 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import bz2
+import gzip
+import itertools
+import lzma
+import multiprocessing
+import os
+
+from typing import Callable, IO, Iterator
+from ubuntu_lint.context import (
+    Context,
+    LintException,
+    LintResult,
+    MissingContextException,
+    VersionContext,
+)
+from ubuntu_lint.versions import max_version_by_series
+
+# Number of packages handed to a worker process at a time.
+CHUNK_SIZE = 2000
+
+Linter = tuple[str, Callable[[Context], None]]
+
+# A non-OK lint result: package, version, linter, result and reason.
+Finding = tuple[str, str, str, str, str]
+
+
+def open_index(path: str) -> IO[str]:
+    """Open an archive index, decompressing it according to its file name."""
+    if path.endswith(".xz"):
+        return lzma.open(path, "rt", encoding="utf-8")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8")
+
+    return open(path, "r", encoding="utf-8")
+
+
+def read_sources(f: IO[str]) -> Iterator[tuple[str, str]]:
+    """
+    Yield the (package, version) of each stanza in a Sources index. Only the
+    Package and Version fields are parsed, so this is much faster than parsing
+    the stanzas with deb822.
+    """
+    package: str | None = None
+    version: str | None = None
+
+    for line in f:
+        if line[:1] in " \t":
+            # Continuation of a multi-line field, e.g. Files.
+            continue
+
+        if line.startswith("Package: "):
+            package = line[9:].strip()
+        elif line.startswith("Version: "):
+            version = line[9:].strip()
+        elif line == "\n":
+            if package and version:
+                yield package, version
+            package = version = None
+
+    if package and version:
+        yield package, version
+
+
+def suite_from_path(path: str) -> str | None:
+    """
+    Return the suite of an index from its path in an archive mirror, e.g.
+    resolute-proposed for dists/resolute-proposed/main/source/Sources.xz.
+    """
+    parts = os.path.normpath(os.path.abspath(path)).split(os.sep)
+    for i in range(len(parts) - 2, -1, -1):
+        if parts[i] == "dists":
+            return parts[i + 1]
+
+    return None
+
+
+def max_versions_from_sources(
+    indexes: list[tuple[str, str]],
+) -> dict[str, dict[str, str]]:
+    """
+    Return the highest version of each package in each series, from the given
+    (path, suite) Sources indexes, e.g. to write a MadisonTable. Like the
+    madison data used by the linters, this excludes -backports.
+    """
+    by_package: dict[str, list[tuple[str, str]]] = {}
+    for path, suite in indexes:
+        series, _, pocket = suite.partition("-")
+        if pocket == "backports":
+            continue
+
+        with open_index(path) as f:
+            for package, version in read_sources(f):
+                by_package.setdefault(package, []).append((series, version))
+
+    return {
+        package: max_version_by_series(published)
+        for package, published in by_package.items()
+    }
+
+
+class SweepReport:
+    """
+    The results of a sweep: the number of packages linted, the number of
+    results of each linter, and the non-OK results.
+    """
+
+    def __init__(self):
+        self.packages: int = 0
+        self.results: dict[str, dict[str, int]] = {}
+        self.findings: list[Finding] = []
+
+    def merge(self, other: "SweepReport"):
+        self.packages += other.packages
+
+        for linter, counts in other.results.items():
+            mine = self.results.setdefault(linter, {})
+            for result, count in counts.items():
+                mine[result] = mine.get(result, 0) + count
+
+        self.findings.extend(other.findings)
+
+    def count(self, linter: str, result: LintResult):
+        counts = self.results.setdefault(linter, {})
+        counts[result.name] = counts.get(result.name, 0) + 1
+
+
+def lint_packages(
+    distribution: str,
+    packages: list[tuple[str, str]],
+    linters: list[Linter],
+) -> SweepReport:
+    """Run the linters against each (package, version) in distribution."""
+    report = SweepReport()
+
+    for package, version in packages:
+        report.packages += 1
+
+        try:
+            context = VersionContext(package, version, distribution)
+        except ValueError as e:
+            report.findings.append(
+                (package, version, "", LintResult.ERROR.name, str(e))
+            )
+            continue
+
+        for name, fn in linters:
+            try:
+                fn(context)
+            except LintException as e:
+                report.count(name, e.result)
+                if e.result != LintResult.SKIP:
+                    report.findings.append(
+                        (package, version, name, e.result.name, e.reason)
+                    )
+            except MissingContextException:
+                report.count(name, LintResult.SKIP)
+            else:
+                report.count(name, LintResult.OK)
+
+    return report
+
+
+def _lint_chunk(args: tuple[str, list[tuple[str, str]], list[Linter]]) -> SweepReport:
+    return lint_packages(*args)
+
+
+def sweep(
+    indexes: list[tuple[str, str]],
+    linters: list[Linter],
+    jobs: int | None = None,
+) -> SweepReport:
+    """
+    Lint every package in the given (path, distribution) Sources indexes with
+    the given linters, which must only need the package name, version and
+    distribution. The indexes are streamed, and linted in chunks by jobs
+    worker processes (by default, one per CPU).
+    """
+
+    def chunks() -> Iterator[tuple[str, list[tuple[str, str]], list[Linter]]]:
+        for path, distribution in indexes:
+            with open_index(path) as f:
+                packages = read_sources(f)
+                while chunk := list(itertools.islice(packages, CHUNK_SIZE)):
+                    yield distribution, chunk, linters
+
+    report = SweepReport()
+
+    if jobs == 1:
+        for chunk_report in map(_lint_chunk, chunks()):
+            report.merge(chunk_report)
+    else:
+        with multiprocessing.Pool(jobs) as pool:
+            for chunk_report in pool.imap_unordered(_lint_chunk, chunks()):
+                report.merge(chunk_report)
+
+    report.findings.sort()
+
+    return report
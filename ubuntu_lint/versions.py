@@ -0,0 +1,245 @@
+# Copyright 2026 Canonical Ltd.
+# SPDX-License-Identifier: GPL-3.0-only
+
+import functools
+import re
+
+from typing import Any, Iterable
+
+# A sort key, as returned by version_key: the epoch, and a tuple for each of the
+# upstream version and Debian revision.
+VersionKey = tuple[int, tuple[Any, ...], tuple[Any, ...]]
+
+_segment_re = re.compile(r"([^0-9]*)([0-9]*)")
+
+# The last element of the key of every version part.
+_END = (0, 0, 0)
+
+
+class _Weights(dict):
+    """
+    Weights of the characters of non-digit segments, as in dpkg: "~" sorts
+    before everything, even the end of the segment, and letters sort before
+    other characters.
+    """
+
+    def __missing__(self, c: str) -> int:
+        if c == "~":
+            weight = -1
+        elif c.isalpha():
+            weight = ord(c)
+        else:
+            weight = ord(c) + 256
+
+        self[c] = weight
+        return weight
+
+
+_weights = _Weights()
+
+
+def _part_key(part: str) -> tuple[Any, ...]:
+    """
+    Return the key of an upstream version or Debian revision.
+
+    dpkg compares version parts as a sequence of values: the weight of each
+    character of a non-digit segment, 0 for the end of the segment, then the
+    number in the following digit segment. A part which is shorter than the
+    other compares as if it was padded with zeros, so e.g. 1.0 sorts after
+    1.0~rc1 but before 1.0a. Plain tuple comparison would sort 1.0 first in
+    both cases, so each non-zero value is stored with the number of zeros
+    preceding it, as (1, -zeros, value) for positive values and
+    (-1, zeros, value) for negative ones, which sort relative to each other and
+    to the final (0, 0, 0) like the padded sequences do.
+    """
+    key = []
+    zeros = 0
+    for nondigits, digits in _segment_re.findall(part):
+        for value in (*map(_weights.__getitem__, nondigits), 0, int(digits or 0)):
+            if value == 0:
+                zeros += 1
+            elif value > 0:
+                key.append((1, -zeros, value))
+                zeros = 0
+            else:
+                key.append((-1, zeros, value))
+                zeros = 0
+
+    key.append(_END)
+
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=65536)
+def version_key(version: str) -> VersionKey:
+    """
+    Return a sort key for the version string, such that comparing the keys of
+    two versions gives the same result as debian_support.version_compare.
+    Keys are cached, so that comparing, sorting or finding the maximum of
+    versions seen before only compares tuples.
+    """
+    epoch, sep, rest = version.partition(":")
+    if not sep or not epoch.isdigit():
+        epoch, rest = "0", version
+
+    # The revision follows the last hyphen, but as in debian_support, only
+    # if it is not empty and has no colon. A missing revision compares like 0.
+    upstream, _, revision = rest.rpartition("-")
+    if not (upstream and revision) or ":" in revision:
+        upstream, revision = rest, "0"
+
+    return (int(epoch), _part_key(upstream), _part_key(revision))
+
+
+def compare(a: Any, b: Any) -> int:
+    """
+    Compare two versions, given as strings or Version objects. Returns a
+    negative number, zero or a positive number if a sorts before, like or
+    after b, respectively.
+    """
+    key_a = version_key(str(a))
+    key_b = version_key(str(b))
+
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def max_version(versions: Iterable[str]) -> str:
+    """Return the highest of the version strings."""
+    return max(versions, key=version_key)
+
+
+def sort_versions(versions: Iterable[str], reverse: bool = False) -> list[str]:
+    """Return the version strings sorted from lowest to highest."""
+    return sorted(versions, key=version_key, reverse=reverse)
+
+
+def max_version_by_series(versions: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """
+    Return the highest version in each series, given (series, version) pairs.
+    """
+    best: dict[str, tuple[VersionKey, str]] = {}
+    for series, version in versions:
+        key = version_key(version)
+        if series not in best or key > best[series][0]:
+            best[series] = (key, version)
+
+    return {series: version for series, (_, version) in best.items()}
+
+
+def find_lower(version: Any, others: Iterable[str]) -> str | None:
+    """
+    Return the first of others which sorts before version, or None if version
+    sorts before or like all of them.
+    """
+    key = version_key(str(version))
+    for other in others:
+        if version_key(other) < key:
+            return other
+
+    return None
+
+
+def is_below_all(version: Any, others: Iterable[str]) -> bool:
+    """Return True if version sorts before or like all of others."""
+    return find_lower(version, others) is None
+
+
+# The syntax of a version, as accepted by debian_support.Version.
+_version_re = re.compile(
+    r"^(?:(?P<epoch>\d+):)?"
+    r"(?P<upstream_version>[A-Za-z0-9.+:~-]+?)"
+    r"(?:-(?P<debian_revision>[A-Za-z0-9+.~]+))?$"
+)
+
+
+class Version:
+    """
+    A parsed Debian version, with the same attributes as debian_support.Version.
+    Versions compare with each other, with version strings and with
+    debian_support.Version objects according to Debian policy.
+
+    Versions are immutable, and should be created with parse_version, which
+    returns the same instance for the same version string.
+    """
+
+    __slots__ = ("full_version", "epoch", "upstream_version", "debian_revision", "key")
+
+    full_version: str
+    epoch: str | None
+    upstream_version: str
+    debian_revision: str | None
+    key: VersionKey
+
+    def __init__(self, version: str):
+        m = _version_re.match(version)
+        if not m or (m.group("epoch") is None and ":" in m.group("upstream_version")):
+            raise ValueError(f"Invalid version string {version!r}")
+
+        setattr_ = object.__setattr__
+        setattr_(self, "full_version", version)
+        setattr_(self, "epoch", m.group("epoch"))
+        setattr_(self, "upstream_version", m.group("upstream_version"))
+        setattr_(self, "debian_revision", m.group("debian_revision"))
+        setattr_(self, "key", version_key(version))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def debian_version(self) -> str | None:
+        return self.debian_revision
+
+    def __str__(self) -> str:
+        return self.full_version
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.full_version}')"
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    @staticmethod
+    def _key_of(other: Any) -> VersionKey | None:
+        if isinstance(other, Version):
+            return other.key
+        if isinstance(other, str):
+            return version_key(other)
+        if hasattr(other, "full_version"):
+            return version_key(str(other))
+
+        return None
+
+    def __eq__(self, other: Any) -> bool:
+        if (key := self._key_of(other)) is None:
+            return NotImplemented
+        return self.key == key
+
+    def __lt__(self, other: Any) -> bool:
+        if (key := self._key_of(other)) is None:
+            return NotImplemented
+        return self.key < key
+
+    def __le__(self, other: Any) -> bool:
+        if (key := self._key_of(other)) is None:
+            return NotImplemented
+        return self.key <= key
+
+    def __gt__(self, other: Any) -> bool:
+        if (key := self._key_of(other)) is None:
+            return NotImplemented
+        return self.key > key
+
+    def __ge__(self, other: Any) -> bool:
+        if (key := self._key_of(other)) is None:
+            return NotImplemented
+        return self.key >= key
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_version(version: str) -> Version:
+    """
+    Return the parsed version. Parsed versions are interned: the same Version
+    is returned for the same version string, for as long as it stays among the
+    most recently parsed. Raises ValueError for invalid versions.
+    """
+    return Version(version)